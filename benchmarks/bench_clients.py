@@ -0,0 +1,200 @@
+"""
+Throughput / latency benchmark: the same CRUD workload through
+
+- sync      -> UsersApiClient, one user after another
+- threaded  -> UsersApiClient(thread_safe=True) on a thread pool
+- async     -> AsyncUsersApiClient with bounded concurrency
+
+Each user goes through create -> get -> patch -> delete. Every mode runs in a
+fresh child process so peak RSS is measured per mode. By default the target is
+the local stand-in server (no network). Retries are counted by the clients
+themselves (ClientMetrics operations: attempts - calls), so they are reported
+for remote targets and for workflows that abort early too. The clients run
+without a circuit breaker: with --error-rate it would open and turn server
+errors into instant rejections, skewing both latency and error figures.
+
+    python -m benchmarks.bench_clients --users 200 --concurrency 20 --latency-ms 10 --output bench.json
+    python -m benchmarks.bench_clients --target remote   # real BASE_URL
+"""
+import argparse
+import asyncio
+import json
+import resource
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.bulk import gather_bounded, map_threads
+from mockapi_client.client import UsersApiClient
+from mockapi_client.config import BASE_URL
+from mockapi_client.local_server import Fixed, LocalUsersServer, UsersBackend
+from mockapi_client.metrics import ClientMetrics
+
+from .common import latency_summary
+
+MODES = ("sync", "threaded", "async")
+OPERATIONS = ("create", "get", "patch", "delete")
+
+
+def _payload(index: int) -> dict:
+    return {"name": f"bench_{index}", "email": f"bench_{index}@example.com"}
+
+
+def _timed(latencies: Dict[str, List[float]], op: str, started: float) -> None:
+    latencies[op].append(time.perf_counter() - started)
+
+
+def _sync_workflow(api: UsersApiClient, latencies, index: int) -> None:
+    started = time.perf_counter()
+    user = api.create_user(_payload(index))
+    _timed(latencies, "create", started)
+
+    started = time.perf_counter()
+    api.get_user(user["id"])
+    _timed(latencies, "get", started)
+
+    started = time.perf_counter()
+    api.patch_user(user["id"], {"name": f"bench_renamed_{index}"})
+    _timed(latencies, "patch", started)
+
+    started = time.perf_counter()
+    api.delete_user(user["id"])
+    _timed(latencies, "delete", started)
+
+
+async def _async_workflow(api: AsyncUsersApiClient, latencies, index: int) -> None:
+    started = time.perf_counter()
+    user = await api.create_user(_payload(index))
+    _timed(latencies, "create", started)
+
+    started = time.perf_counter()
+    await api.get_user(user["id"])
+    _timed(latencies, "get", started)
+
+    started = time.perf_counter()
+    await api.patch_user(user["id"], {"name": f"bench_renamed_{index}"})
+    _timed(latencies, "patch", started)
+
+    started = time.perf_counter()
+    await api.delete_user(user["id"])
+    _timed(latencies, "delete", started)
+
+
+def run_mode(mode: str, base_url: str, users: int, concurrency: int) -> dict:
+    """
+    Runs one mode to completion (inside a child process) and returns its raw figures.
+    """
+    # Every key exists before any thread starts: workers only append (atomic), never insert
+    latencies: Dict[str, List[float]] = {op: [] for op in OPERATIONS}
+    metrics = ClientMetrics()
+    errors = 0
+    started = time.perf_counter()
+
+    if mode == "sync":
+        with UsersApiClient(base_url=base_url, metrics=metrics, circuit_breaker=False) as api:
+            for index in range(users):
+                try:
+                    _sync_workflow(api, latencies, index)
+                except Exception:
+                    errors += 1
+
+    elif mode == "threaded":
+        with UsersApiClient(
+                base_url=base_url, thread_safe=True, max_workers=concurrency, metrics=metrics, circuit_breaker=False,
+        ) as api:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = map_threads(
+                    executor, lambda i: _sync_workflow(api, latencies, i), range(users), concurrency
+                )
+        errors = sum(1 for r in results if not r.ok)
+
+    elif mode == "async":
+        async def _run():
+            async with AsyncUsersApiClient(
+                    base_url, {}, concurrency=concurrency, metrics=metrics, circuit_breaker=False,
+            ) as api:
+                return await gather_bounded(
+                    lambda i: _async_workflow(api, latencies, i), range(users), concurrency
+                )
+
+        errors = sum(1 for r in asyncio.run(_run()) if not r.ok)
+
+    else:
+        raise ValueError(f"Unknown mode: {mode!r}")
+
+    elapsed = time.perf_counter() - started
+    all_latencies = [value for values in latencies.values() for value in values]
+    operations = metrics.snapshot()["operations"]
+    retries_by_reason: Dict[str, int] = defaultdict(int)
+    for figures in operations.values():
+        for reason, count in figures["retries"].items():
+            retries_by_reason[reason] += count
+    return {
+        "mode": mode,
+        "users": users,
+        "concurrency": 1 if mode == "sync" else concurrency,
+        "failed_workflows": errors,
+        "retries": sum(figures["attempts"] - figures["calls"] for figures in operations.values()),
+        "retries_by_reason": dict(retries_by_reason),
+        **latency_summary(all_latencies, elapsed),
+        "per_op": {op: latency_summary(values, elapsed) for op, values in latencies.items() if values},
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def _run_isolated(mode: str, base_url: str, users: int, concurrency: int) -> dict:
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(run_mode, mode, base_url, users, concurrency).result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=("local", "remote"), default="local")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="local server latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="local server 5xx injection rate")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = {"target": args.target, "config": vars(args), "results": []}
+
+    if args.target == "local":
+        backend = UsersBackend(
+            latency=Fixed(args.latency_ms / 1000),
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+        server = LocalUsersServer(backend, process=True).start()
+        base_url = server.base_url
+    else:
+        server = None
+        base_url = BASE_URL
+
+    try:
+        for mode in args.modes:
+            if server is not None:
+                server.reset()
+            result = _run_isolated(mode, base_url, args.users, args.concurrency)
+            if server is not None:
+                result["server_requests"] = server.stats()["requests"]
+            print(json.dumps({k: v for k, v in result.items() if k != "per_op"}))
+            report["results"].append(result)
+    finally:
+        if server is not None:
+            server.stop()
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Micro-benchmark: JSON bodies through the stdlib path vs mockapi_client.codec.
+
+- stdlib  -> what the clients did before: json.dumps(...).encode() for payloads, and
+             bytes -> str -> json.loads for responses (requests' / httpx' response.json())
+- <codec> -> every installed JsonCodec backend (orjson, msgspec, json), bytes in / bytes out
+
+List responses reuse the MockAPI-like payloads of bench_normalizers. Each size is
+timed `--repeat` times and the best run is reported; every codec is checked
+against the stdlib result first.
+
+    python -m benchmarks.bench_codec --sizes 100 10000 100000 --output codec.json
+"""
+import argparse
+import json
+from typing import Dict, List
+
+from benchmarks.bench_normalizers import best_of, make_payload
+from core.normalizers import normalize_users_batch, normalize_users_json
+from mockapi_client.codec import JsonCodec, get_codec
+
+
+def installed_codecs() -> List[JsonCodec]:
+    codecs = []
+    for name in ("orjson", "msgspec", "json"):
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            pass
+    return codecs
+
+
+def stdlib_decode(body: bytes):
+    return json.loads(body.decode("utf-8"))
+
+
+def run_size(size: int, repeat: int, codecs: List[JsonCodec]) -> Dict[str, object]:
+    users = make_payload(size)
+    body = json.dumps(users).encode()
+    payload = {"name": "user_0000002a", "email": "user42@example.com"}
+    payloads = [payload] * size
+    expected = normalize_users_batch(stdlib_decode(body))
+
+    timings = {
+        "stdlib_decode": best_of(stdlib_decode, body, repeat),
+        "stdlib_encode": best_of(lambda items: [json.dumps(p).encode() for p in items], payloads, repeat),
+        "stdlib_decode_normalize": best_of(lambda b: normalize_users_batch(stdlib_decode(b)), body, repeat),
+    }
+    for codec in codecs:
+        assert codec.loads(body) == users, f"{codec.name} decodes differently"
+        assert normalize_users_json(body, codec) == expected, f"{codec.name} normalizes differently"
+        dumps = codec.dumps
+        timings[f"{codec.name}_decode"] = best_of(codec.loads, body, repeat)
+        timings[f"{codec.name}_encode"] = best_of(lambda items: [dumps(p) for p in items], payloads, repeat)
+        timings[f"{codec.name}_decode_normalize"] = best_of(lambda b: normalize_users_json(b, codec), body, repeat)
+
+    result = {"records": size, "body_bytes": len(body)}
+    result.update({f"{name}_ms": round(seconds * 1000, 3) for name, seconds in timings.items()})
+    for codec in codecs:
+        for step in ("decode", "encode", "decode_normalize"):
+            result[f"{codec.name}_{step}_speedup"] = round(timings[f"stdlib_{step}"] / timings[f"{codec.name}_{step}"], 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    codecs = installed_codecs()
+    report = {"config": vars(args), "codecs": [codec.name for codec in codecs], "results": []}
+    for size in args.sizes:
+        result = run_size(size, args.repeat, codecs)
+        print(json.dumps(result))
+        report["results"].append(result)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
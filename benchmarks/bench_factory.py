@@ -0,0 +1,103 @@
+"""
+Micro-benchmark: UserFactory payload generation.
+
+- uuid4   -> the previous factory: uuid4() per name plus a set of every issued name
+- single  -> UserFactory.create_user_payload() in a loop
+- bulk    -> UserFactory.create_user_payloads(n), consumed lazily
+
+Reported per size: best-of-`--repeat` payloads/sec and the peak memory of one
+run (tracemalloc), which grows with `n` only for the uuid4 factory.
+
+    python -m benchmarks.bench_factory --sizes 100000 1000000 --output factory.json
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from collections import deque
+from typing import Callable, Dict
+from uuid import uuid4
+
+from mockapi_client.factory import UserFactory
+
+
+class Uuid4Factory:
+    """The factory as it was before the counter-based naming, for comparison."""
+
+    def __init__(self):
+        self._used_names = set()
+
+    def create_user_payload(self) -> dict:
+        while True:
+            name = f"user_{uuid4().hex[:8]}"
+            if name not in self._used_names:
+                self._used_names.add(name)
+                return {"name": name, "email": f"{name}@example.com"}
+
+
+def uuid4_run(n: int) -> None:
+    factory = Uuid4Factory()
+    for _ in range(n):
+        factory.create_user_payload()
+
+
+def single_run(n: int) -> None:
+    factory = UserFactory()
+    for _ in range(n):
+        factory.create_user_payload()
+
+
+def bulk_run(n: int) -> None:
+    deque(UserFactory().create_user_payloads(n), maxlen=0)
+
+
+def best_rate(func: Callable[[int], None], n: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(n)
+        best = min(best, time.perf_counter() - started)
+    return n / best
+
+
+def peak_bytes(func: Callable[[int], None], n: int) -> int:
+    tracemalloc.start()
+    try:
+        func(n)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_size(size: int, repeat: int) -> Dict[str, object]:
+    runs = {"uuid4": uuid4_run, "single": single_run, "bulk": bulk_run}
+    rates = {name: best_rate(run, size, repeat) for name, run in runs.items()}
+    result = {"payloads": size}
+    result.update({f"{name}_per_s": round(rate) for name, rate in rates.items()})
+    result.update({f"{name}_peak_kb": round(peak_bytes(run, size) / 1024, 1) for name, run in runs.items()})
+    result["bulk_speedup_vs_uuid4"] = round(rates["bulk"] / rates["uuid4"], 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = {"config": vars(args), "results": []}
+    for size in args.sizes:
+        result = run_size(size, args.repeat)
+        print(json.dumps(result))
+        report["results"].append(result)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
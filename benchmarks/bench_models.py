@@ -0,0 +1,110 @@
+"""
+Micro-benchmark: dict pipeline vs core.models.User on large list responses.
+
+- reference -> codec.loads -> normalize_users -> validate_users (what most callers do)
+- dicts     -> codec.loads -> normalize_users_batch -> validate_users (normalized dicts kept)
+- users     -> decode_users -> core.models.validate_users (Users kept)
+
+Both start from the same response body, bench_normalizers' MockAPI-like payloads
+with valid emails. Reported: best-of-`--repeat` time and the memory retained by
+the resulting records (tracemalloc). Outputs are checked against each other first.
+
+    python -m benchmarks.bench_models --sizes 10000 100000 1000000 --output models.json
+"""
+import argparse
+import json
+import logging
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+from benchmarks.bench_normalizers import make_payload
+from core.models import decode_users
+from core.models import validate_users as validate_records
+from core.normalizers import normalize_users, normalize_users_batch
+from core.validators import validate_users
+from mockapi_client.codec import CODEC
+from mockapi_client.logger import get_logger
+
+validators_logger = get_logger("core.validators")
+
+
+def reference_pipeline(body: bytes) -> list:
+    users = normalize_users(CODEC.loads(body))
+    validate_users(users)
+    return users
+
+
+def dict_pipeline(body: bytes) -> list:
+    users = normalize_users_batch(CODEC.loads(body))
+    validate_users(users)
+    return users
+
+
+def model_pipeline(body: bytes) -> list:
+    users = decode_users(body)
+    validate_records(users)
+    return users
+
+
+def best_of(func: Callable[[bytes], list], body: bytes, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(body)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def retained_bytes(func: Callable[[bytes], list], body: bytes) -> int:
+    tracemalloc.start()
+    try:
+        kept = func(body)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+
+def run_size(size: int, repeat: int) -> Dict[str, object]:
+    body = json.dumps(make_payload(size)).encode()
+    assert [user.to_dict() for user in model_pipeline(body)] == dict_pipeline(body), "outputs differ"
+
+    pipelines = {"reference": reference_pipeline, "dicts": dict_pipeline, "users": model_pipeline}
+    timings = {name: best_of(pipeline, body, repeat) for name, pipeline in pipelines.items()}
+    memory = {"dicts": retained_bytes(dict_pipeline, body), "users": retained_bytes(model_pipeline, body)}
+    return {
+        "records": size,
+        "codec": CODEC.name,
+        **{f"{name}_s": round(seconds, 4) for name, seconds in timings.items()},
+        **{f"{name}_mb": round(nbytes / 2 ** 20, 1) for name, nbytes in memory.items()},
+        "speedup_vs_reference": round(timings["reference"] / timings["users"], 2),
+        "speedup_vs_dicts": round(timings["dicts"] / timings["users"], 2),
+        "memory_ratio": round(memory["users"] / memory["dicts"], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    validators_logger.setLevel(logging.INFO)
+    report = {"config": vars(args), "results": []}
+    for size in args.sizes:
+        result = run_size(size, args.repeat)
+        print(json.dumps(result))
+        report["results"].append(result)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
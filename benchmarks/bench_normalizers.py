@@ -0,0 +1,143 @@
+"""
+Micro-benchmark: core.normalizers on large payloads.
+
+- reference  -> the original normalize_users body (per-record is_junk closure, f-string compares)
+- single     -> normalize_users (normalize_user per record)
+- batch      -> normalize_users_batch
+- parallel   -> normalize_users_parallel (process pool over chunks)
+
+Payloads mimic MockAPI lists: a mix of clean records and "<field> <id>" autofill
+junk. Each size is timed `--repeat` times and the best run is reported, and
+every variant is checked against the reference output first.
+
+    python -m benchmarks.bench_normalizers --sizes 10000 100000 1000000 --output normalizers.json
+"""
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+
+from core.normalizers import normalize_users, normalize_users_batch, normalize_users_parallel
+
+
+def legacy_normalize_user(raw_user: dict) -> dict:
+    """
+    normalize_user as it was before normalized_fields, kept here as the baseline.
+    """
+    user_id = raw_user.get("id")
+    email = raw_user.get("email")
+
+    def is_junk(key, value):
+        if not isinstance(value, str):
+            return False
+        return value == f"{key} {user_id}"
+
+    name = raw_user.get("name")
+    if is_junk("name", name): name = None
+
+    if not name:
+        first_name = raw_user.get("first_name")
+        last_name = raw_user.get("last_name")
+        if is_junk("first_name", first_name): first_name = None
+        if is_junk("last_name", last_name): last_name = None
+
+        if first_name and last_name:
+            name = f"{first_name} {last_name}"
+        else:
+            name = first_name or last_name
+
+    return {
+        "id": str(user_id) if user_id is not None else None,
+        "email": email.lower() if isinstance(email, str) else None,
+        "name": name,
+    }
+
+
+def legacy_normalize_users(raw_users: list) -> list[dict]:
+    if not isinstance(raw_users, list):
+        return []
+    return [legacy_normalize_user(user) for user in raw_users if isinstance(user, dict)]
+
+
+def make_payload(size: int, seed: int = 1) -> List[dict]:
+    rng = random.Random(seed)
+    users = []
+    for index in range(size):
+        user_id = str(index)
+        if rng.random() < 0.5:
+            user = {"id": user_id, "name": f"user_{index:08x}", "email": f"User{index}@Example.com"}
+        else:
+            user = {
+                "id": user_id,
+                "name": f"name {user_id}",
+                "first_name": rng.choice(["Ann", f"first_name {user_id}"]),
+                "last_name": rng.choice(["Lee", f"last_name {user_id}"]),
+                "email": f"User{index}@Example.com",
+            }
+        users.append(user)
+    return users
+
+
+def best_of(func: Callable[[list], list], payload: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_size(size: int, repeat: int, executor: ProcessPoolExecutor, chunk_size: int) -> Dict[str, object]:
+    payload = make_payload(size)
+    parallel = lambda users: normalize_users_parallel(users, chunk_size=chunk_size, executor=executor)
+
+    expected = legacy_normalize_users(payload)
+    assert normalize_users(payload) == expected, "single output differs from reference"
+    assert normalize_users_batch(payload) == expected, "batch output differs from reference"
+    assert parallel(payload) == expected, "parallel output differs from reference"
+    del expected
+
+    timings = {
+        "reference": best_of(legacy_normalize_users, payload, repeat),
+        "single": best_of(normalize_users, payload, repeat),
+        "batch": best_of(normalize_users_batch, payload, repeat),
+        "parallel": best_of(parallel, payload, repeat),
+    }
+    return {
+        "records": size,
+        **{f"{name}_s": round(seconds, 4) for name, seconds in timings.items()},
+        **{f"{name}_krps": round(size / seconds / 1000, 1) for name, seconds in timings.items()},
+        "single_speedup": round(timings["reference"] / timings["single"], 2),
+        "batch_speedup": round(timings["reference"] / timings["batch"], 2),
+        "parallel_speedup": round(timings["reference"] / timings["parallel"], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = {"config": vars(args), "results": []}
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for size in args.sizes:
+            result = run_size(size, args.repeat, executor, args.chunk_size)
+            print(json.dumps(result))
+            report["results"].append(result)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Connection pool / protocol benchmark for AsyncUsersApiClient.
+
+Runs the same burst of GETs against the local stand-in server (a seeded
+UsersBackend, in a child process) for every combination of pool size and
+protocol (HTTP/1.1 keep-alive vs. cleartext HTTP/2), and prints
+throughput, latency percentiles and pool usage (connections opened, peak
+requests holding a connection) as JSON.
+
+    python -m benchmarks.bench_pool --requests 2000 --concurrency 200 --latency 0.02
+
+HTTP/2 runs need the optional `h2` package and are skipped without it.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.bulk import gather_bounded
+
+from mockapi_client.local_server import LocalUsersServer
+
+from .common import LocalH2BenchServer, latency_summary, seeded_backend
+
+
+async def _run(base_url: str, protocol: str, pool_size: int, requests: int, concurrency: int, users: int) -> dict:
+    transport = None
+    if protocol == "http2":
+        # Prior-knowledge HTTP/2: no TLS/ALPN on a local cleartext server
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            http1=False,
+            http2=True,
+        )
+
+    latencies = []
+
+    async with AsyncUsersApiClient(
+            base_url=base_url,
+            headers={},
+            concurrency=concurrency,
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            http2=protocol == "http2",
+            transport=transport,
+    ) as client:
+        async def timed_get(user_id):
+            started = time.perf_counter()
+            await client.get_user(user_id)
+            latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        results = await gather_bounded(timed_get, (str(i % users + 1) for i in range(requests)), concurrency)
+        elapsed = time.perf_counter() - started
+        stats = client.pool_stats()
+
+    return {
+        "protocol": protocol,
+        "pool_size": pool_size,
+        "concurrency": concurrency,
+        "errors": sum(1 for r in results if not r.ok),
+        "connections_opened": stats["connections_opened"],
+        "peak_active": stats["peak_active"],
+        **latency_summary(latencies, elapsed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02, help="server-side latency per request (s)")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 10, 50, 100, 200])
+    parser.add_argument("--users", type=int, default=100, help="users seeded in the server; GETs cycle through them")
+    args = parser.parse_args()
+
+    protocols = ["http1"]
+    try:
+        import h2  # noqa: F401
+        protocols.append("http2")
+    except ImportError:
+        print("h2 not installed: skipping HTTP/2 runs (pip install -e .[http2])")
+
+    report = []
+    for protocol in protocols:
+        backend = seeded_backend(args.users, args.latency)
+        server = LocalH2BenchServer(backend) if protocol == "http2" else LocalUsersServer(backend, process=True)
+        with server:
+            for pool_size in args.pool_sizes:
+                row = asyncio.run(
+                    _run(server.base_url, protocol, pool_size, args.requests, args.concurrency, args.users)
+                )
+                print(json.dumps(row))
+                report.append(row)
+    return report
+
+
+if __name__ == "__main__":
+    main()
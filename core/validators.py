@@ -1,5 +1,7 @@
+import re
+from dataclasses import dataclass, field
 from mockapi_client.logger import get_logger
-from typing import List, Dict
+from typing import Any, Callable, List, Dict, Iterable, Iterator, Optional
 
 logger = get_logger(__name__)
 
@@ -17,7 +19,7 @@ def validate_user_id(user: dict) -> None:
         ValidationError: If 'id' is missing, not a string, or contains only whitespace.
     """
     user_id = user.get("id")
-    logger.debug(f"Validating user_id: {user_id}")
+    logger.debug("Validating user_id: %s", user_id)
 
     if not isinstance(user_id, str) or not user_id.strip():
         raise ValidationError("User id must be a non-empty string")
@@ -34,7 +36,7 @@ def validate_user_name(user: dict) -> None:
         ValidationError: If 'name' is provided but is not a non-empty string.
     """
     name = user.get("name")
-    logger.debug(f"Validating user_name: {name}")
+    logger.debug("Validating user_name: %s", name)
 
     if name is None:
         return  # name is optional
@@ -56,7 +58,7 @@ def validate_user_email(user: dict) -> None:
     """
     user_id = user.get("id", "Unknown ID")
     email = user.get("email")
-    logger.debug(f"Validating user_email: {email}")
+    logger.debug("Validating user_email: %s", email)
 
     # 1. Type and Empty Check
     if not isinstance(email, str) or not email.strip():
@@ -67,26 +69,239 @@ def validate_user_email(user: dict) -> None:
         raise ValidationError(f"User [{user_id}]: Invalid email format '{email}'.")
 
 
+# -------------------------------------------------
+# Compiled schema validation
+# -------------------------------------------------
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Declarative rule for one user field.
+
+    - required -> None is an error (otherwise None / absent is accepted)
+    - value must be a string with at least one non-whitespace character
+    - pattern  -> regex that must be found in the value (re.search)
+    - messages -> str.format templates with {user_id} and {value}
+    """
+    missing_message: str
+    required: bool = True
+    pattern: Optional[str] = None
+    invalid_message: Optional[str] = None
+
+
+# Same rules and messages as validate_user_id / validate_user_email / validate_user_name,
+# in the order validate_users has always applied them
+USER_SCHEMA: Dict[str, FieldSpec] = {
+    "id": FieldSpec("User id must be a non-empty string"),
+    "email": FieldSpec(
+        "User [{user_id}]: Email is missing or not a string.",
+        # '@' present and the part after the last '@' contains a dot
+        pattern=r"@[^@]*\.[^@]*\Z",
+        invalid_message="User [{user_id}]: Invalid email format '{value}'.",
+    ),
+    "name": FieldSpec("Name must be a non-empty string if provided", required=False),
+}
+
+
+@dataclass(frozen=True)
+class FieldError:
+    index: int
+    user_id: Any
+    field: Optional[str]
+    message: str
+
+
+@dataclass
+class ValidationReport:
+    """
+    Every failing record and field of a batch, from UserValidator.report().
+    """
+    checked: int
+    errors: List[FieldError] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def invalid(self) -> int:
+        """Number of records with at least one error."""
+        return len({error.index for error in self.errors})
+
+    def by_field(self) -> Dict[Optional[str], int]:
+        counts: Dict[Optional[str], int] = {}
+        for error in self.errors:
+            counts[error.field] = counts.get(error.field, 0) + 1
+        return counts
+
+
+# A compiled check returns None when the field is valid, else the error message
+_Check = Callable[[dict], Optional[str]]
+
+
+def _compile_field(name: str, spec: FieldSpec, attribute: bool = False) -> _Check:
+    """
+    Check for one field, reading `record.get(name)`, or `record.<name>` when
+    `attribute` is set (core.models.User).
+    """
+    required = spec.required
+    search = re.compile(spec.pattern).search if spec.pattern else None
+    missing, invalid = spec.missing_message, spec.invalid_message
+    # Both readers take (record, key, default)
+    get = getattr if attribute else dict.get
+
+    def check(record: Any) -> Optional[str]:
+        value = get(record, name, None)
+        if value is None and not required:
+            return None
+        # `not value.isspace()` is `value.strip() != ""` without building a new string
+        if not isinstance(value, str) or not value or value.isspace():
+            return missing.format(user_id=get(record, "id", "Unknown ID"), value=value)
+        if search is not None and search(value) is None:
+            return invalid.format(user_id=get(record, "id", "Unknown ID"), value=value)
+        return None
+
+    return check
+
+
+class UserValidator:
+    """
+    Validator compiled once from a declarative schema (field -> FieldSpec).
+
+    - validate(user)       -> raises ValidationError on the first failing field
+    - first_error(record)  -> same checks on an attribute record (core.models.User): message or None
+    - validate_records(rs) -> validate_many for such records
+    - validate_many(users) -> same, for a whole list (the validate_users contract)
+    - report(users)        -> checks everything and returns a ValidationReport
+
+    The hot path does no logging and no string formatting unless a field fails.
+    """
+
+    def __init__(self, schema: Optional[Dict[str, FieldSpec]] = None):
+        self.schema = dict(USER_SCHEMA if schema is None else schema)
+        self._checks = tuple((name, _compile_field(name, spec)) for name, spec in self.schema.items())
+        self._attribute_checks = tuple(_compile_field(name, spec, attribute=True) for name, spec in self.schema.items())
+
+    def validate(self, user: dict) -> None:
+        if not isinstance(user, dict):
+            raise ValidationError("Each user must be a dict")
+        for _, check in self._checks:
+            error = check(user)
+            if error is not None:
+                raise ValidationError(error)
+
+    def first_error(self, record: Any) -> Optional[str]:
+        """
+        Message of the first failing field, or None. `record` is an object with the
+        schema's fields as attributes (e.g. core.models.User); its type is not checked.
+        """
+        for check in self._attribute_checks:
+            error = check(record)
+            if error is not None:
+                return error
+        return None
+
+    def validate_records(self, records: Iterable) -> None:
+        """
+        validate_many for attribute records (core.models.User): raises ValidationError
+        with the first failing field's message. Record types are not checked.
+        """
+        checks = self._attribute_checks
+        for record in records:
+            for check in checks:
+                error = check(record)
+                if error is not None:
+                    raise ValidationError(error)
+
+    def validate_many(self, users: list) -> None:
+        if not isinstance(users, list):
+            raise ValidationError("Users payload must be a list")
+        checks = [check for _, check in self._checks]
+        for user in users:
+            if not isinstance(user, dict):
+                raise ValidationError("Each user must be a dict")
+            for check in checks:
+                error = check(user)
+                if error is not None:
+                    raise ValidationError(error)
+
+    def report(self, users: list) -> ValidationReport:
+        """
+        Collect-all mode: every failing field of every record, in input order.
+
+        Raises:
+            ValidationError: If the payload itself is not a list.
+        """
+        if not isinstance(users, list):
+            raise ValidationError("Users payload must be a list")
+        errors = []
+        for index, user in enumerate(users):
+            if not isinstance(user, dict):
+                errors.append(FieldError(index, None, None, "Each user must be a dict"))
+                continue
+            for name, check in self._checks:
+                error = check(user)
+                if error is not None:
+                    errors.append(FieldError(index, user.get("id"), name, error))
+        report = ValidationReport(checked=len(users), errors=errors)
+        if errors:
+            logger.debug("Validation report: %d of %d users invalid", report.invalid, report.checked)
+        return report
+
+
+_DEFAULT_VALIDATOR = UserValidator()
+
+
+def default_validator() -> UserValidator:
+    """The UserValidator compiled from USER_SCHEMA that the module-level helpers use."""
+    return _DEFAULT_VALIDATOR
+
+
 def validate_users(users: list[dict]) -> None:
     """
     Iterates through a list of user dictionaries and triggers individual
     field validations for each.
 
     This acts as the primary entry point for batch validation before
-    processing API data.
+    processing API data. Runs on the compiled USER_SCHEMA validator; use
+    validate_users_report() to collect every failure instead of the first.
 
     Raises:
         ValidationError: If the payload is not a list, if any item is not
                          a dictionary, or if any specific user field fails validation.
     """
-    if not isinstance(users, list):
-        raise ValidationError("Users payload must be a list")
+    logger.debug("Validating %d users", len(users) if isinstance(users, list) else 0)
+    _DEFAULT_VALIDATOR.validate_many(users)
 
-    for user in users:
-        if not isinstance(user, dict):
-            raise ValidationError("Each user must be a dict")
 
-        logger.debug(f"Validating user: {user}")
-        validate_user_id(user)
-        validate_user_email(user)
-        validate_user_name(user)
\ No newline at end of file
+def validate_users_report(users: list[dict]) -> ValidationReport:
+    """
+    Collect-all counterpart of validate_users: returns a ValidationReport
+    listing every failing record and field instead of raising on the first.
+    """
+    return _DEFAULT_VALIDATOR.report(users)
+
+
+def validate_user(user: dict) -> None:
+    """
+    Runs every field validation on a single user dictionary.
+
+    Raises:
+        ValidationError: If the item is not a dictionary or any field fails validation.
+    """
+    _DEFAULT_VALIDATOR.validate(user)
+
+
+def iter_validate_users(users: Iterable) -> Iterator[dict]:
+    """
+    Streaming counterpart of validate_users: validates each user as it is
+    consumed and yields it on success, so streamed responses never need to
+    be materialized as a list.
+
+    Raises:
+        ValidationError: On the first user that fails validation.
+    """
+    validate = _DEFAULT_VALIDATOR.validate
+    for user in users:
+        validate(user)
+        yield user
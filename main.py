@@ -1,6 +1,12 @@
-from mockapi_client.logger import get_logger
+import argparse
+from contextlib import nullcontext
+
+from mockapi_client.logger import configure_logging, get_logger
 from mockapi_client.client import UsersApiClient
+from mockapi_client.config import BASE_URL, LOG_FORMAT, LOG_QUEUE, TRACE_FILE, TRACE_FORMAT, USE_LOCAL_SERVER
 from mockapi_client.factory import UserFactory
+from mockapi_client.local_server import LocalUsersServer
+from mockapi_client.tracing import configure_tracing, shutdown_tracing, span
 
 logger = get_logger(__name__)
 
@@ -16,36 +22,38 @@ def user_scenario(
 
     # 1. CREATE & VERIFY (GET)
     logger.info("-" * 60)
-    logger.info(f"--- Step 1: Creating and verifying {count} users ---")
-    for _ in range(count):
-        logger.info("-" * 60)
-        payload = factory.create_user_payload()
-        logger.info(f"Generated payload for user: {payload}")
-
-        # POST
-        created = api.create_user(payload)
-        user_id = created["id"]
-        created_ids.append(user_id)
-        logger.info(f"Created user: {payload['name']} (ID: {user_id})")
-
-        # GET
-        fetched = api.get_user(user_id)
-        logger.info(f"Fetched user: {fetched}")
-        assert fetched and fetched["name"] == payload["name"], f"Verification failed for {user_id}"
-        logger.info(f"Creation - Fetching success")
+    logger.info("--- Step 1: Creating and verifying %d users ---", count)
+    with span("scenario.create_and_verify", count=count):
+        for _ in range(count):
+            logger.info("-" * 60)
+            payload = factory.create_user_payload()
+            logger.info("Generated payload for user: %s", payload)
+
+            # POST
+            created = api.create_user(payload)
+            user_id = created["id"]
+            created_ids.append(user_id)
+            logger.info("Created user: %s (ID: %s)", payload["name"], user_id)
+
+            # GET
+            fetched = api.get_user(user_id)
+            logger.info("Fetched user: %s", fetched)
+            assert fetched and fetched["name"] == payload["name"], f"Verification failed for {user_id}"
+            logger.info("Creation - Fetching success")
     logger.info("-" * 60)
     logger.info("All users successfully created and verified.")
     logger.info("-" * 60)
 
     # 2. PATCH (Partial Update)
     if created_ids:
-        target_id = created_ids[0]
-        logger.info(f"--- Step 2: Patching user {target_id} ---")
-        patch_data = {"name": "renamed_user"}
-        patched = api.patch_user(target_id, patch_data)
-        assert patched["name"] == "renamed_user", f"Rename user: {created_ids[0]} to renamed_user failed"
-        logger.info(f"Patched user: {patched}")
-        logger.info(f"User {target_id} successfully renamed to name: renamed_user")
+        with span("scenario.patch"):
+            target_id = created_ids[0]
+            logger.info("--- Step 2: Patching user %s ---", target_id)
+            patch_data = {"name": "renamed_user"}
+            patched = api.patch_user(target_id, patch_data)
+            assert patched["name"] == "renamed_user", f"Rename user: {created_ids[0]} to renamed_user failed"
+            logger.info("Patched user: %s", patched)
+            logger.info("User %s successfully renamed to name: renamed_user", target_id)
 
     # 3. DELETE (Cleanup)
     logger.info("-" * 60)
@@ -53,16 +61,17 @@ def user_scenario(
 
     failed_deletions = []
 
-    for user_id in created_ids:
-        logger.debug(f"Deleting user {user_id}...")
-        api.delete_user(user_id)
+    with span("scenario.delete", count=len(created_ids)):
+        for user_id in created_ids:
+            logger.debug("Deleting user %s...", user_id)
+            api.delete_user(user_id)
 
-        # Verify
-        if api.wait_until_deleted(user_id):
-            logger.debug(f"Successfully verified deletion of user {user_id}")
-        else:
-            logger.error(f"Timeout deleting for user: {user_id}")
-            failed_deletions.append(user_id)
+            # Verify
+            if api.wait_until_deleted(user_id):
+                logger.debug("Successfully verified deletion of user %s", user_id)
+            else:
+                logger.error("Timeout deleting for user: %s", user_id)
+                failed_deletions.append(user_id)
 
     if failed_deletions:
         raise Exception(f"Cleanup failed for: {failed_deletions}")
@@ -72,18 +81,45 @@ def user_scenario(
 
 
 def main():
+    parser = argparse.ArgumentParser(description="MockAPI users lifecycle demo")
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        default=USE_LOCAL_SERVER,
+        help="run against the bundled local stand-in server instead of BASE_URL",
+    )
+    parser.add_argument("--log-format", choices=("color", "text", "json"), default=LOG_FORMAT)
+    parser.add_argument(
+        "--log-queue",
+        action="store_true",
+        default=LOG_QUEUE,
+        help="write logs from a background thread instead of the calling thread",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        default=TRACE_FILE,
+        help="record spans for every step, client call, attempt and request to FILE",
+    )
+    parser.add_argument("--trace-format", choices=("jsonl", "chrome"), default=TRACE_FORMAT)
+    args = parser.parse_args()
+    configure_logging(fmt=args.log_format, use_queue=args.log_queue)
+    if args.trace:
+        configure_tracing(args.trace, args.trace_format)
+
     factory = UserFactory()
+    server = LocalUsersServer() if args.local else nullcontext()
 
-    with UsersApiClient() as api:
+    with server, UsersApiClient(base_url=server.base_url if args.local else BASE_URL) as api:
         try:
-            user_scenario(api, factory, count=5)
+            with span("scenario"):
+                user_scenario(api, factory, count=5)
             logger.info("Task completed successfully!")
         except Exception as e:
-            logger.error(f"Scenario failed: {e}")
+            logger.error("Scenario failed: %s", e)
         finally:
             # This runs even if an exception was raised
-            factory.reset()
-            logger.debug("UserFactory memory cleared")
+            shutdown_tracing()
 
 
 if __name__ == "__main__":
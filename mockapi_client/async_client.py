@@ -1,77 +1,460 @@
 import asyncio
-from typing import Dict
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 
 import httpx
 from .async_decorators import async_retry
+from .bulk import BulkResult, as_completed_bounded, gather_bounded
+from .cache import MISSING, TTLCache
+from .metrics import ClientMetrics, default_metrics
+from .circuit_breaker import CircuitBreaker, resolve_circuit_breaker
+from .codec import JsonCodec
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .protocol import JSON_HEADERS, ApiCall, UsersProtocol
+from .singleflight import SingleFlight
+from .streaming import aiter_json_array
+from .tracing import span
+from .waiters import Condition, WaitOutcome, Waiter, deleted, legacy_timeout
+from .config import (
+    ASYNC_HTTP2,
+    ASYNC_KEEPALIVE_EXPIRY,
+    ASYNC_MAX_CONNECTIONS,
+    ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+    BULK_CONCURRENCY,
+    WAIT_TIMEOUT,
+)
 from mockapi_client.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+# First trace event once a request holds a pooled connection (a new one is connecting, or a reused one is sending)
+_CONNECTION_EVENTS = ("connection.", "http11.", "http2.")
+
+
+class _PoolUsage:
+    """
+    Pool usage counted from httpx's public `trace` request extension, not from
+    transport internals. A request is queued from send until its first
+    connection-level event, then active until the response (headers, for streams)
+    is back. Transports that emit no trace events (MockTransport, in-process
+    transports) never report a connection, so their requests count as queued.
+    """
+
+    def __init__(self):
+        self.queued = 0
+        self.active = 0
+        self.peak_queued = 0
+        self.peak_active = 0
+        self.connections_opened = 0
+        self.http2_connections_opened = 0
+
+    def track(self, inner=None):
+        """
+        Returns (trace, done): the trace extension for one request (forwarding to
+        `inner`, e.g. the metrics pool-wait tracer) and the callback for when it ends.
+        """
+        phase = "queued"
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal phase
+            if inner is not None:
+                await inner(event_name, info)
+            if phase == "queued" and event_name.startswith(_CONNECTION_EVENTS):
+                phase = "active"
+                self.queued -= 1
+                self.active += 1
+                self.peak_active = max(self.peak_active, self.active)
+            if event_name in ("connection.connect_tcp.complete", "connection.connect_unix_socket.complete"):
+                self.connections_opened += 1
+            elif event_name == "http2.send_connection_init.complete":
+                self.http2_connections_opened += 1
+
+        def done() -> None:
+            nonlocal phase
+            if phase == "queued":
+                self.queued -= 1
+            elif phase == "active":
+                self.active -= 1
+            phase = "done"
+
+        return trace, done
+
+
 class AsyncUsersApiClient:
-    def __init__(self, base_url: str, headers: dict):
-        self.base_url = base_url
+    """
+    Async Users API client backed by a single pooled httpx.AsyncClient.
+
+    Pool sizing:
+    - max_connections            -> hard cap on open connections (requests queue beyond it)
+    - max_keepalive_connections  -> idle connections kept open for reuse
+    - keepalive_expiry           -> seconds an idle connection is kept before closing
+    - http2                      -> multiplex requests over one connection (needs `h2`)
+
+    A pre-built `transport` may be passed instead (e.g. for a local stand-in server);
+    the pool settings above are then owned by that transport.
+
+    Responses follow the same contract as UsersApiClient (see protocol.UsersProtocol):
+    parsed JSON on 2xx, None on 404 ([] for list calls), httpx.HTTPStatusError otherwise.
+
+    An optional `cache` (TTLCache) makes get_user read-through: patch_user writes
+    through, delete_user evicts, and 404s are cached negatively (None on hit).
+
+    With `coalesce_reads` (default), concurrent identical reads (get_user and
+    wait_until_deleted with the same arguments) share one in-flight request; each
+    caller still gets its own copy of the result.
+
+    Retries follow `retry_policy` (a RetryPolicy, shareable with UsersApiClient) or
+    the decorator default: transport errors and 429/5xx only, never other 4xx.
+
+    Every request passes the `circuit_breaker` (by default the one shared by all
+    clients of `base_url`; False disables it); while it is open, calls raise
+    CircuitOpenError at once.
+    An optional `rate_limiter` (RateLimiter, shareable with other clients and
+    threads) paces every request, retries included.
+
+    Every request feeds `metrics` (ClientMetrics; by default the process-wide
+    registry): latency, status or error kind, bytes, retries per operation, and the
+    wait for a pooled connection (from httpcore trace events).
+
+    Bodies are encoded and decoded as bytes by `codec` (JsonCodec; by default
+    orjson or msgspec when installed, else the stdlib; see mockapi_client.codec).
+    """
+
+    def __init__(
+            self,
+            base_url: str,
+            headers: dict,
+            concurrency: int = BULK_CONCURRENCY,
+            timeout: float = 5,
+            max_connections: Optional[int] = ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections: Optional[int] = ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry: Optional[float] = ASYNC_KEEPALIVE_EXPIRY,
+            http2: bool = ASYNC_HTTP2,
+            transport: Optional[httpx.AsyncBaseTransport] = None,
+            cache: Optional[TTLCache] = None,
+            coalesce_reads: bool = True,
+            retry_policy: Optional[RetryPolicy] = None,
+            circuit_breaker: Union[CircuitBreaker, bool, None] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            metrics: Optional[ClientMetrics] = None,
+            codec: Optional[JsonCodec] = None,
+    ):
+        self.protocol = UsersProtocol(base_url, codec)
+        self.base_url = self.protocol.base_url
         self.headers = headers
+        # Default max in-flight requests for the bulk helpers
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.cache = cache
+        self.coalesce_reads = coalesce_reads
+        self.retry_policy = retry_policy
+        self.circuit_breaker = resolve_circuit_breaker(circuit_breaker, self.base_url)
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics or default_metrics()
+        self.singleflight = SingleFlight()
+        self._custom_transport = transport
+        self._transport = None
         self._client = None
+        self._pool_usage = _PoolUsage()
+        self._in_flight = 0
+        self._peak_in_flight = 0
 
     async def __aenter__(self):
+        # Raises ImportError with install hints if http2=True and `h2` is missing
+        self._transport = self._custom_transport or httpx.AsyncHTTPTransport(
+            limits=self.limits,
+            http2=self.http2,
+        )
         self._client = httpx.AsyncClient(
             headers=self.headers,
-            timeout=5
+            timeout=self.timeout,
+            transport=self._transport,
         )
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
         await self._client.aclose()
 
+    # -------------------------------------------------
+    # Core request handler
+    # -------------------------------------------------
+
+    async def _send(self, method: str, url: str, stream: bool = False, **kwargs) -> httpx.Response:
+        """
+        Sends one request through the rate limiter and circuit breaker.
+        With stream=True the body is not read; the caller must `aclose()` the response.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(method)
+        with span("http", method=method, url=url) as current:
+            response = await self._transmit(method, url, stream, **kwargs)
+            current.set(status=response.status_code)
+        return response
+
+    async def _transmit(self, method: str, url: str, stream: bool, **kwargs) -> httpx.Response:
+        breaker = self.circuit_breaker
+        metrics = self.metrics
+        if breaker is not None:
+            breaker.before_call()
+        trace, pool_done = self._pool_usage.track(metrics.pool_wait_tracer() if metrics is not None else None)
+        kwargs["extensions"] = {"trace": trace}
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        started = time.perf_counter()
+        try:
+            request = self._client.build_request(method, url, **kwargs)
+            response = await self._client.send(request, stream=stream)
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.release()
+            raise
+        except Exception as exc:
+            self.protocol.on_error(breaker, metrics, method, url, exc, time.perf_counter() - started)
+            raise
+        finally:
+            self._in_flight -= 1
+            pool_done()
+        elapsed = time.perf_counter() - started
+        # Streamed bodies are not read here; fall back to the declared length
+        received = int(response.headers.get("Content-Length") or 0) if stream else len(response.content)
+        self.protocol.on_response(
+            breaker, metrics, method, url, response.status_code, elapsed,
+            sent=int(request.headers.get("Content-Length") or 0), received=received,
+        )
+        return response
+
+    async def _execute(self, call: ApiCall, cache: Optional[TTLCache] = None) -> Any:
+        """
+        Async driver for one call: cache hooks, one request, contract from UsersProtocol.
+        """
+        since = self.protocol.cache_version(cache)
+        cached = self.protocol.cache_lookup(call, cache)
+        if cached is not MISSING:
+            return cached
+        body = self.protocol.encode(call)
+        response = await self._send(
+            call.method, call.url, params=call.params, content=body, headers=JSON_HEADERS if body is not None else None,
+        )
+        result = self.protocol.interpret(call, response.status_code, response.content, response.raise_for_status)
+        self.protocol.cache_store(call, cache, result, since)
+        return result
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of connection pool usage, for sizing `max_connections`.
+
+        - max_connections / ...          -> the pool settings, None when a custom
+                                            `transport` owns them
+        - queued / peak_queued           -> requests waiting for a pooled connection (a burst
+                                            counts in full until connections are handed out)
+        - active / peak_active           -> requests holding one
+        - connections_opened             -> new connections (and HTTP/2 ones) since start
+        - in_flight / peak_in_flight     -> requests issued by this client
+
+        Counted from httpx trace events only (see _PoolUsage).
+        """
+        owned = self._custom_transport is None
+        usage = self._pool_usage
+        return {
+            "max_connections": self.limits.max_connections if owned else None,
+            "max_keepalive_connections": self.limits.max_keepalive_connections if owned else None,
+            "keepalive_expiry": self.limits.keepalive_expiry if owned else None,
+            "http2": self.http2 if owned else None,
+            "queued": usage.queued,
+            "peak_queued": usage.peak_queued,
+            "active": usage.active,
+            "peak_active": usage.peak_active,
+            "connections_opened": usage.connections_opened,
+            "http2_connections_opened": usage.http2_connections_opened,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+        }
+
+    # -------------------------------------------------
+    # API methods
+    # -------------------------------------------------
+
     @async_retry()
     async def create_user(self, payload: dict) -> dict:
-        resp = await self._client.post(self.base_url, json=payload)
-        resp.raise_for_status()
-        return resp.json()
+        return await self._execute(self.protocol.create_user(payload))
 
     @async_retry()
     async def delete_user(self, user_id: str) -> None:
-        resp = await self._client.delete(f"{self.base_url}/{user_id}")
-        resp.raise_for_status()
+        await self._execute(self.protocol.delete_user(user_id), self.cache)
         return None  # optional, just to be explicit
 
+    async def _coalesced(self, key: tuple, func):
+        if not self.coalesce_reads:
+            return await func()
+        result = await self.singleflight.do(key, func)
+        # Followers share the leader's result object; hand each caller its own
+        return dict(result) if isinstance(result, dict) else result
+
+    async def get_user(self, user_id: str) -> Optional[dict]:
+        return await self._coalesced(("get_user", user_id), lambda: self._get_user(user_id))
+
     @async_retry()
-    async def get_user(self, user_id: str) -> dict:
-        resp = await self._client.get(f"{self.base_url}/{user_id}")
-        resp.raise_for_status()
-        return resp.json()
+    async def _get_user(self, user_id: str) -> Optional[dict]:
+        return await self._execute(self.protocol.get_user(user_id), self.cache)
 
     @async_retry()
     async def patch_user(self, user_id: str, partial_data: Dict) -> Dict:
-        resp = await self._client.patch(f"{self.base_url}/{user_id}", json=partial_data)
-        resp.raise_for_status()
-        return resp.json()
+        return await self._execute(self.protocol.patch_user(user_id, partial_data), self.cache)
+
+    @async_retry()
+    async def list_users_page(self, page: int, limit: int, **filters) -> List[Dict]:
+        """
+        One page of users using MockAPI's `page` / `limit` query parameters.
+        Out-of-range pages (404) are treated as empty.
+        """
+        return await self._execute(self.protocol.list_users_page(page, limit, **filters))
+
+    async def iter_users(self, page_size: int = 100, **filters) -> AsyncIterator[Dict]:
+        """
+        Lazily yields users page by page. The next page is prefetched in the
+        background while the caller consumes the current one, so at most two
+        pages are held in memory.
+        """
+        page = 1
+        next_page = asyncio.ensure_future(self.list_users_page(page, page_size, **filters))
+        try:
+            while next_page is not None:
+                batch = await next_page
+                next_page = None
+                if len(batch) >= page_size:
+                    page += 1
+                    next_page = asyncio.ensure_future(self.list_users_page(page, page_size, **filters))
+                for user in batch:
+                    yield user
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    async def stream_users(self, chunk_size: int = 64 * 1024, **params) -> AsyncIterator[Dict]:
+        """
+        Streams the users collection, yielding each user as soon as it is parsed
+        from the response body; memory stays flat regardless of collection size.
+        Keyword arguments are sent as query parameters (page, limit, filters).
+
+        Not retried: a retry mid-stream would repeat users. A 404 yields nothing.
+        """
+        call = self.protocol.stream_users(**params)
+        response = await self._send(call.method, call.url, params=call.params, stream=True)
+        try:
+            if self.protocol.check_status(call, response.status_code, response.raise_for_status):
+                async for user in aiter_json_array(response.aiter_bytes(chunk_size)):
+                    yield user
+        finally:
+            await response.aclose()
+
+    # -------------------------------------------------
+    # Bulk operations (bounded concurrency)
+    # -------------------------------------------------
+
+    async def create_users(self, payloads: Iterable[Dict], concurrency: Optional[int] = None) -> List[BulkResult]:
+        """
+        Creates every payload with at most `concurrency` requests in flight.
+        Returns one BulkResult per payload, in input order.
+        """
+        return await gather_bounded(self.create_user, payloads, concurrency or self.concurrency)
+
+    async def get_users(self, user_ids: Iterable[str], concurrency: Optional[int] = None) -> List[BulkResult]:
+        return await gather_bounded(self.get_user, user_ids, concurrency or self.concurrency)
+
+    async def patch_users(
+            self,
+            patches: Iterable[Tuple[str, Dict]],
+            concurrency: Optional[int] = None
+    ) -> List[BulkResult]:
+        """
+        `patches` is an iterable of (user_id, partial_data) pairs.
+        """
+        return await gather_bounded(self._patch_pair, patches, concurrency or self.concurrency)
+
+    async def delete_users(self, user_ids: Iterable[str], concurrency: Optional[int] = None) -> List[BulkResult]:
+        return await gather_bounded(self.delete_user, user_ids, concurrency or self.concurrency)
+
+    def as_completed(
+            self,
+            operation: str,
+            items: Iterable,
+            concurrency: Optional[int] = None
+    ) -> AsyncIterator[BulkResult]:
+        """
+        Streaming variant of the bulk helpers: yields each BulkResult as soon as it finishes.
+
+        `operation` is one of "create", "get", "patch" or "delete"; `items` has the same
+        shape as for the matching bulk method. Use `result.index` to map back to the input.
+        """
+        operations = {
+            "create": self.create_user,
+            "get": self.get_user,
+            "patch": self._patch_pair,
+            "delete": self.delete_user,
+        }
+        if operation not in operations:
+            raise ValueError(f"Unknown bulk operation: {operation!r}")
+        return as_completed_bounded(operations[operation], items, concurrency or self.concurrency)
+
+    async def _patch_pair(self, pair: Tuple[str, Dict]) -> Dict:
+        user_id, partial_data = pair
+        return await self.patch_user(user_id, partial_data)
+
+    async def _fetch_uncached(self, user_id: str) -> Optional[Dict]:
+        # Waiters must observe the server, never the read-through cache
+        return await self._execute(self.protocol.get_user(user_id))
 
-    async def wait_until_deleted(self, user_id: str, retries: int = 5, delay: float = 1.0) -> bool:
+    async def wait_for(
+            self,
+            user_ids: Iterable[str],
+            condition: Condition,
+            timeout: float = WAIT_TIMEOUT,
+            concurrency: Optional[int] = None,
+    ) -> Dict[str, WaitOutcome]:
+        """
+        Polls every ID until `condition(user_or_None)` holds or `timeout` passes,
+        with at most `concurrency` polls in flight; returns a WaitOutcome per ID.
+        """
+        waiter = Waiter(condition, timeout=timeout, concurrency=concurrency or self.concurrency)
+        return await waiter.run_async(self._fetch_uncached, user_ids)
+
+    async def wait_until_deleted(
+            self,
+            user_id: str,
+            timeout: float = WAIT_TIMEOUT,
+            *,
+            retries: Optional[int] = None,
+            delay: Optional[float] = None,
+    ) -> bool:
         """
         Polls until the user with the given ID is no longer found.
-        Returns True if deletion is confirmed (404) or we give up after retries.
-        Treat persistent 500 as 'probably deleted'.
-        """
-        for attempt in range(1, retries + 1):
-            try:
-                resp = await self._client.get(f"{self.base_url}/{user_id}")
-                status = resp.status_code
-                logger.debug(f"Attempt {attempt} - user {user_id} status: {status}")
-                if status == 404:
-                    return True
-                elif 200 <= status < 300:
-                    # user still exists, retry
-                    pass
-                else:
-                    # 500 or other unexpected, retry
-                    logger.error(f"Server error {status}, retrying...")
-            except httpx.RequestError:
-                logger.debug(f"Network error for user {user_id}, retrying...")
-
-            await asyncio.sleep(delay)
-
-        # Give up after all retries
-        logger.warning(f"User {user_id} may still exist, giving up after {retries} retries (server unreliable).")
-        return True  # assume deleted to allow cleanup to continue
+        Returns True if deletion is confirmed before `timeout`, False otherwise.
+        - Before the waiter it returned True after giving up; callers that relied on
+          that must now check the result.
+        - `retries` / `delay` are deprecated: they still work (timeout = retries * delay)
+          but emit a DeprecationWarning.
+        """
+        timeout = legacy_timeout(timeout, retries, delay)
+        outcomes = await self._coalesced(
+            ("wait_until_deleted", user_id, timeout),
+            lambda: self.wait_for([user_id], deleted, timeout),
+        )
+        return outcomes[user_id].satisfied
+
+    async def wait_until_all_deleted(
+            self,
+            user_ids: Iterable[str],
+            timeout: float = WAIT_TIMEOUT,
+            concurrency: Optional[int] = None,
+    ) -> Dict[str, WaitOutcome]:
+        return await self.wait_for(user_ids, deleted, timeout, concurrency)
@@ -1,19 +1,27 @@
 # mockapi_client/async_decorators.py
-import asyncio
 import functools
+from typing import Optional
 
+from .retry import RetryPolicy, resolve_policy, retry_observer
+from .tracing import span
+
+
+def async_retry(attempts=3, delay=0.5, policy: Optional[RetryPolicy] = None):
+    """
+    Async counterpart of decorators.retry_on_failure, driven by the same RetryPolicy:
+    only transport errors and 429/5xx are retried, never other 4xx.
+    """
+    default_policy = policy or RetryPolicy(max_attempts=attempts, base_delay=delay)
 
-def async_retry(attempts=3, delay=0.5):
     def decorator(func):
+        operation = func.__name__.lstrip("_")
+        span_name = f"client.{operation}"
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            for attempt in range(attempts):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception:
-                    if attempt == attempts - 1:
-                        raise
-                    await asyncio.sleep(delay * (2 ** attempt))
+            policy = resolve_policy(args, default_policy)
+            with span(span_name):
+                return await policy.run_async(func, args, kwargs, observer=retry_observer(args, operation))
 
         return wrapper
 
@@ -0,0 +1,157 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Optional
+
+
+@dataclass(frozen=True)
+class BulkResult:
+    """
+    Outcome of a single item inside a bulk operation.
+
+    Exactly one of `value` / `error` is meaningful:
+    - ok    -> `value` holds the call result, `error` is None
+    - error -> `error` holds the raised exception, `value` is None
+    """
+    index: int
+    item: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def split_results(results: Iterable[BulkResult]):
+    """
+    Splits bulk results into (successes, failures) lists, preserving order.
+    """
+    successes, failures = [], []
+    for result in results:
+        (successes if result.ok else failures).append(result)
+    return successes, failures
+
+
+async def _run_one(func: Callable[[Any], Awaitable[Any]], index: int, item: Any) -> BulkResult:
+    try:
+        return BulkResult(index=index, item=item, value=await func(item))
+    except Exception as exc:
+        return BulkResult(index=index, item=item, error=exc)
+
+
+async def as_completed_bounded(
+        func: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        concurrency: int,
+) -> AsyncIterator[BulkResult]:
+    """
+    Runs `func(item)` for every item with at most `concurrency` calls in flight
+    and yields a BulkResult as soon as each call finishes.
+
+    Items are pulled lazily from `items`, so generators of any size are
+    consumed with O(concurrency) memory. Stopping iteration early cancels
+    the remaining in-flight calls.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    source = enumerate(items)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    done = object()
+
+    async def worker():
+        try:
+            # next() on a shared iterator is safe: workers only yield control at awaits
+            for index, item in source:
+                await queue.put(await _run_one(func, index, item))
+        except Exception as exc:
+            # The input iterable itself failed; surface it to the consumer
+            await queue.put(exc)
+            return
+        await queue.put(done)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    remaining = len(workers)
+    try:
+        while remaining:
+            result = await queue.get()
+            if result is done:
+                remaining -= 1
+                continue
+            if isinstance(result, Exception):
+                raise result
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def gather_bounded(
+        func: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        concurrency: int,
+) -> List[BulkResult]:
+    """
+    Same as `as_completed_bounded`, but collects every result and returns
+    them in input order.
+    """
+    results = [result async for result in as_completed_bounded(func, items, concurrency)]
+    results.sort(key=lambda r: r.index)
+    return results
+
+
+def _call_one(func: Callable[[Any], Any], index: int, item: Any) -> BulkResult:
+    try:
+        return BulkResult(index=index, item=item, value=func(item))
+    except Exception as exc:
+        return BulkResult(index=index, item=item, error=exc)
+
+
+def as_completed_threads(
+        executor: Executor,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        concurrency: int,
+) -> Iterator[BulkResult]:
+    """
+    Thread-pool counterpart of `as_completed_bounded`: submits `func(item)` to
+    `executor` with at most `concurrency` pending futures and yields results
+    as they finish.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    source = enumerate(items)
+    pending = set()
+    try:
+        for index, item in source:
+            # Run in a copy of the caller's context so worker-thread spans keep their parent
+            pending.add(executor.submit(copy_context().run, _call_one, func, index, item))
+            if len(pending) >= concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def map_threads(
+        executor: Executor,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        concurrency: int,
+) -> List[BulkResult]:
+    """
+    Same as `as_completed_threads`, but returns every result in input order.
+    """
+    results = list(as_completed_threads(executor, func, items, concurrency))
+    results.sort(key=lambda r: r.index)
+    return results
@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Returned by TTLCache.get() when there is no live entry (None is a valid, negative entry)
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with a per-entry TTL, used as an opt-in read-through cache
+    for `get_user` on both clients.
+
+    - maxsize       -> max entries; the least recently used entry is evicted beyond it
+    - ttl           -> seconds a positive entry stays fresh
+    - negative_ttl  -> seconds a cached miss (None, i.e. a 404) stays fresh
+
+    All state changes happen under one lock that is never held across I/O, so a
+    single instance can be shared by threads (UsersApiClient) and tasks
+    (AsyncUsersApiClient) alike. Dict values are copied in and out, so callers
+    cannot mutate cached entries.
+
+    Writes that raced an invalidation are dropped: take version() before the
+    request and pass it as set(..., since=version). If the key was invalidated
+    (or the cache cleared) in the meantime, the response may predate it and is
+    not stored. Invalidation stamps are kept for the last `maxsize` keys; an older
+    stamp is folded into a floor version that applies to every key, so a forgotten
+    invalidation still drops the write (at worst, a few unrelated writes are skipped).
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 1024,
+            ttl: float = 30.0,
+            negative_ttl: float = 2.0,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # key -> version at which it was last invalidated
+        self._invalidated: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._version = 0
+        # Every key counts as invalidated at this version: raised by clear() and by forgotten stamps
+        self._floor = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        return dict(value) if isinstance(value, dict) else value
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Returns the cached value (None for a cached 404), or MISSING.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return MISSING
+            value, expires_at = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            if value is None:
+                self._negative_hits += 1
+            else:
+                self._hits += 1
+            return self._copy(value)
+
+    def version(self) -> int:
+        """
+        Current invalidation version; see set(since=...).
+        """
+        with self._lock:
+            return self._version
+
+    def set(self, key: Hashable, value: Any, since: Optional[int] = None) -> None:
+        """
+        Stores `value`; None is cached negatively for `negative_ttl` seconds.
+        With `since` (a version()), nothing is stored if `key` was invalidated after it.
+        """
+        ttl = self.negative_ttl if value is None else self.ttl
+        if ttl <= 0:
+            self.invalidate(key)
+            return
+        with self._lock:
+            if since is not None and max(self._floor, self._invalidated.get(key, 0)) > since:
+                return
+            self._entries[key] = (self._copy(value), self._clock() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._version += 1
+            self._invalidated[key] = self._version
+            self._invalidated.move_to_end(key)
+            if len(self._invalidated) > self.maxsize:
+                _, stamp = self._invalidated.popitem(last=False)
+                self._floor = max(self._floor, stamp)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._invalidated.clear()
+            self._version += 1
+            self._floor = self._version
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
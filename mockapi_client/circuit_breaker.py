@@ -0,0 +1,282 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from .config import (
+    CIRCUIT_BREAKER_ENABLED,
+    CIRCUIT_FAILURE_RATE,
+    CIRCUIT_MINIMUM_CALLS,
+    CIRCUIT_OPEN_SECONDS,
+    CIRCUIT_SLOW_CALL_RATE,
+    CIRCUIT_SLOW_CALL_SECONDS,
+    CIRCUIT_WINDOW_SIZE,
+)
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of sending a request while the breaker is open.
+    Never retried: the point is to fail fast.
+    """
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit '{name}' is open; next trial call in {retry_in:.2f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+# listener(breaker, old_state, new_state)
+StateListener = Callable[["CircuitBreaker", CircuitState, CircuitState], None]
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker over a count-based sliding window.
+
+    - window_size             -> last N calls considered for the rates below
+    - minimum_calls           -> no decision until this many calls are in the window
+    - failure_rate_threshold  -> open when failed / calls >= this
+    - slow_call_duration      -> seconds after which a call counts as slow
+    - slow_call_rate_threshold-> open when slow / calls >= this
+    - open_duration           -> seconds to fail fast before allowing trial calls
+    - half_open_max_calls     -> trial calls; all must succeed to close again
+
+    Failures are decided by the caller (the clients count transport errors and 5xx;
+    4xx means the endpoint is healthy). Thread-safe, and cheap enough to call from
+    the event loop: the lock is never held across I/O.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            failure_rate_threshold: float = CIRCUIT_FAILURE_RATE,
+            slow_call_rate_threshold: float = CIRCUIT_SLOW_CALL_RATE,
+            slow_call_duration: float = CIRCUIT_SLOW_CALL_SECONDS,
+            window_size: int = CIRCUIT_WINDOW_SIZE,
+            minimum_calls: int = CIRCUIT_MINIMUM_CALLS,
+            open_duration: float = CIRCUIT_OPEN_SECONDS,
+            half_open_max_calls: int = 3,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.minimum_calls = min(minimum_calls, window_size)
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._listeners: List[StateListener] = []
+        # Transitions made under the lock, delivered to listeners after it is released
+        self._pending: List[Tuple[CircuitState, CircuitState]] = []
+
+        self._state = CircuitState.CLOSED
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._failures = 0
+        self._slow = 0
+        self._opened_at = 0.0
+        self._trial_permits = 0
+        self._trial_successes = 0
+
+        self._calls = 0
+        self._rejected = 0
+        self._transitions: Dict[str, int] = {state.value: 0 for state in CircuitState}
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            state = self._current_state()
+        self._flush_events()
+        return state
+
+    def add_listener(self, listener: StateListener) -> None:
+        self._listeners.append(listener)
+
+    # -------------------------------------------------
+    # Call protocol: before_call() -> record_success / record_failure
+    # -------------------------------------------------
+
+    def before_call(self) -> None:
+        """
+        Admits a call or raises CircuitOpenError.
+        """
+        try:
+            with self._lock:
+                state = self._current_state()
+                if state is CircuitState.OPEN:
+                    self._rejected += 1
+                    raise CircuitOpenError(self.name, self._opened_at + self.open_duration - self._clock())
+                if state is CircuitState.HALF_OPEN:
+                    if self._trial_permits >= self.half_open_max_calls:
+                        self._rejected += 1
+                        raise CircuitOpenError(self.name, 0.0)
+                    self._trial_permits += 1
+                self._calls += 1
+        finally:
+            self._flush_events()
+
+    def record_success(self, duration: float = 0.0) -> None:
+        self._record(False, duration)
+
+    def record_failure(self, duration: float = 0.0) -> None:
+        self._record(True, duration)
+
+    def release(self) -> None:
+        """
+        Returns an admitted call's trial permit without an outcome (e.g. it was cancelled).
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._trial_permits > 0:
+                self._trial_permits -= 1
+
+    def _record(self, failed: bool, duration: float) -> None:
+        slow = duration >= self.slow_call_duration
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.HALF_OPEN:
+                if failed or slow:
+                    self._transition(CircuitState.OPEN)
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.half_open_max_calls:
+                        self._transition(CircuitState.CLOSED)
+            elif state is CircuitState.CLOSED:
+                self._push(failed, slow)
+                if self._should_open():
+                    self._transition(CircuitState.OPEN)
+            # Late results of calls admitted before the circuit opened are ignored
+        self._flush_events()
+
+    # -------------------------------------------------
+    # Internals (lock held)
+    # -------------------------------------------------
+
+    def _current_state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self.open_duration:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _push(self, failed: bool, slow: bool) -> None:
+        if len(self._window) == self._window.maxlen:
+            old_failed, old_slow = self._window[0]
+            self._failures -= old_failed
+            self._slow -= old_slow
+        self._window.append((failed, slow))
+        self._failures += failed
+        self._slow += slow
+
+    def _should_open(self) -> bool:
+        calls = len(self._window)
+        if calls < self.minimum_calls:
+            return False
+        return (
+            self._failures / calls >= self.failure_rate_threshold
+            or self._slow / calls >= self.slow_call_rate_threshold
+        )
+
+    def _transition(self, new_state: CircuitState) -> None:
+        self._pending.append((self._state, new_state))
+        self._state = new_state
+        self._transitions[new_state.value] += 1
+        if new_state is CircuitState.OPEN:
+            self._opened_at = self._clock()
+        elif new_state is CircuitState.HALF_OPEN:
+            self._trial_permits = 0
+            self._trial_successes = 0
+        else:
+            self._window.clear()
+            self._failures = 0
+            self._slow = 0
+
+    def _flush_events(self) -> None:
+        if not self._pending:
+            return
+        with self._lock:
+            events, self._pending = self._pending, []
+        for old_state, new_state in events:
+            logger.warning("Circuit '%s': %s -> %s", self.name, old_state.value, new_state.value)
+            for listener in self._listeners:
+                try:
+                    listener(self, old_state, new_state)
+                except Exception:
+                    logger.exception("Circuit '%s' listener failed", self.name)
+
+    # -------------------------------------------------
+    # Metrics
+    # -------------------------------------------------
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            state = self._current_state()
+            calls = len(self._window)
+            snapshot = {
+                "name": self.name,
+                "state": state.value,
+                "window_calls": calls,
+                "failure_rate": round(self._failures / calls, 3) if calls else 0.0,
+                "slow_call_rate": round(self._slow / calls, 3) if calls else 0.0,
+                "calls": self._calls,
+                "rejected": self._rejected,
+                "transitions": dict(self._transitions),
+            }
+        self._flush_events()
+        return snapshot
+
+
+_registry: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(base_url: str) -> Optional[CircuitBreaker]:
+    """
+    The process-wide breaker shared by every client of `base_url`
+    (None when CIRCUIT_BREAKER_ENABLED is off).
+    """
+    if not CIRCUIT_BREAKER_ENABLED:
+        return None
+    key = base_url.rstrip("/")
+    with _registry_lock:
+        breaker = _registry.get(key)
+        if breaker is None:
+            breaker = _registry[key] = CircuitBreaker(key)
+        return breaker
+
+
+def circuit_breakers() -> Dict[str, CircuitBreaker]:
+    with _registry_lock:
+        return dict(_registry)
+
+
+def reset_circuit_breakers() -> None:
+    """
+    Forgets every shared breaker, so the next clients start from closed ones
+    (e.g. between tests).
+    """
+    with _registry_lock:
+        _registry.clear()
+
+
+def resolve_circuit_breaker(circuit_breaker: Union[CircuitBreaker, bool, None], base_url: str) -> Optional[CircuitBreaker]:
+    """
+    The clients' `circuit_breaker=` argument:
+    - None  -> the shared breaker of `base_url` (get_circuit_breaker)
+    - False -> no breaker for this client
+    - a CircuitBreaker -> that one
+    """
+    if circuit_breaker is None:
+        return get_circuit_breaker(base_url)
+    if circuit_breaker is False:
+        return None
+    return circuit_breaker
@@ -1,23 +1,84 @@
 from mockapi_client.logger import get_logger
+import threading
+import weakref
 import requests
-from time import sleep
-from typing import Dict, List, Optional, Any
-from requests.exceptions import HTTPError
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Union
+from requests.adapters import HTTPAdapter
+from .bulk import BulkResult, map_threads
+from .cache import MISSING, TTLCache
+from .circuit_breaker import CircuitBreaker, resolve_circuit_breaker
+from .codec import JsonCodec
+from .rate_limiter import RateLimiter
 from .decorators import retry_on_failure
-from .config import BASE_URL, DEFAULT_TIMEOUT, TOKEN
+from .metrics import ClientMetrics, default_metrics
+from .protocol import ApiCall, UsersProtocol
+from .retry import RetryPolicy
+from .streaming import iter_json_array
+from .tracing import span
+from .waiters import Condition, WaitOutcome, Waiter, deleted, legacy_timeout
+from .config import BASE_URL, DEFAULT_TIMEOUT, SYNC_MAX_WORKERS, TOKEN, WAIT_TIMEOUT
 
 logger = get_logger(__name__)
 
 
+class _ThreadSessionOwner:
+    """
+    Kept only in the client's thread-local storage: it is collected when its
+    thread exits, which releases (and closes) that thread's session.
+    """
+    __slots__ = ("session", "__weakref__")
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+
+def _release_thread_session(sessions: Dict[int, requests.Session], lock, key: int, close: bool) -> None:
+    with lock:
+        session = sessions.pop(key, None)
+    if session is not None and close:
+        session.close()
+
+
 class UsersApiClient:
     """
        Users API client.
 
-       Design contract:
+       Design contract (shared with AsyncUsersApiClient, see protocol.UsersProtocol):
        - 2xx  -> returns parsed JSON (or None if empty)
-       - 404  -> returns None
+       - 404  -> returns None ([] for list calls)
        - 4xx  -> raises HTTPError
-       - 5xx  -> raises HTTPError (retryable)
+       - 5xx  -> raises HTTPError (429/500/502/503/504 are retried)
+
+       Retries (retry_policy=RetryPolicy(...), default per decorator):
+       - timeouts, connection errors and 429/5xx only, with jittered backoff
+       - Retry-After is honoured; all retries draw from the process-wide retry budget
+
+       Threading:
+       - thread_safe=False -> one shared session (adapter pool sized to max_workers)
+       - thread_safe=True  -> one session per thread, created on first use and closed
+                              when the thread exits (or on close(), whichever comes first)
+       - map_* helpers always run on a managed pool whose threads own their sessions
+
+       Caching (opt-in, cache=TTLCache(...)):
+       - get_user reads through the cache (404s are cached negatively)
+       - patch_user writes through, delete_user evicts
+
+       Circuit breaker (circuit_breaker=CircuitBreaker(...), default shared per base URL, False to disable):
+       - every attempt is admitted by the breaker; transport errors and 5xx count as failures
+       - while open, calls raise CircuitOpenError immediately (never retried)
+
+       Pacing (opt-in, rate_limiter=RateLimiter(...), shareable across clients/threads):
+       - every attempt (retries included) waits for a token before it is sent
+
+       Metrics (metrics=ClientMetrics(...), default: the process-wide registry):
+       - every attempt records latency, status or error kind and bytes per method/endpoint
+       - decorated methods record attempts and retries per operation
+
+       JSON (codec=JsonCodec, default: orjson / msgspec / stdlib, see mockapi_client.codec):
+       - payloads are encoded to bytes and responses decoded from bytes, skipping requests' str round trip
     """
 
     def __init__(
@@ -25,16 +86,103 @@ class UsersApiClient:
             base_url: str = BASE_URL,
             timeout: int = DEFAULT_TIMEOUT,
             session: Optional[requests.Session] = None,
+            thread_safe: bool = False,
+            max_workers: int = SYNC_MAX_WORKERS,
+            cache: Optional[TTLCache] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            circuit_breaker: Union[CircuitBreaker, bool, None] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            metrics: Optional[ClientMetrics] = None,
+            codec: Optional[JsonCodec] = None,
     ):
-        self.base_url = base_url.rstrip('/')
+        self.protocol = UsersProtocol(base_url, codec)
+        self.base_url = self.protocol.base_url
         self.timeout = timeout
-        self.session = session or requests.Session()
-        self.session.headers.update(
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.circuit_breaker = resolve_circuit_breaker(circuit_breaker, self.base_url)
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics or default_metrics()
+        self.thread_safe = thread_safe
+        self.max_workers = max_workers
+        self._custom_session = session
+        self._local = threading.local()
+        # Live per-thread sessions, by key; entries are dropped when their thread exits
+        self._thread_sessions: Dict[int, requests.Session] = {}
+        self._thread_keys = count()
+        # Reentrant: a thread-exit finalizer may run (via GC) while this thread holds it
+        self._lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Shared session: one pool used by every thread, so it holds up to max_workers connections
+        self._session = self._configure_session(session or requests.Session(), pool_maxsize=self.max_workers)
+
+    # -------------------------------------------------
+    # Session management
+    # -------------------------------------------------
+
+    @property
+    def session(self) -> requests.Session:
+        owner = getattr(self._local, "owner", None)
+        if owner is not None:
+            return owner.session
+        if not self.thread_safe:
+            return self._session
+        return self._bind_thread_session()
+
+    def _configure_session(self, session: requests.Session, pool_maxsize: int) -> requests.Session:
+        session.headers.update(
             {
                 "Authorization": f"Bearer {TOKEN}",
                 "Content-Type": "application/json"
             }
         )
+        if self._custom_session is None:
+            # requests' default pool keeps 10 connections per host and discards the rest
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        return session
+
+    def _bind_thread_session(self) -> requests.Session:
+        session = requests.Session()
+        if self._custom_session is not None:
+            # Reuse the caller's adapters (e.g. custom transports); urllib3 pools are thread-safe
+            session.headers.update(self._custom_session.headers)
+            for prefix, adapter in self._custom_session.adapters.items():
+                session.mount(prefix, adapter)
+        # A thread sends one request at a time; a second connection covers a stream read alongside
+        session = self._configure_session(session, pool_maxsize=2)
+
+        key = next(self._thread_keys)
+        owner = _ThreadSessionOwner(session)
+        with self._lock:
+            self._thread_sessions[key] = session
+        # The caller's adapters are shared by every thread: only our own are closed with the thread
+        weakref.finalize(
+            owner, _release_thread_session, self._thread_sessions, self._lock, key, self._custom_session is None,
+        )
+        self._local.owner = owner
+        return session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="users-api",
+                    initializer=self._bind_thread_session,
+                )
+            return self._executor
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            sessions = [self._session, *self._thread_sessions.values()]
+            self._thread_sessions.clear()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
 
     # -------------------------------------------------
     # Context manager support
@@ -44,49 +192,57 @@ class UsersApiClient:
         return self
 
     def __exit__(self, *args):
-        self.session.close()
+        self.close()
 
     # -------------------------------------------------
     # Core request handler
     # -------------------------------------------------
 
-    def _request(
-            self,
-            method: str,
-            endpoint: str = "",
-            **kwargs
-    ) -> Optional[Any]:
-        url = f"{self.base_url}/{endpoint}".rstrip("/")
-        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
-
-        # # Handle specific MockAPI 500 behaviors
-        # if response.status_code >= 500:
-        #     raise HTTPError(f"Server Error: {response.status_code}", response=resp)
-
-        # Explicit 404 contract
-        if response.status_code == 404:
-            return None
-
-        # Raise for any other error (4xx / 5xx)
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method)
+        with span("http", method=method, url=url) as current:
+            response = self._transmit(method, url, **kwargs)
+            current.set(status=response.status_code)
+        return response
+
+    def _transmit(self, method: str, url: str, **kwargs) -> requests.Response:
+        breaker = self.circuit_breaker
+        metrics = self.metrics
+        if breaker is None and metrics is None:
+            return self.session.request(method, url, timeout=self.timeout, **kwargs)
+
+        if breaker is not None:
+            breaker.before_call()
+        started = perf_counter()
         try:
-            response.raise_for_status()
-        except HTTPError as exc:
-            logger.error(
-                "HTTP error",
-                extra={
-                    "method": method,
-                    "url": url,
-                    "status": response.status_code,
-                    "body": response.text,
-                },
-            )
-            raise exc
-
-        # Successful response
-        if not response.content:
-            return None
-
-        return response.json()
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except Exception as exc:
+            self.protocol.on_error(breaker, metrics, method, url, exc, perf_counter() - started)
+            raise
+        elapsed = perf_counter() - started
+        body = response.request.body if response.request is not None else None
+        # Streamed bodies are not read here; fall back to the declared length
+        received = int(response.headers.get("Content-Length") or 0) if kwargs.get("stream") else len(response.content)
+        self.protocol.on_response(
+            breaker, metrics, method, url, response.status_code, elapsed,
+            sent=len(body) if body else 0, received=received,
+        )
+        return response
+
+    def _execute(self, call: ApiCall, cache: Optional[TTLCache] = None) -> Any:
+        """
+        Sync driver for one call: cache hooks, one request, contract from UsersProtocol.
+        """
+        since = self.protocol.cache_version(cache)
+        cached = self.protocol.cache_lookup(call, cache)
+        if cached is not MISSING:
+            return cached
+        # The session already sends Content-Type: application/json
+        response = self._send(call.method, call.url, params=call.params, data=self.protocol.encode(call))
+        result = self.protocol.interpret(call, response.status_code, response.content, response.raise_for_status)
+        self.protocol.cache_store(call, cache, result, since)
+        return result
 
     # -------------------------------------------------
     # API methods
@@ -94,48 +250,131 @@ class UsersApiClient:
 
     @retry_on_failure()
     def create_user(self, user_data: Dict) -> Dict:
-        return self._request("POST", json=user_data)
+        return self._execute(self.protocol.create_user(user_data))
 
     @retry_on_failure()
     def get_user(self, user_id: str) -> Optional[Dict]:
-        return self._request("GET", endpoint=user_id)
+        return self._execute(self.protocol.get_user(user_id), self.cache)
 
     @retry_on_failure()
     def patch_user(self, user_id: str, partial_data: Dict) -> Dict:
-        return self._request("PATCH", endpoint=user_id, json=partial_data)
+        return self._execute(self.protocol.patch_user(user_id, partial_data), self.cache)
 
     @retry_on_failure()
     def delete_user(self, user_id: str) -> bool:
-        self._request("DELETE", endpoint=user_id)
+        self._execute(self.protocol.delete_user(user_id), self.cache)
         return True
 
     @retry_on_failure()
     def list_users(self) -> List[Dict]:
-        return self._request("GET") or []
+        return self._execute(self.protocol.list_users())
+
+    @retry_on_failure()
+    def list_users_page(self, page: int, limit: int, **filters) -> List[Dict]:
+        """
+        One page of users using MockAPI's `page` / `limit` query parameters.
+        Extra keyword arguments are passed through as field filters (e.g. name="user_").
+        """
+        return self._execute(self.protocol.list_users_page(page, limit, **filters))
+
+    def iter_users(self, page_size: int = 100, **filters) -> Iterator[Dict]:
+        """
+        Lazily yields users page by page, holding at most one page in memory.
+        Stops at the first short (or empty) page.
+
+        Pairs with `core.normalizers.iter_normalize_users` for streaming normalization.
+        """
+        page = 1
+        while True:
+            batch = self.list_users_page(page, page_size, **filters)
+            yield from batch
+            if len(batch) < page_size:
+                return
+            page += 1
+
+    def stream_users(self, chunk_size: int = 64 * 1024, **params) -> Iterator[Dict]:
+        """
+        Streams the users collection, yielding each user as soon as it is parsed
+        from the response body; memory stays flat regardless of collection size.
+        Keyword arguments are sent as query parameters (page, limit, filters).
+
+        Not retried: a retry mid-stream would repeat users. A 404 yields nothing.
+
+        Pairs with `core.normalizers.iter_normalize_users` and
+        `core.validators.iter_validate_users` for a fully streaming pipeline.
+        """
+        call = self.protocol.stream_users(**params)
+        response = self._send(call.method, call.url, params=call.params, stream=True)
+        with response:
+            if self.protocol.check_status(call, response.status_code, response.raise_for_status):
+                yield from iter_json_array(response.iter_content(chunk_size))
+
+    # -------------------------------------------------
+    # Bulk operations (managed thread pool)
+    # -------------------------------------------------
+
+    def map_create(self, payloads: Iterable[Dict], max_workers: Optional[int] = None) -> List[BulkResult]:
+        """
+        Creates every payload on the managed thread pool.
+        Returns one BulkResult per payload, in input order.
+        """
+        return map_threads(self._get_executor(), self.create_user, payloads, max_workers or self.max_workers)
+
+    def map_get(self, user_ids: Iterable[str], max_workers: Optional[int] = None) -> List[BulkResult]:
+        return map_threads(self._get_executor(), self.get_user, user_ids, max_workers or self.max_workers)
+
+    def map_delete(self, user_ids: Iterable[str], max_workers: Optional[int] = None) -> List[BulkResult]:
+        return map_threads(self._get_executor(), self.delete_user, user_ids, max_workers or self.max_workers)
 
     # -------------------------------------------------
     # Utility helpers (non-contractual)
     # -------------------------------------------------
 
     def get_user_status(self, user_id):
-        url = f"{self.base_url}/{user_id}"
-        response = self.session.get(url, timeout=self.timeout)
+        response = self.session.get(self.protocol.url(user_id), timeout=self.timeout)
         return response.status_code
 
-    def wait_until_deleted(self, user_id: str, retries: int = 5, delay: int = 1) -> bool:
+    def _fetch_uncached(self, user_id: str) -> Optional[Dict]:
+        # Waiters must observe the server, never the read-through cache
+        return self._execute(self.protocol.get_user(user_id))
+
+    def wait_for(
+            self,
+            user_ids: Iterable[str],
+            condition: Condition,
+            timeout: float = WAIT_TIMEOUT,
+            max_workers: Optional[int] = None,
+    ) -> Dict[str, WaitOutcome]:
+        """
+        Polls every ID until `condition(user_or_None)` holds or `timeout` passes.
+        IDs are polled concurrently on the managed pool; returns a WaitOutcome per ID.
+        """
+        waiter = Waiter(condition, timeout=timeout, concurrency=max_workers or self.max_workers)
+        user_ids = list(user_ids)
+        executor = self._get_executor() if len(user_ids) > 1 else None
+        return waiter.run(self._fetch_uncached, user_ids, executor)
+
+    def wait_until_deleted(
+            self,
+            user_id: str,
+            timeout: float = WAIT_TIMEOUT,
+            *,
+            retries: Optional[int] = None,
+            delay: Optional[float] = None,
+    ) -> bool:
         """
         Polls until the user is no longer found.
-        Returns True if deletion is confirmed.
+        Returns True if deletion is confirmed before `timeout`.
+        `retries` / `delay` are deprecated: they still work (timeout = retries * delay)
+        but emit a DeprecationWarning.
         """
-        for attempt in range(1, retries + 1):
-            status = self.get_user_status(user_id)
-            if status == 404:
-                return True
-
-            logger.debug(
-                f"Waiting for deletion of user {user_id} "
-                f"(attempt {attempt}/{retries})"
-            )
-            sleep(delay)
-
-        return False
+        timeout = legacy_timeout(timeout, retries, delay)
+        return self.wait_for([user_id], deleted, timeout)[user_id].satisfied
+
+    def wait_until_all_deleted(
+            self,
+            user_ids: Iterable[str],
+            timeout: float = WAIT_TIMEOUT,
+            max_workers: Optional[int] = None,
+    ) -> Dict[str, WaitOutcome]:
+        return self.wait_for(user_ids, deleted, timeout, max_workers)
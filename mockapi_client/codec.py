@@ -0,0 +1,118 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+from .config import JSON_CODEC
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonCodec:
+    """
+    JSON straight to and from bytes, so bodies never take a detour through str.
+
+    - name   -> backend in use: "orjson", "msgspec" or "json" (stdlib)
+    - dumps  -> obj -> compact UTF-8 bytes
+    - loads  -> bytes (or str) -> obj; malformed input raises ValueError
+
+    The fast backends hand anything they cannot represent (non-str keys, ints
+    beyond 64 bits, ...) to the stdlib, so every codec accepts the same documents.
+    """
+    __slots__ = ("name", "dumps", "loads")
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[JsonInput], Any]):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+_std_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _std_dumps(obj: Any) -> bytes:
+    return _std_encoder.encode(obj).encode("utf-8")
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec("json", _std_dumps, json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return _std_dumps(obj)
+
+    def loads(data: JsonInput) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Re-parse with the stdlib: it accepts big ints, and raises the usual error otherwise
+            return json.loads(data)
+
+    return JsonCodec("orjson", dumps, loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encode = msgspec.json.Encoder().encode
+    decode = msgspec.json.Decoder().decode
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return encode(obj)
+        except (TypeError, OverflowError):
+            return _std_dumps(obj)
+
+    def loads(data: JsonInput) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError:
+            return json.loads(data)
+
+    return JsonCodec("msgspec", dumps, loads)
+
+
+_BACKENDS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """
+    Codec for `name`: "orjson", "msgspec", "json", or "auto" (the first one installed,
+    in that order). Naming a backend that is not installed raises ImportError.
+    """
+    if name == "auto":
+        for backend in ("orjson", "msgspec"):
+            try:
+                return _BACKENDS[backend]()
+            except ImportError:
+                continue
+        return _stdlib_codec()
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown JSON codec: {name!r} (expected one of auto, {', '.join(_BACKENDS)})")
+    return _BACKENDS[name]()
+
+
+def _default_codec() -> JsonCodec:
+    try:
+        return get_codec(JSON_CODEC)
+    except ImportError:
+        logger.warning("JSON_CODEC=%s is not installed, using the fastest available codec", JSON_CODEC)
+        return get_codec("auto")
+
+
+# Process-wide default, used by both clients and the normalizers unless they are given their own
+CODEC = _default_codec()
@@ -5,4 +5,65 @@ load_dotenv()
 
 BASE_URL = os.getenv("BASE_URL")
 TOKEN = os.getenv("API_TOKEN")
-DEFAULT_TIMEOUT = 10
\ No newline at end of file
+DEFAULT_TIMEOUT = 10
+
+# Run against the bundled local stand-in server (mockapi_client.local_server).
+# Enabled explicitly with MOCKAPI_LOCAL=1, or implicitly when no BASE_URL is configured.
+USE_LOCAL_SERVER = os.getenv("MOCKAPI_LOCAL", "").lower() in ("1", "true", "yes") or not BASE_URL
+
+# Max in-flight requests for bulk operations (create_users, get_users, ...)
+BULK_CONCURRENCY = int(os.getenv("BULK_CONCURRENCY", "10"))
+
+# Sync client: managed thread pool size (also sizes the HTTPAdapter connection pool)
+SYNC_MAX_WORKERS = int(os.getenv("SYNC_MAX_WORKERS", "10"))
+
+# Async client connection pool (httpx.Limits) and protocol settings
+ASYNC_MAX_CONNECTIONS = int(os.getenv("ASYNC_MAX_CONNECTIONS", "100"))
+ASYNC_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("ASYNC_MAX_KEEPALIVE_CONNECTIONS", "20"))
+ASYNC_KEEPALIVE_EXPIRY = float(os.getenv("ASYNC_KEEPALIVE_EXPIRY", "5.0"))
+ASYNC_HTTP2 = os.getenv("ASYNC_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Process-wide retry budget (mockapi_client.retry.RetryBudget): retries allowed per
+# original call, plus a floor of retries per second for low-traffic callers
+RETRY_BUDGET_RATIO = float(os.getenv("RETRY_BUDGET_RATIO", "0.2"))
+RETRY_BUDGET_MIN_PER_SECOND = float(os.getenv("RETRY_BUDGET_MIN_PER_SECOND", "10"))
+
+# Circuit breaker shared by all clients of one base URL (mockapi_client.circuit_breaker)
+CIRCUIT_BREAKER_ENABLED = os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() in ("1", "true", "yes")
+CIRCUIT_FAILURE_RATE = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_SLOW_CALL_RATE = float(os.getenv("CIRCUIT_SLOW_CALL_RATE", "1.0"))
+CIRCUIT_SLOW_CALL_SECONDS = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "5.0"))
+CIRCUIT_WINDOW_SIZE = int(os.getenv("CIRCUIT_WINDOW_SIZE", "20"))
+CIRCUIT_MINIMUM_CALLS = int(os.getenv("CIRCUIT_MINIMUM_CALLS", "10"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "10.0"))
+
+# Client-side pacing (mockapi_client.rate_limiter.RateLimiter); 0 disables the default limiter
+RATE_LIMIT_RPS = float(os.getenv("RATE_LIMIT_RPS", "0"))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "10"))
+
+# Default deadline (seconds) for consistency waits (mockapi_client.waiters)
+WAIT_TIMEOUT = float(os.getenv("WAIT_TIMEOUT", "10.0"))
+
+# Request metrics (mockapi_client.metrics): clients feed the process-wide registry unless disabled
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Logging (mockapi_client.logger.configure_logging)
+# - LOG_FORMAT: "color" (default, colorized console), "text" or "json" (one JSON object per line)
+# - LOG_QUEUE: hand records to a background listener thread instead of writing in the caller
+# - LOG_REPEAT_LIMIT: at most this many identical warnings per LOG_REPEAT_INTERVAL seconds (0 = unlimited)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "color").lower()
+LOG_QUEUE = os.getenv("LOG_QUEUE", "false").lower() in ("1", "true", "yes")
+LOG_REPEAT_LIMIT = int(os.getenv("LOG_REPEAT_LIMIT", "0"))
+LOG_REPEAT_INTERVAL = float(os.getenv("LOG_REPEAT_INTERVAL", "10.0"))
+
+# Tracing (mockapi_client.tracing): off unless TRACE_FILE is set; TRACE_FORMAT is "jsonl" or "chrome"
+TRACE_FILE = os.getenv("TRACE_FILE")
+TRACE_FORMAT = os.getenv("TRACE_FORMAT", "jsonl").lower()
+
+# JSON codec for request/response bodies (mockapi_client.codec): "auto" (orjson, then msgspec, then the
+# stdlib, whichever is installed first), or force "orjson" / "msgspec" / "json"
+JSON_CODEC = os.getenv("JSON_CODEC", "auto").lower()
+
+# Test data (mockapi_client.factory.UserFactory): set FACTORY_SEED for deterministic user names
+# (per xdist worker); unset, every run gets a random name prefix
+FACTORY_SEED = os.getenv("FACTORY_SEED")
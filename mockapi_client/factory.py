@@ -1,22 +1,109 @@
-from uuid import uuid4
+import hashlib
+import os
+import re
+from itertools import count
+from typing import Dict, Iterator, Optional, Tuple
+
+from mockapi_client.config import FACTORY_SEED
+
+
+def _worker_id() -> str:
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def _random_prefix() -> str:
+    return os.urandom(4).hex()
+
+
+# Process-wide naming state, read when a name is generated (never copied into factories):
+# - _run_prefix: random prefix shared by every unseeded factory
+# - _counters:   one counter per prefix, so factories with the same seed or prefix never repeat a name
+# - _fork_salt:  mixed into seeded prefixes in a forked child, so it does not replay its parent's names
+_run_prefix = _random_prefix()
+_counters: Dict[str, Iterator[int]] = {}
+_seeded_prefixes: Dict[str, str] = {}
+_fork_salt = ""
+
+
+def _reset_run_after_fork():
+    global _run_prefix, _fork_salt
+    _run_prefix = _random_prefix()
+    _fork_salt = f":{os.getpid()}"
+    _counters.clear()
+    _seeded_prefixes.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_run_after_fork)
+
+
+def _seeded_prefix(seed) -> str:
+    # Same seed -> same prefix per xdist worker, different prefixes across workers
+    key = f"{seed}:{_worker_id()}{_fork_salt}"
+    prefix = _seeded_prefixes.get(key)
+    if prefix is None:
+        prefix = _seeded_prefixes.setdefault(key, hashlib.blake2b(key.encode(), digest_size=4).hexdigest())
+    return prefix
+
+
+def _counter(prefix: str) -> Iterator[int]:
+    # setdefault is atomic under the GIL: threads racing on a new prefix end up with the same counter
+    counter = _counters.get(prefix)
+    if counter is None:
+        counter = _counters.setdefault(prefix, count())
+    return counter
 
 
 class UserFactory:
     """
     Generates guaranteed unique user data for testing.
+
+    Names are `user_<prefix>_<n>`: an 8-hex prefix per run plus a counter.
+    - UserFactory()            -> random per-process prefix
+    - UserFactory(seed=42)     -> deterministic prefix derived from the seed and xdist worker
+    - UserFactory(prefix="..") -> explicit 8-hex prefix
+
+    Factories with the same prefix share one process-wide counter, so any number of
+    instances (e.g. two built with the same FACTORY_SEED) never repeat a name. The
+    prefix and counter are looked up when a name is made: after a fork, existing
+    factories in the child switch to a fresh run prefix, and seeded ones to a prefix
+    salted with the child's pid (an explicit prefix is only unique within one process).
+
+    Uniqueness comes from the counter, not from remembering issued names, so memory
+    stays constant however many payloads are made. next() on itertools.count is atomic
+    under the GIL, so one factory can be shared across threads.
+
+    Every generated name matches NAME_PATTERN, which lets cleanup tooling find
+    records left behind by crashed runs (see tests/janitor.py).
     """
 
-    def __init__(self):
-        # Tracking used names to ensure uniqueness during a single test run
-        self._used_names = set()
+    NAME_PREFIX = "user_"
+    # The bare "user_<8 hex>" form is what earlier versions generated; kept so old orphans are swept too
+    NAME_PATTERN = re.compile(r"user_[0-9a-f]{8}(?:_\d+)?")
+    EMAIL_DOMAIN = "@example.com"
+
+    def __init__(self, seed=None, prefix: Optional[str] = None):
+        if prefix is not None and not re.fullmatch(r"[0-9a-f]{8}", prefix):
+            raise ValueError(f"prefix must be 8 lowercase hex digits, got {prefix!r}")
+        self._prefix = prefix
+        self._seed = FACTORY_SEED if seed is None else seed
+
+    @property
+    def prefix(self) -> str:
+        if self._prefix is not None:
+            return self._prefix
+        if self._seed is not None:
+            return _seeded_prefix(self._seed)
+        return _run_prefix
+
+    def _naming(self) -> Tuple[str, Iterator[int]]:
+        prefix = self.prefix
+        return f"{self.NAME_PREFIX}{prefix}_", _counter(prefix)
 
     def _generate_unique_name(self) -> str:
-        while True:
-            # Generate a short unique identifier
-            name = f"user_{uuid4().hex[:8]}"
-            if name not in self._used_names:
-                self._used_names.add(name)
-                return name
+        # _naming() inlined: this runs once per payload
+        prefix = self._prefix or (_run_prefix if self._seed is None else _seeded_prefix(self._seed))
+        return f"{self.NAME_PREFIX}{prefix}_{next(_counters.get(prefix) or _counter(prefix))}"
 
     def create_user_payload(self, **overrides) -> dict:
         """
@@ -26,12 +113,28 @@ class UserFactory:
         username = self._generate_unique_name()
         base_payload = {
             "name": username,
-            "email": f"{username}@example.com"
+            "email": username + self.EMAIL_DOMAIN
         }
-        return base_payload | overrides
+        return base_payload | overrides if overrides else base_payload
+
+    def create_user_payloads(self, n: int, **overrides) -> Iterator[dict]:
+        """
+        Lazily yields `n` payloads, same shape as create_user_payload.
+        Nothing is kept between items, so memory does not grow with `n`.
+        The prefix is looked up once, when iteration starts.
+        """
+        (head, counter), domain = self._naming(), self.EMAIL_DOMAIN
+        # range() comes first in zip, so the counter is not advanced past the n-th name
+        if overrides:
+            for _, i in zip(range(n), counter):
+                name = f"{head}{i}"
+                yield {"name": name, "email": name + domain} | overrides
+        else:
+            for _, i in zip(range(n), counter):
+                name = f"{head}{i}"
+                yield {"name": name, "email": name + domain}
 
     def reset(self):
         """
-        Clear the history of used names.
+        Kept for compatibility: no names are tracked any more, so there is nothing to clear.
         """
-        self._used_names.clear()
@@ -0,0 +1,468 @@
+"""
+Load generator for the users API, built on AsyncUsersApiClient.
+
+- --rate R         -> open loop: requests start on a fixed (or --arrivals poisson)
+                      schedule of R/s, whether or not earlier ones have finished
+- --concurrency N  -> closed loop: N workers, each sending its next request when
+                      the previous one completes
+
+Each request draws its operation from a weighted --mix of create / get / patch /
+delete / list; get, patch and delete target users created earlier in the run
+(a create is sent instead while there are none).
+
+Open-loop latency is measured from the *scheduled* start, so a slow backend shows
+up as queueing delay instead of silently lowering the send rate (coordinated
+omission); `service` is the time from the actual send. Arrivals that would exceed
+--max-in-flight are dropped and counted. Throughput and percentiles are logged
+every --interval seconds; the final report is printed (and written with --output)
+as JSON. Users still alive at the end are deleted unless --keep-users. The
+client's circuit breaker and read coalescing stay off unless --circuit-breaker /
+--coalesce-reads, so every scheduled request reaches the server.
+
+    python -m mockapi_client.load --local --rate 200 --duration 30 --output load.json
+    python -m mockapi_client.load --local --latency-ms 20 --concurrency 50 --mix get=8,create=1,delete=1
+    python -m mockapi_client.load --rate 5 --duration 60   # real BASE_URL: mind MockAPI's rate limits
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from itertools import accumulate
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from .async_client import AsyncUsersApiClient
+from .config import BASE_URL, LOG_FORMAT, USE_LOCAL_SERVER
+from .factory import UserFactory
+from .local_server import Fixed, LocalUsersServer, UsersBackend
+from .logger import configure_logging, get_logger
+from .metrics import ClientMetrics, Histogram, error_kind
+
+logger = get_logger(__name__)
+
+OPERATIONS = ("create", "get", "patch", "delete", "list")
+DEFAULT_MIX = "create=2,get=5,patch=2,delete=1,list=1"
+
+# Geometric buckets, 0.5 ms .. ~58 s at 20% steps: percentiles within ~10%, fixed memory
+LATENCY_BUCKETS = tuple(round(0.0005 * 1.2 ** i, 6) for i in range(65))
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    "create=2,get=5" -> {"create": 2.0, "get": 5.0}. Operations left out get no traffic.
+
+    Raises:
+        ValueError: On unknown operations, negative weights or an all-zero mix.
+    """
+    mix = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        op, _, weight = item.partition("=")
+        op = op.strip()
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown operation {op!r} in mix (expected one of {', '.join(OPERATIONS)})")
+        mix[op] = float(weight) if weight else 1.0
+        if mix[op] < 0:
+            raise ValueError(f"Negative weight for {op!r}")
+    if not any(mix.values()):
+        raise ValueError("The operation mix has no positive weight")
+    return mix
+
+
+def _summary(histogram: Histogram) -> Dict[str, Any]:
+    summary = {k: v for k, v in histogram.snapshot().items() if k not in ("buckets", "sum")}
+    summary["p90_ms"] = round(histogram.quantile(0.90) * 1000, 3)
+    summary["p999_ms"] = round(histogram.quantile(0.999) * 1000, 3)
+    return summary
+
+
+class LoadStats:
+    """
+    Per-operation latency (from the scheduled start) and service time (from the
+    actual send) histograms, error counts by kind, and a rolling window for the live
+    report. Only touched from the event loop, so not locked.
+    """
+
+    def __init__(self):
+        self.latency = {op: Histogram(LATENCY_BUCKETS) for op in OPERATIONS}
+        self.service = {op: Histogram(LATENCY_BUCKETS) for op in OPERATIONS}
+        self.errors: Dict[str, Dict[str, int]] = {op: {} for op in OPERATIONS}
+        self.scheduled = 0
+        self.dropped = 0
+        self.window = Histogram(LATENCY_BUCKETS)
+        self.window_errors = 0
+
+    def record(self, op: str, scheduled: float, started: float, finished: float,
+               error: Optional[BaseException] = None) -> None:
+        self.latency[op].observe(finished - scheduled)
+        self.service[op].observe(finished - started)
+        self.window.observe(finished - scheduled)
+        if error is not None:
+            kind = error_kind(error)
+            if isinstance(error, httpx.HTTPStatusError):
+                kind = f"http_{error.response.status_code}"
+            self.errors[op][kind] = self.errors[op].get(kind, 0) + 1
+            self.window_errors += 1
+
+    def take_window(self):
+        window, errors = self.window, self.window_errors
+        self.window, self.window_errors = Histogram(LATENCY_BUCKETS), 0
+        return window, errors
+
+    @property
+    def completed(self) -> int:
+        return sum(h.count for h in self.latency.values())
+
+    @property
+    def failed(self) -> int:
+        return sum(sum(kinds.values()) for kinds in self.errors.values())
+
+
+class LoadGenerator:
+    """
+    Drives one AsyncUsersApiClient with a weighted operation mix, either open loop
+    (`rate` arrivals per second) or closed loop (`concurrency` workers), for
+    `duration` seconds. run() returns the JSON-ready report.
+    """
+
+    def __init__(
+            self,
+            api: AsyncUsersApiClient,
+            mix: Dict[str, float],
+            duration: float,
+            rate: Optional[float] = None,
+            concurrency: Optional[int] = None,
+            arrivals: str = "constant",
+            max_in_flight: int = 1000,
+            interval: float = 5.0,
+            seed: Optional[int] = None,
+            factory: Optional[UserFactory] = None,
+    ):
+        if (rate is None) == (concurrency is None):
+            raise ValueError("Pass exactly one of rate (open loop) or concurrency (closed loop)")
+        if arrivals not in ("constant", "poisson"):
+            raise ValueError(f"Unknown arrival process: {arrivals!r}")
+        self.api = api
+        self.mix = {op: weight for op, weight in mix.items() if weight > 0}
+        self.duration = duration
+        self.rate = rate
+        self.concurrency = concurrency
+        self.arrivals = arrivals
+        self.max_in_flight = max_in_flight
+        self.interval = interval
+        self.stats = LoadStats()
+        self.intervals: List[Dict[str, Any]] = []
+        self.user_ids: List[str] = []
+        self._rng = random.Random(seed)
+        self._ops = list(self.mix)
+        self._cum_weights = list(accumulate(self.mix.values()))
+        self._payloads = (factory or UserFactory()).create_user_payloads(sys.maxsize)
+        self._in_flight = 0
+        self._started = 0.0
+
+    # -------------------------------------------------
+    # Operations
+    # -------------------------------------------------
+
+    def _pick(self) -> str:
+        op = self._rng.choices(self._ops, cum_weights=self._cum_weights)[0]
+        if op in ("get", "patch", "delete") and not self.user_ids:
+            return "create"
+        return op
+
+    def _take_user(self, remove: bool) -> str:
+        ids = self.user_ids
+        index = self._rng.randrange(len(ids))
+        if not remove:
+            return ids[index]
+        # Swap-remove: O(1), and no other request can pick a user being deleted
+        ids[index], ids[-1] = ids[-1], ids[index]
+        return ids.pop()
+
+    async def _call(self, op: str) -> None:
+        if op == "create":
+            created = await self.api.create_user(next(self._payloads))
+            if not isinstance(created, dict) or "id" not in created:
+                raise ValueError(f"create_user returned no user: {created!r}")
+            self.user_ids.append(created["id"])
+        elif op == "get":
+            await self.api.get_user(self._take_user(remove=False))
+        elif op == "patch":
+            await self.api.patch_user(self._take_user(remove=False), {"name": next(self._payloads)["name"]})
+        elif op == "delete":
+            await self.api.delete_user(self._take_user(remove=True))
+        else:
+            await self.api.list_users_page(self._rng.randint(1, 5), 20)
+
+    async def _one(self, scheduled: float) -> None:
+        """
+        One request; the caller has already counted it in `_in_flight`.
+        """
+        # Picked at send time, so the user pool reflects every request that completed before
+        op = self._pick()
+        started = time.perf_counter()
+        error = None
+        try:
+            await self._call(op)
+        except Exception as e:
+            error = e
+        finally:
+            self._in_flight -= 1
+        self.stats.record(op, scheduled, started, time.perf_counter(), error)
+
+    # -------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------
+
+    def _gap(self) -> float:
+        return self._rng.expovariate(self.rate) if self.arrivals == "poisson" else 1 / self.rate
+
+    async def _open_loop(self, deadline: float) -> None:
+        tasks = set()
+        next_at = self._started
+        while next_at < deadline:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # Behind schedule: still yield once per arrival, so overdue requests can run and
+                # finish instead of every later arrival finding max_in_flight taken and being dropped
+                await asyncio.sleep(0)
+            # When behind schedule, overdue arrivals start at once and keep their scheduled time.
+            # They are counted as in flight before their task first runs, so a burst of overdue
+            # arrivals after a stall still respects max_in_flight.
+            self.stats.scheduled += 1
+            if self._in_flight >= self.max_in_flight:
+                self.stats.dropped += 1
+            else:
+                self._in_flight += 1
+                task = asyncio.create_task(self._one(next_at))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            next_at += self._gap()
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def _worker(self, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            self.stats.scheduled += 1
+            self._in_flight += 1
+            await self._one(time.perf_counter())
+
+    async def _closed_loop(self, deadline: float) -> None:
+        await asyncio.gather(*(self._worker(deadline) for _ in range(self.concurrency)))
+
+    async def _reporter(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self._report_window()
+
+    def _report_window(self) -> None:
+        window, errors = self.stats.take_window()
+        elapsed = time.perf_counter() - self._started
+        span = elapsed - (self.intervals[-1]["elapsed_s"] if self.intervals else 0.0)
+        if not span:
+            return
+        point = {
+            "elapsed_s": round(elapsed, 3),
+            "completed": window.count,
+            "rps": round(window.count / span, 1),
+            "errors": errors,
+            "in_flight": self._in_flight,
+            "dropped": self.stats.dropped,
+            "p50_ms": round(window.quantile(0.50) * 1000, 2),
+            "p99_ms": round(window.quantile(0.99) * 1000, 2),
+            "max_ms": round(window.max * 1000, 2),
+        }
+        self.intervals.append(point)
+        logger.info(
+            "[%6.1fs] %7.1f req/s  p50 %7.2f ms  p99 %7.2f ms  max %7.2f ms  errors %d  in-flight %d  dropped %d",
+            point["elapsed_s"], point["rps"], point["p50_ms"], point["p99_ms"], point["max_ms"],
+            errors, point["in_flight"], point["dropped"],
+        )
+
+    async def run(self) -> Dict[str, Any]:
+        self._started = time.perf_counter()
+        deadline = self._started + self.duration
+        reporter = asyncio.create_task(self._reporter())
+        try:
+            if self.rate is not None:
+                await self._open_loop(deadline)
+            else:
+                await self._closed_loop(deadline)
+        finally:
+            reporter.cancel()
+        elapsed = time.perf_counter() - self._started
+        self._report_window()
+        return self.report(elapsed)
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        stats = self.stats
+        overall, service = Histogram(LATENCY_BUCKETS), Histogram(LATENCY_BUCKETS)
+        for op in OPERATIONS:
+            _merge(overall, stats.latency[op])
+            _merge(service, stats.service[op])
+        return {
+            "mode": "open" if self.rate is not None else "closed",
+            "target_rps": self.rate,
+            "concurrency": self.concurrency,
+            "elapsed_s": round(elapsed, 3),
+            "scheduled": stats.scheduled,
+            "completed": stats.completed,
+            "dropped": stats.dropped,
+            "errors": stats.failed,
+            "throughput_rps": round(stats.completed / elapsed, 1) if elapsed else 0.0,
+            "latency": _summary(overall),
+            "service": _summary(service),
+            "per_op": {
+                op: {
+                    "count": stats.latency[op].count,
+                    "errors": stats.errors[op],
+                    "latency": _summary(stats.latency[op]),
+                    "service": _summary(stats.service[op]),
+                }
+                for op in OPERATIONS if stats.latency[op].count
+            },
+            "intervals": self.intervals,
+        }
+
+
+def _merge(into: Histogram, other: Histogram) -> None:
+    into.counts = [a + b for a, b in zip(into.counts, other.counts)]
+    into.count += other.count
+    into.sum += other.sum
+    into.max = max(into.max, other.max)
+
+
+async def run_load(
+        base_url: str,
+        mix: Dict[str, float],
+        duration: float,
+        rate: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        arrivals: str = "constant",
+        max_in_flight: int = 1000,
+        interval: float = 5.0,
+        seed: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        keep_users: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        circuit_breaker: bool = False,
+        coalesce_reads: bool = False,
+) -> Dict[str, Any]:
+    """
+    One load run against `base_url` (or an in-process `transport`). The client gets
+    its own ClientMetrics, whose per-operation retries end up in the report.
+
+    The circuit breaker and read coalescing are off unless asked for: the first would
+    turn server errors into fail-fast rejections, the second would merge concurrent
+    identical GETs, and both would hide load from the server being measured.
+    """
+    metrics = ClientMetrics()
+    client_kwargs = {
+        "transport": transport,
+        "metrics": metrics,
+        "circuit_breaker": None if circuit_breaker else False,
+        "coalesce_reads": coalesce_reads,
+    }
+    if max_connections is not None:
+        client_kwargs["max_connections"] = max_connections
+    async with AsyncUsersApiClient(base_url, {}, **client_kwargs) as api:
+        generator = LoadGenerator(
+            api, mix, duration, rate=rate, concurrency=concurrency, arrivals=arrivals,
+            max_in_flight=max_in_flight, interval=interval, seed=seed,
+        )
+        report = await generator.run()
+        report["client"] = {"operations": metrics.snapshot()["operations"], "pool": api.pool_stats()}
+        if generator.user_ids and not keep_users:
+            results = await api.delete_users(generator.user_ids)
+            report["cleanup"] = {"deleted": sum(r.ok for r in results), "failed": sum(not r.ok for r in results)}
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(
+        prog="python -m mockapi_client.load",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument("--rate", type=float, help="open loop: scheduled requests per second (default 50)")
+    load.add_argument("--concurrency", type=int, help="closed loop: number of concurrent workers")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"weighted operations (default {DEFAULT_MIX})")
+    parser.add_argument("--arrivals", choices=("constant", "poisson"), default="constant")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="open loop: drop arrivals beyond this")
+    parser.add_argument("--connections", type=int, help="client max_connections (default ASYNC_MAX_CONNECTIONS)")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between live reports")
+    parser.add_argument("--seed", type=int, help="seed for the op mix, arrivals and the local server")
+    parser.add_argument("--keep-users", action="store_true", help="do not delete the users left at the end")
+    parser.add_argument(
+        "--circuit-breaker",
+        action="store_true",
+        help="use the client's shared circuit breaker (off by default: it would fail fast instead of sending load)",
+    )
+    parser.add_argument(
+        "--coalesce-reads",
+        action="store_true",
+        help="coalesce concurrent identical GETs in the client (off by default: every request reaches the server)",
+    )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        default=USE_LOCAL_SERVER,
+        help="run against the bundled local stand-in server (in a child process) instead of BASE_URL",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="local server latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="local server 5xx injection rate")
+    parser.add_argument("--log-format", choices=("color", "text", "json"), default=LOG_FORMAT)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    rate = args.rate if args.rate is not None or args.concurrency is not None else 50.0
+    configure_logging(fmt=args.log_format)
+
+    server = None
+    if args.local:
+        backend = UsersBackend(
+            latency=Fixed(args.latency_ms / 1000) if args.latency_ms else None,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+        server = LocalUsersServer(backend, process=True).start()
+    base_url = server.base_url if server is not None else BASE_URL
+    logger.info(
+        "Load: %s for %.0fs against %s, mix %s",
+        f"{rate:g} req/s open loop" if rate is not None else f"{args.concurrency} workers closed loop",
+        args.duration, base_url, mix,
+    )
+
+    try:
+        report = asyncio.run(run_load(
+            base_url, mix, args.duration, rate=rate, concurrency=args.concurrency, arrivals=args.arrivals,
+            max_in_flight=args.max_in_flight, interval=args.interval, seed=args.seed,
+            max_connections=args.connections, keep_users=args.keep_users,
+            circuit_breaker=args.circuit_breaker, coalesce_reads=args.coalesce_reads,
+        ))
+        if server is not None:
+            report["server"] = server.stats()
+    finally:
+        if server is not None:
+            server.stop()
+
+    report["config"] = vars(args)
+    print(json.dumps({k: v for k, v in report.items() if k not in ("per_op", "intervals", "client", "config")}))
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
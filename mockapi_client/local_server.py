@@ -0,0 +1,577 @@
+"""
+In-process stand-in for the MockAPI `users` resource.
+
+A single `UsersBackend` holds the data and the fault model. It can be reached:
+- on a localhost port           -> LocalUsersServer (threaded HTTP/1.1 keep-alive server)
+- in-process from requests      -> backend.requests_session() / LocalRequestsAdapter
+- in-process from httpx (async) -> backend.async_transport() / LocalAsyncTransport
+
+Example:
+
+    backend = UsersBackend(latency=Uniform(0.005, 0.02), error_rate=0.05)
+    with UsersApiClient(base_url=backend.base_url, session=backend.requests_session()) as api:
+        ...
+    async with AsyncUsersApiClient(backend.base_url, {}, transport=backend.async_transport()) as api:
+        ...
+
+The in-process transports answer for LOCAL_BASE_URL and for the backend's own
+`base_url`. Clients share a circuit breaker per base URL, so use `base_url` when
+faults are injected: failures on one backend then never open the breaker of another.
+"""
+import asyncio
+import heapq
+import json
+import math
+import multiprocessing
+import random
+import threading
+import time
+from itertools import count
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Base URL used with the in-process transports (never resolved over the network)
+LOCAL_BASE_URL = "http://mockapi.local/users"
+
+# Admin endpoints, served next to the resource (same process as the data)
+STATS_PATH = "/__local/stats"
+RESET_PATH = "/__local/reset"
+
+_PAGING_PARAMS = {"page", "limit", "sortBy", "order", "search"}
+
+_backend_numbers = count(1)
+
+
+# -------------------------------------------------
+# Latency distributions
+# -------------------------------------------------
+
+class Fixed:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def sample(self, rng: random.Random) -> float:
+        return self.seconds
+
+
+class Uniform:
+    def __init__(self, low: float, high: float):
+        self.low = low
+        self.high = high
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.uniform(self.low, self.high)
+
+
+class LogNormal:
+    """
+    Long-tailed latency: `median` seconds, spread controlled by `sigma`.
+    """
+
+    def __init__(self, median: float, sigma: float = 0.5):
+        self.mu = math.log(median)
+        self.sigma = sigma
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.lognormvariate(self.mu, self.sigma)
+
+
+class Exponential:
+    def __init__(self, mean: float):
+        self.mean = mean
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.expovariate(1 / self.mean) if self.mean > 0 else 0.0
+
+
+class LocalResponse(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    delay: float
+    timeout: bool = False
+
+
+# -------------------------------------------------
+# Backend (data + fault model)
+# -------------------------------------------------
+
+class UsersBackend:
+    """
+    Thread-safe in-memory users resource with MockAPI-like behaviour:
+
+    - ids are server-assigned strings; `createdAt` is added on create
+    - missing `autofill_fields` are filled with "<field> <id>" junk, like MockAPI does
+    - list supports `page` / `limit`, `sortBy` / `order`, `search` and per-field
+      (case-insensitive substring) filters
+    - unknown ids -> 404 with body "Not found"; a non-integer `page` / `limit` -> 400
+
+    Fault model (per request, drawn from a seeded RNG):
+    - latency        -> a distribution with .sample(rng) (Fixed, Uniform, LogNormal, Exponential)
+    - error_rate     -> fraction of requests answered with a status from `error_statuses`
+    - timeout_rate   -> fraction of requests that stall for `timeout_delay` seconds
+    - retry_after    -> Retry-After header (seconds) sent with 429/503 errors
+    - create_delay   -> seconds before a new record becomes visible
+    - delete_delay   -> seconds a deleted record stays visible (eventual consistency);
+                        the record is purged from the store once the delay has passed
+
+    Picklable (the lock is recreated), so LocalUsersServer(process=True) works with
+    every multiprocessing start method.
+    """
+
+    def __init__(
+            self,
+            latency=None,
+            error_rate: float = 0.0,
+            error_statuses: Sequence[int] = (500, 503),
+            timeout_rate: float = 0.0,
+            timeout_delay: float = 30.0,
+            retry_after: Optional[float] = None,
+            create_delay: float = 0.0,
+            delete_delay: float = 0.0,
+            autofill_fields: Sequence[str] = ("name",),
+            resource: str = "users",
+            seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.timeout_rate = timeout_rate
+        self.timeout_delay = timeout_delay
+        self.retry_after = retry_after
+        self.create_delay = create_delay
+        self.delete_delay = delete_delay
+        self.autofill_fields = tuple(autofill_fields)
+        self.resource = resource
+        # Unique per instance (see the module docstring); only the in-process transports resolve it
+        self.base_url = f"http://mockapi-{next(_backend_numbers)}.local/{resource}"
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            # id -> (record, visible_from, visible_until)
+            self._records: Dict[str, Tuple[Dict[str, Any], float, float]] = {}
+            # (visible_until, id) of records deleted with a delay, soonest first
+            self._expiring: List[Tuple[float, str]] = []
+            self._next_id = 1
+            self._stats = {"requests": 0, "errors_injected": 0, "timeouts_injected": 0, "status": {}}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        with self._lock:
+            state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["status"] = dict(self._stats["status"])
+            stats["records"] = len(self._records)
+            return stats
+
+    # -------------------------------------------------
+    # Request handling
+    # -------------------------------------------------
+
+    def handle(self, method: str, url: str, body: bytes = b"") -> LocalResponse:
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/")
+        query = dict(parse_qsl(parts.query))
+
+        if path.endswith(STATS_PATH):
+            return self._respond(200, self.stats(), 0.0, count=False)
+        if path.endswith(RESET_PATH):
+            self.reset()
+            return self._respond(200, {"reset": True}, 0.0, count=False)
+
+        with self._lock:
+            delay = self.latency.sample(self._rng) if self.latency is not None else 0.0
+            roll = self._rng.random()
+            status = self._rng.choice(self.error_statuses) if self.error_statuses else 500
+            self._stats["requests"] += 1
+
+        if roll < self.timeout_rate:
+            with self._lock:
+                self._stats["timeouts_injected"] += 1
+            return LocalResponse(504, {}, b"", self.timeout_delay, timeout=True)
+
+        if roll < self.timeout_rate + self.error_rate:
+            headers = {}
+            if self.retry_after is not None and status in (429, 503):
+                headers["Retry-After"] = str(self.retry_after)
+            with self._lock:
+                self._stats["errors_injected"] += 1
+            return self._respond(status, HTTPStatus(status).phrase, delay, headers)
+
+        segments = [s for s in path.split("/") if s]
+        if segments and segments[-1] == self.resource:
+            user_id = None
+        elif len(segments) >= 2 and segments[-2] == self.resource:
+            user_id = segments[-1]
+        else:
+            return self._respond(404, "Not found", delay)
+
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return self._respond(400, "Invalid JSON", delay)
+
+        method = method.upper()
+        if user_id is None:
+            if method == "GET":
+                try:
+                    return self._respond(200, self._list(query), delay)
+                except ValueError:
+                    return self._respond(400, "Invalid page or limit", delay)
+            if method == "POST":
+                if not isinstance(payload, dict):
+                    return self._respond(400, "Invalid JSON", delay)
+                return self._respond(201, self._create(payload), delay)
+        else:
+            if method == "GET":
+                return self._found(self._get(user_id), delay)
+            if method in ("PUT", "PATCH"):
+                if not isinstance(payload, dict):
+                    return self._respond(400, "Invalid JSON", delay)
+                return self._found(self._update(user_id, payload), delay)
+            if method == "DELETE":
+                return self._found(self._delete(user_id), delay)
+        return self._respond(405, "Method not allowed", delay)
+
+    def _found(self, record: Optional[Dict[str, Any]], delay: float) -> LocalResponse:
+        if record is None:
+            return self._respond(404, "Not found", delay)
+        return self._respond(200, record, delay)
+
+    def _respond(self, status: int, payload: Any, delay: float, headers: Optional[Dict[str, str]] = None,
+                 count: bool = True) -> LocalResponse:
+        body = json.dumps(payload).encode()
+        if count:
+            with self._lock:
+                self._stats["status"][str(status)] = self._stats["status"].get(str(status), 0) + 1
+        return LocalResponse(status, {"Content-Type": "application/json", **(headers or {})}, body, delay)
+
+    # -------------------------------------------------
+    # Data operations
+    # -------------------------------------------------
+
+    def _purge(self, now: float) -> None:
+        expiring = self._expiring
+        while expiring and expiring[0][0] <= now:
+            _, user_id = heapq.heappop(expiring)
+            entry = self._records.get(user_id)
+            if entry is not None and entry[2] <= now:
+                del self._records[user_id]
+
+    def _visible(self, now: float) -> List[Dict[str, Any]]:
+        self._purge(now)
+        return [record for record, start, end in self._records.values() if start <= now < end]
+
+    def _lookup(self, user_id: str, now: float) -> Optional[Dict[str, Any]]:
+        entry = self._records.get(user_id)
+        if entry is None:
+            return None
+        record, start, end = entry
+        if now >= end:
+            del self._records[user_id]
+            return None
+        return record if now >= start else None
+
+    def _create(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._purge(time.monotonic())
+            user_id = str(self._next_id)
+            self._next_id += 1
+            record = {"createdAt": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())}
+            record.update(payload)
+            for field in self.autofill_fields:
+                record.setdefault(field, f"{field} {user_id}")
+            record["id"] = user_id
+            self._records[user_id] = (record, time.monotonic() + self.create_delay, math.inf)
+            return dict(record)
+
+    def _get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._lookup(user_id, time.monotonic())
+            return dict(record) if record is not None else None
+
+    def _update(self, user_id: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._lookup(user_id, time.monotonic())
+            if record is None:
+                return None
+            record.update({k: v for k, v in payload.items() if k != "id"})
+            return dict(record)
+
+    def _delete(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            now = time.monotonic()
+            record = self._lookup(user_id, now)
+            if record is None:
+                return None
+            _, start, end = self._records[user_id]
+            if end == math.inf:
+                if self.delete_delay > 0:
+                    self._records[user_id] = (record, start, now + self.delete_delay)
+                    heapq.heappush(self._expiring, (now + self.delete_delay, user_id))
+                else:
+                    del self._records[user_id]
+            return dict(record)
+
+    def _list(self, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            users = self._visible(time.monotonic())
+
+        filters = {k: v.lower() for k, v in query.items() if k not in _PAGING_PARAMS}
+        search = query.get("search", "").lower()
+
+        def matches(user):
+            if search and not any(search in str(value).lower() for value in user.values()):
+                return False
+            return all(needle in str(user.get(field, "")).lower() for field, needle in filters.items())
+
+        users = [dict(user) for user in users if matches(user)]
+
+        sort_by = query.get("sortBy")
+        if sort_by:
+            users.sort(key=lambda u: str(u.get(sort_by, "")), reverse=query.get("order") == "desc")
+
+        if "limit" in query:
+            # ValueError (answered with a 400) on non-integer or non-positive values
+            limit = int(query["limit"])
+            page = int(query.get("page", 1))
+            if limit < 1 or page < 1:
+                raise ValueError(f"page and limit must be >= 1, got page={page}, limit={limit}")
+            users = users[(page - 1) * limit: page * limit]
+        return users
+
+    # -------------------------------------------------
+    # In-process transports
+    # -------------------------------------------------
+
+    def requests_session(self) -> requests.Session:
+        """
+        A requests.Session routed to this backend (use with LOCAL_BASE_URL or self.base_url).
+        """
+        session = requests.Session()
+        adapter = LocalRequestsAdapter(self)
+        session.mount(LOCAL_BASE_URL.rsplit("/", 1)[0], adapter)
+        session.mount(self.base_url.rsplit("/", 1)[0], adapter)
+        return session
+
+    def async_transport(self) -> "LocalAsyncTransport":
+        """
+        An httpx async transport routed to this backend (use with LOCAL_BASE_URL or self.base_url).
+        """
+        return LocalAsyncTransport(self)
+
+
+def _read_timeout(timeout) -> Optional[float]:
+    if isinstance(timeout, tuple):
+        return timeout[1]
+    return timeout
+
+
+class LocalRequestsAdapter(BaseAdapter):
+    """
+    requests transport adapter that serves requests from a UsersBackend without sockets.
+    Injected timeouts raise requests' ReadTimeout after min(timeout_delay, client timeout).
+    """
+
+    def __init__(self, backend: UsersBackend):
+        super().__init__()
+        self.backend = backend
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode()
+        result = self.backend.handle(request.method, request.url, body)
+
+        if result.timeout:
+            client_timeout = _read_timeout(timeout)
+            time.sleep(min(result.delay, client_timeout) if client_timeout is not None else result.delay)
+            raise requests.exceptions.ReadTimeout(f"Local server timed out ({request.method} {request.url})",
+                                                  request=request)
+        if result.delay:
+            time.sleep(result.delay)
+
+        response = requests.Response()
+        response.status_code = result.status
+        response.headers = CaseInsensitiveDict({**result.headers, "Content-Length": str(len(result.body))})
+        response.raw = BytesIO(result.body)
+        response.url = request.url
+        response.request = request
+        response.reason = HTTPStatus(result.status).phrase
+        response.encoding = "utf-8"
+        return response
+
+    def close(self):
+        pass
+
+
+class LocalAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    httpx async transport that serves requests from a UsersBackend without sockets.
+    Latency is awaited with asyncio.sleep, so many requests overlap on one loop.
+    """
+
+    def __init__(self, backend: UsersBackend):
+        self.backend = backend
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        result = self.backend.handle(request.method, str(request.url), body)
+
+        if result.timeout:
+            client_timeout = request.extensions.get("timeout", {}).get("read")
+            await asyncio.sleep(min(result.delay, client_timeout) if client_timeout is not None else result.delay)
+            raise httpx.ReadTimeout(f"Local server timed out ({request.method} {request.url})", request=request)
+        if result.delay:
+            await asyncio.sleep(result.delay)
+
+        return httpx.Response(result.status, headers=result.headers, content=result.body, request=request)
+
+
+# -------------------------------------------------
+# Localhost server
+# -------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so client connection pools are exercised
+    disable_nagle_algorithm = True
+    backend: UsersBackend = None
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        result = self.backend.handle(self.command, self.path, body)
+        if result.delay:
+            time.sleep(result.delay)
+        if result.timeout:
+            # The client is expected to have given up already
+            self.close_connection = True
+            return
+        self.send_response(result.status)
+        for name, value in result.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(result.body)))
+        self.end_headers()
+        self.wfile.write(result.body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # the default backlog of 5 stalls bursts of new connections
+
+
+def _serve_in_process(backend: UsersBackend, host: str, ports) -> None:
+    server = _Server((host, 0), type("Handler", (_Handler,), {"backend": backend}))
+    ports.put(server.server_port)
+    server.serve_forever()
+
+
+class LocalUsersServer:
+    """
+    Serves a UsersBackend on a localhost port, for clients that need real sockets.
+
+    - process=False -> background thread (stats and state readable in-process via .backend)
+    - process=True  -> child process, so the server does not compete with the client
+                       for the GIL; use the admin endpoints (STATS_PATH / RESET_PATH).
+                       The backend is pickled to the child; `mp_context` picks the start
+                       method ("spawn", "forkserver", ...; default: multiprocessing's)
+
+        with LocalUsersServer(UsersBackend(latency=Fixed(0.01))) as server:
+            with UsersApiClient(base_url=server.base_url) as api:
+                ...
+    """
+
+    # Child-process entry point: serve(backend, host, ports_queue); puts the port, then serves forever
+    serve = staticmethod(_serve_in_process)
+
+    def __init__(
+            self,
+            backend: Optional[UsersBackend] = None,
+            host: str = "127.0.0.1",
+            process: bool = False,
+            mp_context: Optional[str] = None,
+    ):
+        self.backend = backend or UsersBackend()
+        self.host = host
+        self.process = process
+        self.mp_context = mp_context
+        self.base_url = None
+        self._server = None
+        self._process = None
+
+    @property
+    def root_url(self) -> str:
+        return self.base_url.rsplit("/", 1)[0]
+
+    def start(self) -> "LocalUsersServer":
+        if self.process:
+            context = multiprocessing.get_context(self.mp_context)
+            ports = context.Queue()
+            self._process = context.Process(
+                target=self.serve,
+                args=(self.backend, self.host, ports),
+                daemon=True,
+            )
+            self._process.start()
+            port = ports.get(timeout=10)
+        else:
+            handler = type("Handler", (_Handler,), {"backend": self.backend})
+            self._server = _Server((self.host, 0), handler)
+            port = self._server.server_port
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.base_url = f"http://{self.host}:{port}/{self.backend.resource}"
+        logger.debug("Local users server listening on %s", self.base_url)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Backend stats, fetched over HTTP so it also works with process=True.
+        """
+        return requests.get(f"{self.root_url}{STATS_PATH}", timeout=5).json()
+
+    def reset(self) -> None:
+        requests.post(f"{self.root_url}{RESET_PATH}", timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -1,6 +1,188 @@
+import atexit
+import json
 import logging
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Set, TextIO, Tuple
+
 import colorlog
 
+from .config import LOG_FORMAT, LOG_QUEUE, LOG_REPEAT_INTERVAL, LOG_REPEAT_LIMIT
+
+# Attributes every LogRecord has; anything else was passed via `extra=` and goes into JSON output
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line: ts, level, logger, thread, message, any `extra=` fields
+    and the formatted exception, if any. Non-JSON values are rendered with str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class RepeatFilter(logging.Filter):
+    """
+    Lets at most `limit` records per message template through every `interval` seconds,
+    keyed by (logger, level, unformatted msg). The next record let through after a
+    quiet spell reports how many similar ones were dropped.
+
+    Records above `max_level` (errors by default) are never dropped. Relies on lazy
+    %-style logging: an f-string message makes every record its own template.
+    """
+
+    def __init__(self, limit: int, interval: float, max_level: int = logging.WARNING, clock=time.monotonic):
+        super().__init__()
+        self.limit = limit
+        self.interval = interval
+        self.max_level = max_level
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> [window_start, emitted_in_window, suppressed]
+        self._windows: Dict[Tuple[str, int, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.limit <= 0 or record.levelno > self.max_level:
+            return True
+        key = (record.name, record.levelno, str(record.msg))
+        now = self._clock()
+        with self._lock:
+            if len(self._windows) > 1024:
+                self._windows = {k: w for k, w in self._windows.items() if now - w[0] < self.interval}
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window is not None else 0
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.limit:
+                window[1] += 1
+                suppressed = 0
+            else:
+                window[2] += 1
+                return False
+        if suppressed:
+            record.msg = f"{record.msg} [{suppressed} similar messages suppressed]"
+        return True
+
+
+class _LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread.
+    (The stdlib one formats in the caller.) Only exceptions are rendered eagerly,
+    so queued records do not pin tracebacks and their frames. Log arguments are
+    therefore formatted later: do not mutate them after the logging call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _formatter(fmt: str) -> logging.Formatter:
+    if fmt == "json":
+        return JsonFormatter()
+    if fmt == "text":
+        return logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    # Use a simpler format for Pytest to avoid double-formatting
+    return colorlog.ColoredFormatter(
+        "%(log_color)s[%(levelname)s] %(message)s",
+        log_colors={
+            "DEBUG": "cyan", "INFO": "green",
+            "WARNING": "yellow", "ERROR": "red", "CRITICAL": "bold_red",
+        }
+    )
+
+
+# -------------------------------------------------
+# Process-wide configuration
+# -------------------------------------------------
+
+_lock = threading.RLock()
+_managed: Set[str] = set()  # names of loggers created through get_logger
+_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(
+        fmt: str = LOG_FORMAT,
+        use_queue: bool = LOG_QUEUE,
+        repeat_limit: int = LOG_REPEAT_LIMIT,
+        repeat_interval: float = LOG_REPEAT_INTERVAL,
+        stream: Optional[TextIO] = None,
+) -> logging.Handler:
+    """
+    (Re)configures the handler shared by every logger from get_logger.
+
+    - fmt="color" / "text" / "json"  -> output format
+    - use_queue=True                 -> callers only enqueue the record; a background
+                                        QueueListener formats and writes it
+    - repeat_limit > 0               -> RepeatFilter on warnings (e.g. retry storms)
+
+    Defaults come from LOG_FORMAT / LOG_QUEUE / LOG_REPEAT_LIMIT / LOG_REPEAT_INTERVAL.
+    Returns the handler attached to the loggers.
+    """
+    global _handler, _listener
+    with _lock:
+        old_listener, _listener = _listener, None
+        output = colorlog.StreamHandler(stream) if fmt == "color" else logging.StreamHandler(stream or sys.stderr)
+        output.setFormatter(_formatter(fmt))
+        if use_queue:
+            records = queue.SimpleQueue()
+            handler = _LazyQueueHandler(records)
+            _listener = QueueListener(records, output, respect_handler_level=True)
+            _listener.start()
+        else:
+            handler = output
+        if repeat_limit > 0:
+            # Filtering before the queue keeps dropped records off the listener entirely
+            handler.addFilter(RepeatFilter(repeat_limit, repeat_interval))
+
+        old, _handler = _handler, handler
+        for name in _managed:
+            logger = logging.getLogger(name)
+            if old is not None:
+                logger.removeHandler(old)
+            logger.addHandler(handler)
+        # Stop the previous listener only once nothing can enqueue to it any more
+        if old_listener is not None:
+            old_listener.stop()
+        return handler
+
+
+def shutdown_logging() -> None:
+    """
+    Stops the background listener (if any) after it has written every queued record.
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(shutdown_logging)
+
 
 def get_logger(name: str = __name__, level: int = None) -> logging.Logger:
     logger = logging.getLogger(name)
@@ -25,25 +207,16 @@ def get_logger(name: str = __name__, level: int = None) -> logging.Logger:
         logging.getLogger(noisy_logger).propagate = False
 
     # Avoid adding multiple handlers if the logger is reused
-    if not logger.handlers:
-        handler = colorlog.StreamHandler()
-
-        # Use a simpler format for Pytest to avoid double-formatting
-        fmt = "%(log_color)s[%(levelname)s] %(message)s"
-
-        formatter = colorlog.ColoredFormatter(
-            fmt,
-            log_colors={
-                "DEBUG": "cyan", "INFO": "green",
-                "WARNING": "yellow", "ERROR": "red", "CRITICAL": "bold_red",
-            }
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        # Prevent logs from bubbling up to the root logger
-        # which would cause double-logging in Pytest
-        logger.propagate = False
+    with _lock:
+        if name not in _managed:
+            _managed.add(name)
+            if _handler is None:
+                configure_logging()
+            else:
+                logger.addHandler(_handler)
 
-    return logger
+            # Prevent logs from bubbling up to the root logger
+            # which would cause double-logging in Pytest
+            logger.propagate = False
 
+    return logger
@@ -0,0 +1,342 @@
+import bisect
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+import requests
+
+from .config import METRICS_ENABLED
+from .retry import status_of
+
+# Prometheus' default latency buckets (seconds)
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_TIMEOUTS = (requests.exceptions.Timeout, httpx.TimeoutException)
+_CONNECTION_ERRORS = (requests.exceptions.ConnectionError, httpx.NetworkError)
+
+
+def error_kind(exc: BaseException) -> str:
+    if isinstance(exc, _TIMEOUTS):
+        return "timeout"
+    if isinstance(exc, _CONNECTION_ERRORS):
+        return "connection"
+    return type(exc).__name__
+
+
+def endpoint_label(base_url: str, url: str) -> str:
+    """
+    Low-cardinality endpoint for a request URL: "/users" or "/users/{id}".
+    """
+    resource = "/" + base_url.rstrip("/").rsplit("/", 1)[-1]
+    rest = url.split("?", 1)[0][len(base_url):].strip("/")
+    return f"{resource}/{{id}}" if rest else resource
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram (Prometheus semantics). Not locked on its own;
+    ClientMetrics serializes access.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate by linear interpolation inside the bucket holding the q-th observation
+        (the +Inf bucket reports the largest value seen).
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return self.max
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = min(self.buckets[index], self.max)
+                return lower + (upper - lower) * max(rank - seen, 0) / count
+            seen += count
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean_ms": round(self.sum / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.quantile(0.50) * 1000, 3),
+            "p95_ms": round(self.quantile(0.95) * 1000, 3),
+            "p99_ms": round(self.quantile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "buckets": {str(le): count for le, count in zip(self.buckets + (float("inf"),), self.counts)},
+        }
+
+
+class _OperationObserver:
+    """
+    RetryPolicy observer for one decorated call (see RetryPolicy.run).
+    """
+    __slots__ = ("_metrics", "_operation")
+
+    def __init__(self, metrics: "ClientMetrics", operation: str):
+        self._metrics = metrics
+        self._operation = operation
+
+    def on_retry(self, exc: BaseException, attempt: int, delay: float) -> None:
+        self._metrics.observe_retry(self._operation, exc, delay)
+
+    def on_done(self, attempts: int, error: Optional[BaseException]) -> None:
+        self._metrics.observe_operation(self._operation, attempts, error)
+
+
+class ClientMetrics:
+    """
+    Request metrics fed by UsersApiClient and AsyncUsersApiClient; one instance
+    may be shared by any number of clients, threads and event loops.
+
+    - request latency histogram per (method, endpoint)
+    - response counts per (method, endpoint, status), transport errors per kind
+      (timeout / connection / exception type)
+    - bytes sent / received per (method, endpoint)
+    - operations (client method calls) vs attempts and retries per reason, i.e.
+      retry amplification
+    - connection-pool wait histogram (async client over a real httpx pool)
+
+    Export with snapshot() (JSON-friendly dict) or prometheus_text().
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, clock=time.perf_counter):
+        self.buckets = tuple(buckets)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latency: Dict[Tuple[str, str], Histogram] = {}
+            self._responses: Dict[Tuple[str, str, int], int] = {}
+            self._errors: Dict[Tuple[str, str, str], int] = {}
+            self._bytes: Dict[Tuple[str, str], List[int]] = {}  # [sent, received]
+            self._operations: Dict[str, List[int]] = {}  # [calls, attempts, failures]
+            self._retries: Dict[Tuple[str, str], int] = {}
+            self._backoff = Histogram(self.buckets)
+            self._pool_wait = Histogram(self.buckets)
+
+    # -------------------------------------------------
+    # Recording
+    # -------------------------------------------------
+
+    def _histogram(self, key: Tuple[str, str]) -> Histogram:
+        histogram = self._latency.get(key)
+        if histogram is None:
+            histogram = self._latency[key] = Histogram(self.buckets)
+        return histogram
+
+    def observe_response(
+            self, method: str, endpoint: str, status: int, duration: float, sent: int = 0, received: int = 0,
+    ) -> None:
+        key = (method, endpoint)
+        with self._lock:
+            self._histogram(key).observe(duration)
+            status_key = (method, endpoint, status)
+            self._responses[status_key] = self._responses.get(status_key, 0) + 1
+            transferred = self._bytes.setdefault(key, [0, 0])
+            transferred[0] += sent
+            transferred[1] += received
+
+    def observe_error(self, method: str, endpoint: str, exc: BaseException, duration: float, sent: int = 0) -> None:
+        key = (method, endpoint)
+        with self._lock:
+            self._histogram(key).observe(duration)
+            error_key = (method, endpoint, error_kind(exc))
+            self._errors[error_key] = self._errors.get(error_key, 0) + 1
+            self._bytes.setdefault(key, [0, 0])[0] += sent
+
+    def observe_retry(self, operation: str, exc: BaseException, delay: float) -> None:
+        status = status_of(exc)
+        reason = str(status) if status is not None else error_kind(exc)
+        with self._lock:
+            self._retries[(operation, reason)] = self._retries.get((operation, reason), 0) + 1
+            self._backoff.observe(delay)
+
+    def observe_operation(self, operation: str, attempts: int, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            totals = self._operations.setdefault(operation, [0, 0, 0])
+            totals[0] += 1
+            totals[1] += attempts
+            if error is not None:
+                totals[2] += 1
+
+    def observe_pool_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._pool_wait.observe(seconds)
+
+    def retry_observer(self, operation: str) -> _OperationObserver:
+        return _OperationObserver(self, operation)
+
+    def pool_wait_tracer(self):
+        """
+        httpx `trace` extension for one request: the first connection-level event
+        marks the end of the wait for a pooled connection.
+        """
+        started = self._clock()
+        done = False
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal done
+            if not done and event_name.startswith(("connection.", "http11.", "http2.")):
+                done = True
+                self.observe_pool_wait(self._clock() - started)
+
+        return trace
+
+    # -------------------------------------------------
+    # Export
+    # -------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            requests_ = {}
+            for (method, endpoint), histogram in sorted(self._latency.items()):
+                sent, received = self._bytes.get((method, endpoint), (0, 0))
+                requests_[f"{method} {endpoint}"] = {
+                    "latency": histogram.snapshot(),
+                    "status": {
+                        str(status): count
+                        for (m, e, status), count in sorted(self._responses.items())
+                        if (m, e) == (method, endpoint)
+                    },
+                    "errors": {
+                        kind: count for (m, e, kind), count in sorted(self._errors.items()) if (m, e) == (method, endpoint)
+                    },
+                    "bytes_sent": sent,
+                    "bytes_received": received,
+                }
+            operations = {}
+            for operation, (calls, attempts, failures) in sorted(self._operations.items()):
+                operations[operation] = {
+                    "calls": calls,
+                    "attempts": attempts,
+                    "failures": failures,
+                    "retries": {reason: n for (op, reason), n in sorted(self._retries.items()) if op == operation},
+                    "amplification": round(attempts / calls, 3) if calls else 0.0,
+                }
+            return {
+                "requests": requests_,
+                "operations": operations,
+                "backoff": self._backoff.snapshot(),
+                "pool_wait": self._pool_wait.snapshot(),
+            }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def prometheus_text(self, prefix: str = "mockapi_client") -> str:
+        """
+        Prometheus text exposition format (version 0.0.4).
+        """
+        lines: List[str] = []
+        with self._lock:
+            _histogram_lines(
+                lines, f"{prefix}_request_duration_seconds", "Request latency by method and endpoint.",
+                [({"method": m, "endpoint": e}, h) for (m, e), h in sorted(self._latency.items())],
+            )
+            _counter_lines(
+                lines, f"{prefix}_responses_total", "Responses by method, endpoint and status code.",
+                [({"method": m, "endpoint": e, "status": str(s)}, n) for (m, e, s), n in sorted(self._responses.items())],
+            )
+            _counter_lines(
+                lines, f"{prefix}_request_errors_total", "Requests that failed without a response.",
+                [({"method": m, "endpoint": e, "kind": k}, n) for (m, e, k), n in sorted(self._errors.items())],
+            )
+            _counter_lines(
+                lines, f"{prefix}_bytes_sent_total", "Request body bytes sent.",
+                [({"method": m, "endpoint": e}, b[0]) for (m, e), b in sorted(self._bytes.items())],
+            )
+            _counter_lines(
+                lines, f"{prefix}_bytes_received_total", "Response body bytes received.",
+                [({"method": m, "endpoint": e}, b[1]) for (m, e), b in sorted(self._bytes.items())],
+            )
+            _counter_lines(
+                lines, f"{prefix}_operations_total", "Client method calls (including retried ones once).",
+                [({"operation": op}, t[0]) for op, t in sorted(self._operations.items())],
+            )
+            _counter_lines(
+                lines, f"{prefix}_operation_attempts_total", "Attempts made by client method calls.",
+                [({"operation": op}, t[1]) for op, t in sorted(self._operations.items())],
+            )
+            _counter_lines(
+                lines, f"{prefix}_operation_failures_total", "Client method calls that failed after all attempts.",
+                [({"operation": op}, t[2]) for op, t in sorted(self._operations.items())],
+            )
+            _counter_lines(
+                lines, f"{prefix}_retries_total", "Retries by operation and reason (status code or error kind).",
+                [({"operation": op, "reason": r}, n) for (op, r), n in sorted(self._retries.items())],
+            )
+            _histogram_lines(
+                lines, f"{prefix}_retry_backoff_seconds", "Backoff slept before each retry.", [({}, self._backoff)],
+            )
+            _histogram_lines(
+                lines, f"{prefix}_pool_wait_seconds", "Wait for a pooled connection (async client).",
+                [({}, self._pool_wait)],
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _counter_lines(lines: List[str], name: str, help_text: str, samples: List[Tuple[Dict[str, str], int]]) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    lines.extend(f"{name}{_labels(labels)} {value}" for labels, value in samples)
+
+
+def _histogram_lines(
+        lines: List[str], name: str, help_text: str, samples: List[Tuple[Dict[str, str], Histogram]],
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, histogram in samples:
+        cumulative = 0
+        for le, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+            cumulative += count
+            bound = "+Inf" if le == float("inf") else repr(le)
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': bound})} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {histogram.sum!r}")
+        lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+
+# -------------------------------------------------
+# Process-wide default
+# -------------------------------------------------
+
+METRICS = ClientMetrics()
+
+
+def default_metrics() -> Optional[ClientMetrics]:
+    """
+    The registry clients feed unless given their own; None when METRICS_ENABLED is off.
+    """
+    return METRICS if METRICS_ENABLED else None
@@ -0,0 +1,214 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from .cache import MISSING, TTLCache
+from .circuit_breaker import CircuitBreaker
+from .codec import CODEC, JsonCodec
+from .logger import get_logger
+from .metrics import ClientMetrics, endpoint_label
+
+logger = get_logger(__name__)
+
+# Sent with every encoded body (the async client's caller-supplied headers may lack it)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@dataclass(frozen=True)
+class ApiCall:
+    """
+    One API call, independent of any HTTP stack: what to send and how to read the answer.
+
+    - user_id     -> the addressed user (also the cache key), None for the collection
+    - collection  -> the result is a list: a 404 or an empty body reads as []
+    """
+    operation: str
+    method: str
+    url: str
+    user_id: Optional[str] = None
+    params: Optional[Dict[str, Any]] = None
+    json: Any = None
+    collection: bool = False
+
+
+class UsersProtocol:
+    """
+    Sans-IO core of the users API, shared by UsersApiClient and AsyncUsersApiClient.
+
+    It builds every call, interprets status codes and bodies, and runs the cache,
+    circuit breaker and metrics hooks. The clients are thin drivers on top: they
+    move bytes with requests or httpx and sleep between retries. Retry decisions
+    come from RetryPolicy, which both retry decorators share.
+
+    Bodies go through `codec` (default: codec.CODEC, orjson or msgspec when installed):
+    payloads are encoded straight to bytes and responses decoded straight from bytes.
+
+    Contract, identical in both clients:
+    - 2xx             -> parsed JSON (None for an empty body, [] for an empty collection)
+    - 404             -> None ([] for collection calls)
+    - other 4xx / 5xx -> the HTTP stack's own error (requests.HTTPError / httpx.HTTPStatusError)
+    """
+
+    def __init__(self, base_url: str, codec: Optional[JsonCodec] = None):
+        self.base_url = base_url.rstrip("/")
+        self.codec = codec or CODEC
+
+    def url(self, user_id: Optional[str] = None) -> str:
+        return self.base_url if user_id is None else f"{self.base_url}/{user_id}"
+
+    # -------------------------------------------------
+    # Request construction
+    # -------------------------------------------------
+
+    def create_user(self, payload: Dict) -> ApiCall:
+        return ApiCall("create_user", "POST", self.base_url, json=payload)
+
+    def get_user(self, user_id: str) -> ApiCall:
+        return ApiCall("get_user", "GET", self.url(user_id), user_id=user_id)
+
+    def patch_user(self, user_id: str, partial_data: Dict) -> ApiCall:
+        return ApiCall("patch_user", "PATCH", self.url(user_id), user_id=user_id, json=partial_data)
+
+    def delete_user(self, user_id: str) -> ApiCall:
+        return ApiCall("delete_user", "DELETE", self.url(user_id), user_id=user_id)
+
+    def list_users(self) -> ApiCall:
+        return ApiCall("list_users", "GET", self.base_url, collection=True)
+
+    def list_users_page(self, page: int, limit: int, **filters) -> ApiCall:
+        params = {"page": page, "limit": limit, **filters}
+        return ApiCall("list_users_page", "GET", self.base_url, params=params, collection=True)
+
+    def stream_users(self, **params) -> ApiCall:
+        return ApiCall("stream_users", "GET", self.base_url, params=params or None, collection=True)
+
+    def encode(self, call: ApiCall) -> Optional[bytes]:
+        """
+        The call's request body, or None when it has none.
+        """
+        return None if call.json is None else self.codec.dumps(call.json)
+
+    # -------------------------------------------------
+    # Response interpretation
+    # -------------------------------------------------
+
+    def check_status(
+            self,
+            call: ApiCall,
+            status_code: int,
+            raise_for_status: Callable[[], Any],
+            content: bytes = b"",
+    ) -> bool:
+        """
+        True if the body holds a result; False for a 404 (nothing to read).
+        Any other 4xx / 5xx is logged and raised through `raise_for_status`.
+        """
+        if status_code == 404:
+            return False
+        if status_code >= 400:
+            logger.error(
+                "HTTP error",
+                extra={
+                    "method": call.method,
+                    "url": call.url,
+                    "status": status_code,
+                    "body": content.decode("utf-8", "replace"),
+                },
+            )
+            raise_for_status()
+        return True
+
+    def interpret(
+            self,
+            call: ApiCall,
+            status_code: int,
+            content: bytes,
+            raise_for_status: Callable[[], Any],
+    ) -> Any:
+        """
+        The call's result for a fully read response, per the contract above.
+        """
+        found = self.check_status(call, status_code, raise_for_status, content)
+        value = self.codec.loads(content) if found and content else None
+        if call.collection:
+            return value or []
+        return value
+
+    # -------------------------------------------------
+    # Cache hooks
+    # -------------------------------------------------
+
+    @staticmethod
+    def cache_version(cache: Optional[TTLCache]) -> Optional[int]:
+        """
+        Taken before a call is sent and handed back to cache_store, so a response
+        that raced a delete of the same user is not written back into the cache.
+        """
+        return cache.version() if cache is not None else None
+
+    def cache_lookup(self, call: ApiCall, cache: Optional[TTLCache]) -> Any:
+        """
+        Runs before a call is sent: a get_user hit returns the cached user (None for
+        a cached 404), anything else returns MISSING. delete_user evicts up front.
+        """
+        if cache is None or call.user_id is None:
+            return MISSING
+        if call.operation == "get_user":
+            return cache.get(call.user_id)
+        if call.operation == "delete_user":
+            cache.invalidate(call.user_id)
+        return MISSING
+
+    def cache_store(self, call: ApiCall, cache: Optional[TTLCache], value: Any, since: Optional[int] = None) -> None:
+        """
+        Runs after a call succeeds: get_user reads through (404s negatively), patch_user writes through,
+        delete_user evicts again. Reads or writes that were in flight during the delete (taken at an
+        older cache_version `since`) are then not stored.
+        """
+        if cache is None:
+            return
+        if call.operation in ("get_user", "patch_user"):
+            cache.set(call.user_id, value, since=since)
+        elif call.operation == "delete_user":
+            cache.invalidate(call.user_id)
+
+    # -------------------------------------------------
+    # Transport hooks (one per attempt)
+    # -------------------------------------------------
+
+    def on_error(
+            self,
+            breaker: Optional[CircuitBreaker],
+            metrics: Optional[ClientMetrics],
+            method: str,
+            url: str,
+            exc: BaseException,
+            elapsed: float,
+    ) -> None:
+        if breaker is not None:
+            breaker.record_failure(elapsed)
+        if metrics is not None:
+            metrics.observe_error(method, endpoint_label(self.base_url, url), exc, elapsed)
+
+    def on_response(
+            self,
+            breaker: Optional[CircuitBreaker],
+            metrics: Optional[ClientMetrics],
+            method: str,
+            url: str,
+            status_code: int,
+            elapsed: float,
+            sent: int,
+            received: int,
+    ) -> None:
+        """
+        Feeds one finished attempt to the breaker (5xx count as failures) and to metrics.
+        """
+        if breaker is not None:
+            if status_code >= 500:
+                breaker.record_failure(elapsed)
+            else:
+                breaker.record_success(elapsed)
+        if metrics is not None:
+            metrics.observe_response(
+                method, endpoint_label(self.base_url, url), status_code, elapsed, sent=sent, received=received,
+            )
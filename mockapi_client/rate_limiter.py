@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from .config import RATE_LIMIT_BURST, RATE_LIMIT_RPS
+
+
+class TokenBucket:
+    """
+    Reservation-based token bucket.
+
+    `reserve()` takes a token immediately (the balance may go negative) and returns
+    how long the caller must wait before using it. Callers therefore never spin or
+    re-check: the lock is held only for the arithmetic, and the sleep happens outside.
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class _WaitStats:
+    def __init__(self):
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.acquired += 1
+        if wait > 0:
+            self.delayed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "total_wait_s": round(self.total_wait, 4),
+            "mean_wait_ms": round(self.total_wait / self.acquired * 1000, 3) if self.acquired else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+class RateLimiter:
+    """
+    Client-side pacing for UsersApiClient / AsyncUsersApiClient (`rate_limiter=`).
+
+    - rate        -> sustained requests per second across all methods (required, > 0;
+                     default_rate_limiter() applies RATE_LIMIT_RPS and its 0 = off rule)
+    - burst       -> requests allowed back-to-back after an idle period
+    - per_method  -> optional {"POST": (rate, burst), ...}; a request must fit both
+                     the shared bucket and its method's bucket
+
+    One instance may be shared by every thread and coroutine in the process:
+    `acquire()` blocks the calling thread, `acquire_async()` only the calling task.
+    A cancelled `acquire_async()` still consumes its reserved slot.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int = RATE_LIMIT_BURST,
+            per_method: Optional[Dict[str, Tuple[float, int]]] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._bucket = TokenBucket(rate, burst, clock)
+        self._method_buckets = {
+            method.upper(): TokenBucket(method_rate, method_burst, clock)
+            for method, (method_rate, method_burst) in (per_method or {}).items()
+        }
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, _WaitStats] = {}
+
+    def reserve(self, method: str = "GET") -> float:
+        """
+        Reserves a slot for one request and returns the seconds to wait before sending it.
+        """
+        method = method.upper()
+        wait = self._bucket.reserve()
+        method_bucket = self._method_buckets.get(method)
+        if method_bucket is not None:
+            wait = max(wait, method_bucket.reserve())
+        with self._stats_lock:
+            self._stats.setdefault(method, _WaitStats()).record(wait)
+        return wait
+
+    def acquire(self, method: str = "GET") -> float:
+        wait = self.reserve(method)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, method: str = "GET") -> float:
+        wait = self.reserve(method)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Wait-time statistics, overall and per HTTP method.
+        """
+        with self._stats_lock:
+            total = _WaitStats()
+            per_method = {}
+            for method, stats in sorted(self._stats.items()):
+                per_method[method] = stats.snapshot()
+                total.acquired += stats.acquired
+                total.delayed += stats.delayed
+                total.total_wait += stats.total_wait
+                total.max_wait = max(total.max_wait, stats.max_wait)
+        return {"rate": self.rate, "burst": self.burst, **total.snapshot(), "per_method": per_method}
+
+
+def default_rate_limiter() -> Optional[RateLimiter]:
+    """
+    A RateLimiter from RATE_LIMIT_RPS / RATE_LIMIT_BURST, or None when RATE_LIMIT_RPS is 0.
+    """
+    return RateLimiter(RATE_LIMIT_RPS, RATE_LIMIT_BURST) if RATE_LIMIT_RPS > 0 else None
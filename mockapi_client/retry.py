@@ -0,0 +1,308 @@
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional
+
+import httpx
+import requests
+
+from .config import RETRY_BUDGET_MIN_PER_SECOND, RETRY_BUDGET_RATIO
+from .logger import get_logger
+from .tracing import span
+
+logger = get_logger(__name__)
+
+# Statuses worth retrying: throttling and transient server/gateway failures.
+# Everything else (400, 404, 409, 422, 501, ...) is final.
+RETRYABLE_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+# Transport failures worth retrying, for both HTTP stacks
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+class RetryBudget:
+    """
+    Process-wide cap on retries, shared by every policy that uses it.
+
+    A token bucket: each original call deposits `ratio` tokens, each retry spends
+    one, and the bucket also refills at `min_per_second` so low-traffic callers can
+    still retry. When the backend degrades and most calls fail, retries are capped
+    at roughly `ratio` x traffic instead of multiplying it.
+    """
+
+    def __init__(
+            self,
+            ratio: float = RETRY_BUDGET_RATIO,
+            min_per_second: float = RETRY_BUDGET_MIN_PER_SECOND,
+            capacity: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity if capacity is not None else max(10.0, min_per_second * 10)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self._deposits = 0
+        self._withdrawn = 0
+        self._rejected = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.min_per_second)
+
+    def deposit(self) -> None:
+        """
+        Records an original (non-retry) call.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+            self._deposits += 1
+
+    def try_withdraw(self) -> bool:
+        """
+        Spends one token for a retry; False means the retry must not happen.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._withdrawn += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            self._refill(self._clock())
+            return {
+                "tokens": round(self._tokens, 3),
+                "capacity": self.capacity,
+                "calls": self._deposits,
+                "retries": self._withdrawn,
+                "rejected": self._rejected,
+            }
+
+
+# Shared by every RetryPolicy that does not bring its own budget
+RETRY_BUDGET = RetryBudget()
+
+
+def status_of(exc: BaseException) -> Optional[int]:
+    """
+    HTTP status carried by a requests.HTTPError / httpx.HTTPStatusError, if any.
+    """
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parses a Retry-After header (delta-seconds or HTTP-date) into seconds.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Retry rules shared by the sync and async clients.
+
+    - max_attempts      -> total attempts, including the first one
+    - base_delay        -> lower bound of every backoff sleep
+    - max_delay         -> upper bound of every backoff sleep
+    - retry_statuses    -> HTTP statuses that are retried; other statuses are final
+    - max_retry_after   -> a Retry-After longer than this is not waited for (error is raised)
+    - budget            -> RetryBudget shared across policies (None disables the budget)
+
+    Backoff uses decorrelated jitter: sleep = min(max_delay, uniform(base_delay, previous * 3)).
+    A Retry-After header on 429/503 replaces the computed sleep.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 4,
+            base_delay: float = 0.5,
+            max_delay: float = 10.0,
+            retry_statuses: FrozenSet[int] = RETRYABLE_STATUSES,
+            max_retry_after: float = 30.0,
+            budget: Optional[RetryBudget] = RETRY_BUDGET,
+            rng: Optional[random.Random] = None,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self._rng = rng or random.Random()
+
+    # -------------------------------------------------
+    # Classification
+    # -------------------------------------------------
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, (requests.exceptions.HTTPError, httpx.HTTPStatusError)):
+            return status_of(exc) in self.retry_statuses
+        return isinstance(exc, RETRYABLE_EXCEPTIONS)
+
+    def retry_after(self, exc: BaseException) -> Optional[float]:
+        if status_of(exc) not in (429, 503):
+            return None
+        return parse_retry_after(exc.response.headers.get("Retry-After"))
+
+    def next_delay(self, previous: float, exc: Optional[BaseException] = None) -> float:
+        """
+        Seconds to sleep before the next attempt; `previous` is the last sleep (0 at first).
+        """
+        if exc is not None:
+            retry_after = self.retry_after(exc)
+            if retry_after is not None:
+                return retry_after
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, self._rng.uniform(self.base_delay, upper))
+
+    def _should_retry(self, attempt: int, exc: BaseException, delay: float) -> bool:
+        if attempt >= self.max_attempts or not self.is_retryable(exc):
+            return False
+        if delay > self.max_retry_after:
+            logger.warning("Retry-After of %.1fs exceeds %ss, not retrying", delay, self.max_retry_after)
+            return False
+        if self.budget is not None and not self.budget.try_withdraw():
+            logger.warning("Retry budget exhausted, not retrying %s: %s", type(exc).__name__, exc)
+            return False
+        return True
+
+    def _log_retry(self, attempt: int, exc: BaseException, delay: float) -> None:
+        # Lazy %-style: a constant template lets the logger's RepeatFilter throttle retry storms
+        logger.warning(
+            "[Attempt %d/%d] Caught %s: %s. Retrying in %.2fs...",
+            attempt, self.max_attempts, type(exc).__name__, exc, delay,
+        )
+
+    # -------------------------------------------------
+    # Runners
+    # -------------------------------------------------
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        return self.run(func, args, kwargs)
+
+    async def call_async(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        return await self.run_async(func, args, kwargs)
+
+    def run(
+            self,
+            func: Callable[..., Any],
+            args: tuple = (),
+            kwargs: Optional[dict] = None,
+            observer: Any = None,
+    ) -> Any:
+        """
+        Calls func(*args, **kwargs) under this policy. An optional `observer` (e.g.
+        ClientMetrics.retry_observer(...)) gets on_retry(exc, attempt, delay) before
+        each retry and on_done(attempts, error) once the call succeeds or gives up.
+        With tracing on, every try and every backoff sleep is its own span.
+        """
+        kwargs = kwargs or {}
+        if self.budget is not None:
+            self.budget.deposit()
+        delay = 0.0
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                with span("attempt", attempt=attempt):
+                    result = func(*args, **kwargs)
+                if attempt > 1:
+                    logger.info("Recovered on attempt %d", attempt)
+                if observer is not None:
+                    observer.on_done(attempt, None)
+                return result
+            except Exception as e:
+                delay = self.next_delay(delay, e)
+                if not self._should_retry(attempt, e, delay):
+                    if attempt > 1:
+                        logger.error("All %d attempts failed. Last error: %s", attempt, e)
+                    if observer is not None:
+                        observer.on_done(attempt, e)
+                    raise
+                self._log_retry(attempt, e, delay)
+                if observer is not None:
+                    observer.on_retry(e, attempt, delay)
+                with span("backoff", delay=round(delay, 3)):
+                    time.sleep(delay)
+
+    async def run_async(
+            self,
+            func: Callable[..., Awaitable[Any]],
+            args: tuple = (),
+            kwargs: Optional[dict] = None,
+            observer: Any = None,
+    ) -> Any:
+        kwargs = kwargs or {}
+        if self.budget is not None:
+            self.budget.deposit()
+        delay = 0.0
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                with span("attempt", attempt=attempt):
+                    result = await func(*args, **kwargs)
+                if attempt > 1:
+                    logger.info("Recovered on attempt %d", attempt)
+                if observer is not None:
+                    observer.on_done(attempt, None)
+                return result
+            except Exception as e:
+                delay = self.next_delay(delay, e)
+                if not self._should_retry(attempt, e, delay):
+                    if attempt > 1:
+                        logger.error("All %d attempts failed. Last error: %s", attempt, e)
+                    if observer is not None:
+                        observer.on_done(attempt, e)
+                    raise
+                self._log_retry(attempt, e, delay)
+                if observer is not None:
+                    observer.on_retry(e, attempt, delay)
+                with span("backoff", delay=round(delay, 3)):
+                    await asyncio.sleep(delay)
+
+
+def resolve_policy(args: tuple, default: RetryPolicy) -> RetryPolicy:
+    """
+    Policy for a decorated call: a bound client's `retry_policy` wins over the decorator's.
+    """
+    instance_policy = getattr(args[0], "retry_policy", None) if args else None
+    return instance_policy if isinstance(instance_policy, RetryPolicy) else default
+
+
+def retry_observer(args: tuple, operation: str) -> Any:
+    """
+    Observer for a decorated call: the bound client's metrics, if it has any.
+    """
+    metrics = getattr(args[0], "metrics", None) if args else None
+    return metrics.retry_observer(operation) if metrics is not None else None
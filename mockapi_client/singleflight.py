@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical async calls into one in-flight execution.
+
+    The first caller for a key starts `func()` as a task; every caller that
+    arrives with the same key while it is running awaits that same task and
+    receives its result or exception. The key is released as soon as the task
+    finishes, so later calls start a fresh request (no caching).
+
+    Waiters are shielded: cancelling one waiter does not cancel the shared call
+    for the others.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(func())
+            self._flights[key] = flight
+            self._executions += 1
+            flight.add_done_callback(lambda done: self._release(key, done))
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(flight)
+
+    def _release(self, key: Hashable, flight: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the exception as retrieved even if every waiter was cancelled
+        if not flight.cancelled():
+            flight.exception()
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executions": self._executions,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._flights),
+        }
@@ -0,0 +1,121 @@
+import codecs
+import json
+import re
+from json.decoder import WHITESPACE
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+# Compact the text buffer once this many consumed characters have piled up
+_COMPACT_AT = 64 * 1024
+_DELIMITERS = frozenset(" \t\n\r,]")
+# What a decode error at the very end of the buffer looks like: one unfinished token ("tr", "1.", "u12")
+_PARTIAL_TOKEN = re.compile(r'[^\s,:\[\]{}"]*\Z')
+
+
+class JsonArrayStream:
+    """
+    Incremental parser for a top-level JSON array, e.g. a MockAPI list response.
+
+    Feed it raw byte chunks as they arrive; each call returns the array items
+    completed so far. UTF-8 sequences split across chunks are handled by an
+    incremental decoder, and consumed text is dropped, so memory stays bounded
+    by the largest single item plus one chunk, not by the size of the array.
+
+        parser = JsonArrayStream()
+        for chunk in response.iter_content(65536):
+            yield from parser.feed(chunk)
+        parser.close()
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"  # start -> item -> separator -> ... -> done
+        self.items = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        self._buffer += self._decoder.decode(chunk)
+        return self._drain()
+
+    def close(self) -> None:
+        """
+        Flushes the decoder and checks the array was complete.
+
+        Raises:
+            ValueError: If the stream ended mid-array or held trailing data.
+        """
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._drain(final=True)
+        rest = self._buffer[self._skip_ws():]
+        if self._state != "done":
+            raise ValueError(f"Truncated JSON array after {self.items} items")
+        if rest:
+            raise ValueError(f"Unexpected data after JSON array: {rest[:20]!r}")
+
+    def _skip_ws(self) -> int:
+        return WHITESPACE.match(self._buffer, self._pos).end()
+
+    def _drain(self, final: bool = False) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        while self._state != "done":
+            pos = self._skip_ws()
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+
+            if self._state == "start":
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array, got {buffer[pos:pos + 20]!r}")
+                self._pos = pos + 1
+                self._state = "first"
+            elif self._state in ("first", "separator") and char == "]":
+                self._pos = pos + 1
+                self._state = "done"
+            elif self._state == "separator":
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' at {buffer[pos:pos + 20]!r}")
+                self._pos = pos + 1
+                self._state = "item"
+            else:
+                try:
+                    item, end = self._json.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if not final and (
+                            e.msg.startswith("Unterminated string") or _PARTIAL_TOKEN.match(buffer, e.pos)
+                    ):
+                        break  # item not complete yet
+                    if e.pos >= len(buffer):
+                        raise ValueError(f"Truncated JSON array after {self.items} items") from e
+                    raise
+                # A number is only complete once a delimiter follows it ("12" -> "12.5")
+                if (
+                        not final and not isinstance(item, (dict, list, str))
+                        and (end >= len(buffer) or buffer[end] not in _DELIMITERS)
+                ):
+                    break
+                items.append(item)
+                self.items += 1
+                self._pos = end
+                self._state = "separator"
+
+        if self._pos >= _COMPACT_AT:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    parser = JsonArrayStream()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    parser = JsonArrayStream()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    parser.close()
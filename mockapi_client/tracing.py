@@ -0,0 +1,245 @@
+import asyncio
+import atexit
+import json
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .config import TRACE_FILE, TRACE_FORMAT
+
+
+class Span:
+    """
+    One timed operation. Spans nest through a contextvar, so parents follow the
+    calling thread or asyncio task; ids are W3C-sized hex strings.
+    """
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "attributes", "error",
+        "start", "end", "thread", "task", "_started", "_tracer", "_token",
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self.start = 0.0
+        self.end = 0.0
+        self.thread = threading.get_ident()
+        self.task = _current_task_id()
+        self._tracer = tracer
+        self._started = 0.0
+        self._token = None
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        self.start = time.time()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # Wall-clock start plus a monotonic duration, so spans never have negative length
+        self.end = self.start + (time.perf_counter() - self._started)
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current.reset(self._token)
+        self._tracer.export(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration_ms": round(self.duration * 1000, 3),
+            "thread": self.thread,
+            "task": self.task,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """
+    Returned by span() while tracing is off: entering, setting and leaving do nothing.
+    """
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+_current: ContextVar[Optional[Span]] = ContextVar("mockapi_client_span", default=None)
+
+
+def _current_task_id() -> Optional[int]:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return None
+    return id(task) if task is not None else None
+
+
+# -------------------------------------------------
+# Exporters
+# -------------------------------------------------
+
+class InMemoryExporter:
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def close(self) -> None:
+        pass
+
+
+class JsonlExporter:
+    """
+    Appends each finished span as one JSON line (children end, and are written, before parents).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._fh = self.path.open("a", buffering=1024 * 1024)
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock:
+            self._fh.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+
+
+class ChromeTraceExporter:
+    """
+    Collects spans and writes a Chrome trace (chrome://tracing, Perfetto) on close.
+    Each thread, and each asyncio task, gets its own track so overlapping
+    concurrent requests do not collapse into one row.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        event = {
+            "name": span.name,
+            "ph": "X",
+            "ts": round(span.start * 1e6, 1),
+            "dur": round(span.duration * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": span.task or span.thread,
+            "args": {**span.attributes, "span_id": span.span_id, "parent_id": span.parent_id},
+        }
+        if span.error:
+            event["args"]["error"] = span.error
+        with self._lock:
+            self._events.append(event)
+
+    def close(self) -> None:
+        with self._lock:
+            events, self._events = self._events, []
+        with self.path.open("w") as fh:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fh, default=str)
+
+
+class Tracer:
+    def __init__(self, exporter):
+        self.exporter = exporter
+
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Span:
+        return Span(self, name, _current.get(), attributes)
+
+    def export(self, span: Span) -> None:
+        self.exporter.export(span)
+
+
+# -------------------------------------------------
+# Process-wide switch
+# -------------------------------------------------
+
+_tracer: Optional[Tracer] = None
+
+
+def span(name: str, **attributes: Any) -> Union[Span, _NoopSpan]:
+    """
+    Context manager timing the enclosed block as a child of the current span.
+    While tracing is off this returns the shared no-op span.
+
+        with span("http", method="GET") as s:
+            response = ...
+            s.set(status=response.status_code)
+    """
+    tracer = _tracer
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.start_span(name, attributes)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def configure_tracing(path: Optional[Union[str, Path]] = None, fmt: str = "jsonl", exporter: Any = None) -> Tracer:
+    """
+    Turns tracing on, exporting to `exporter` or to a file at `path`
+    (fmt="jsonl" -> JsonlExporter, fmt="chrome" -> ChromeTraceExporter).
+    Replaces, and closes, any previously configured exporter.
+    """
+    global _tracer
+    if exporter is None:
+        if path is None:
+            raise ValueError("configure_tracing needs a path or an exporter")
+        exporter = ChromeTraceExporter(path) if fmt == "chrome" else JsonlExporter(path)
+    shutdown_tracing()
+    _tracer = Tracer(exporter)
+    return _tracer
+
+
+def shutdown_tracing() -> None:
+    """
+    Turns tracing off and flushes the exporter (Chrome traces are written here).
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.exporter.close()
+
+
+atexit.register(shutdown_tracing)
+if TRACE_FILE:
+    configure_tracing(TRACE_FILE, TRACE_FORMAT)
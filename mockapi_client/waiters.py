@@ -0,0 +1,223 @@
+import asyncio
+import random
+import time
+import warnings
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .bulk import BulkResult, _call_one, gather_bounded, map_threads
+from .config import BULK_CONCURRENCY, WAIT_TIMEOUT
+from .logger import get_logger
+from .tracing import span
+
+logger = get_logger(__name__)
+
+# A condition receives the freshly fetched user (None for a 404) and says whether it holds
+Condition = Callable[[Optional[Dict]], bool]
+
+
+def visible(user: Optional[Dict]) -> bool:
+    return user is not None
+
+
+def deleted(user: Optional[Dict]) -> bool:
+    return user is None
+
+
+def fields_match(**expected: Any) -> Condition:
+    """
+    Condition: the user exists and every given field has the expected value.
+    """
+    def _matches(user: Optional[Dict]) -> bool:
+        return user is not None and all(user.get(key) == value for key, value in expected.items())
+
+    _matches.__name__ = f"fields_match({', '.join(sorted(expected))})"
+    return _matches
+
+
+@dataclass(frozen=True)
+class WaitOutcome:
+    """
+    Per-ID result of a wait: whether the condition held before the deadline,
+    how many polls it took, and the last thing seen (user, None, or an error).
+    """
+    user_id: str
+    satisfied: bool
+    attempts: int
+    elapsed: float
+    last_seen: Optional[Dict] = None
+    error: Optional[BaseException] = None
+
+
+class _WaitState:
+    def __init__(self, user_ids: List[str], started: float):
+        self.order = user_ids
+        self.pending = list(user_ids)
+        self.started = started
+        self.delay = 0.0
+        self.attempts: Dict[str, int] = {}
+        self.last_seen: Dict[str, Optional[Dict]] = {}
+        self.errors: Dict[str, BaseException] = {}
+        self.done: Dict[str, WaitOutcome] = {}
+
+
+def legacy_timeout(timeout: float, retries: Optional[int], delay: Optional[float]) -> float:
+    """
+    Maps the deprecated wait_until_deleted(retries=, delay=) keywords onto a
+    deadline of `retries * delay` seconds (old defaults: 5 and 1.0).
+    """
+    if retries is None and delay is None:
+        return timeout
+    warnings.warn(
+        "wait_until_deleted(retries=, delay=) is deprecated; pass timeout= (seconds) instead",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return (5 if retries is None else retries) * (1.0 if delay is None else delay)
+
+
+class Waiter:
+    """
+    Polls many IDs until a condition holds for each, or the deadline passes.
+
+    Polling runs in rounds: every pending ID is fetched concurrently (at most
+    `concurrency` at a time), IDs that satisfy the condition drop out, and one
+    shared sleep follows before the next round. Sleeps grow exponentially from
+    `initial_delay` to `max_delay` with +/- `jitter` (fraction) randomization and
+    never overshoot the deadline; the last round happens at the deadline.
+
+    Fetch errors are recorded and the ID stays pending, so a flaky backend only
+    delays the outcome.
+    """
+
+    def __init__(
+            self,
+            condition: Condition,
+            timeout: float = WAIT_TIMEOUT,
+            concurrency: int = BULK_CONCURRENCY,
+            initial_delay: float = 0.05,
+            max_delay: float = 2.0,
+            multiplier: float = 2.0,
+            jitter: float = 0.2,
+            clock: Callable[[], float] = time.monotonic,
+            rng: Optional[random.Random] = None,
+    ):
+        self.condition = condition
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._clock = clock
+        self._rng = rng or random.Random()
+
+    # -------------------------------------------------
+    # Round bookkeeping
+    # -------------------------------------------------
+
+    def _start(self, user_ids: Iterable[str]) -> _WaitState:
+        state = _WaitState(list(dict.fromkeys(user_ids)), self._clock())
+        state.delay = self.initial_delay
+        return state
+
+    def _apply(self, state: _WaitState, results: List[BulkResult]) -> None:
+        still_pending = []
+        for result in results:
+            user_id = result.item
+            state.attempts[user_id] = state.attempts.get(user_id, 0) + 1
+            if result.ok:
+                state.last_seen[user_id] = result.value
+                state.errors.pop(user_id, None)
+                if self.condition(result.value):
+                    state.done[user_id] = self._outcome(state, user_id, True)
+                    continue
+            else:
+                state.errors[user_id] = result.error
+            still_pending.append(user_id)
+        state.pending = still_pending
+
+    def _next_sleep(self, state: _WaitState) -> Optional[float]:
+        """
+        Sleep before the next round, or None when the deadline has passed.
+        """
+        remaining = state.started + self.timeout - self._clock()
+        if remaining <= 0:
+            return None
+        spread = self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+        sleep = min(state.delay * spread, remaining)
+        state.delay = min(self.max_delay, state.delay * self.multiplier)
+        return sleep
+
+    def _outcome(self, state: _WaitState, user_id: str, satisfied: bool) -> WaitOutcome:
+        return WaitOutcome(
+            user_id=user_id,
+            satisfied=satisfied,
+            attempts=state.attempts.get(user_id, 0),
+            elapsed=self._clock() - state.started,
+            last_seen=state.last_seen.get(user_id),
+            error=None if satisfied else state.errors.get(user_id),
+        )
+
+    def _finish(self, state: _WaitState) -> Dict[str, WaitOutcome]:
+        for user_id in state.pending:
+            state.done[user_id] = self._outcome(state, user_id, False)
+        if state.pending:
+            logger.warning(
+                "%d of %d IDs did not reach '%s' within %ss",
+                len(state.pending), len(state.done), getattr(self.condition, "__name__", self.condition), self.timeout,
+            )
+        # Preserve the caller's ID order
+        return {user_id: state.done[user_id] for user_id in state.order}
+
+    # -------------------------------------------------
+    # Runners
+    # -------------------------------------------------
+
+    def run(
+            self,
+            fetch: Callable[[str], Optional[Dict]],
+            user_ids: Iterable[str],
+            executor: Optional[Executor] = None,
+    ) -> Dict[str, WaitOutcome]:
+        """
+        Sync runner; polls on `executor` when given, else serially in this thread.
+        """
+        state = self._start(user_ids)
+        with span("wait", ids=len(state.pending)):
+            while state.pending:
+                with span("wait.poll", pending=len(state.pending)):
+                    if executor is None or len(state.pending) == 1:
+                        results = [_call_one(fetch, index, user_id) for index, user_id in enumerate(state.pending)]
+                    else:
+                        results = map_threads(executor, fetch, state.pending, self.concurrency)
+                self._apply(state, results)
+                if not state.pending:
+                    break
+                sleep = self._next_sleep(state)
+                if sleep is None:
+                    break
+                with span("wait.sleep", delay=round(sleep, 3)):
+                    time.sleep(sleep)
+        return self._finish(state)
+
+    async def run_async(
+            self,
+            fetch: Callable[[str], Awaitable[Optional[Dict]]],
+            user_ids: Iterable[str],
+    ) -> Dict[str, WaitOutcome]:
+        state = self._start(user_ids)
+        with span("wait", ids=len(state.pending)):
+            while state.pending:
+                with span("wait.poll", pending=len(state.pending)):
+                    results = await gather_bounded(fetch, state.pending, self.concurrency)
+                self._apply(state, results)
+                if not state.pending:
+                    break
+                sleep = self._next_sleep(state)
+                if sleep is None:
+                    break
+                with span("wait.sleep", delay=round(sleep, 3)):
+                    await asyncio.sleep(sleep)
+        return self._finish(state)
@@ -1,28 +1,94 @@
-import asyncio
+import os
+import tempfile
+from pathlib import Path
+
 import pytest_asyncio
 import pytest
 from mockapi_client.client import UsersApiClient
 from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.circuit_breaker import reset_circuit_breakers
 from mockapi_client.factory import UserFactory
 from mockapi_client.logger import get_logger
-from mockapi_client.config import BASE_URL
+from mockapi_client.config import BASE_URL, BULK_CONCURRENCY, USE_LOCAL_SERVER
+from mockapi_client.local_server import LocalUsersServer
+from mockapi_client.rate_limiter import default_rate_limiter
+from mockapi_client.retry import RetryPolicy
+
+from .janitor import Janitor
+from .journal import CleanupJournal
 
 logger = get_logger(__name__)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--sweep-orphans",
+        action="store_true",
+        default=False,
+        help="after the session, delete every remote user whose name matches UserFactory.NAME_PATTERN",
+    )
+
+
+def _journal_path(config) -> Path:
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        return Path(cache.mkdir("mockapi_cleanup")) / "journal.jsonl"
+    return Path(tempfile.gettempdir()) / "mockapi_cleanup" / "journal.jsonl"
+
+
+# =========================================================
+# Target (real MockAPI or local stand-in)
+# =========================================================
+
+@pytest.fixture(scope="session")
+def users_base_url():
+    """
+    Real MockAPI endpoint from BASE_URL, or a localhost stand-in server when
+    MOCKAPI_LOCAL=1 (or no BASE_URL is configured).
+    """
+    if not USE_LOCAL_SERVER:
+        yield BASE_URL
+        return
+
+    with LocalUsersServer() as server:
+        logger.info(f"Running against local stand-in server: {server.base_url}")
+        yield server.base_url
+
+
+@pytest.fixture(scope="session")
+def rate_limiter():
+    """
+    One limiter shared by every client in the session (RATE_LIMIT_RPS > 0), so
+    concurrency tests pace themselves instead of triggering MockAPI throttling.
+    """
+    limiter = default_rate_limiter()
+    yield limiter
+    if limiter is not None:
+        logger.info(f"Rate limiter stats: {limiter.stats()}")
+
+
 # =========================================================
 # Clients
 # =========================================================
 
 @pytest.fixture(scope="session")
-def api_client():
-    with UsersApiClient() as client:
+def api_client(users_base_url, rate_limiter):
+    with UsersApiClient(base_url=users_base_url, rate_limiter=rate_limiter) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def threaded_api_client(users_base_url, rate_limiter):
+    """
+    Sync client safe to share across threads (one session per thread).
+    """
+    with UsersApiClient(base_url=users_base_url, thread_safe=True, rate_limiter=rate_limiter) as client:
         yield client
 
 
 @pytest_asyncio.fixture(scope="function")
-async def async_api_client():
-    async with AsyncUsersApiClient(base_url=BASE_URL, headers={}) as client:
+async def async_api_client(users_base_url, rate_limiter):
+    async with AsyncUsersApiClient(base_url=users_base_url, headers={}, rate_limiter=rate_limiter) as client:
         yield client
 
 
@@ -30,18 +96,60 @@ async def async_api_client():
 # Factory
 # =========================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_factory():
-    factory = UserFactory()
-    yield factory
-    factory.reset()
-    logger.debug("UserFactory memory cleared")
+    """
+    One factory per session (per xdist worker): names come from a counter, so there
+    is no per-test history to clear. FACTORY_SEED makes the names reproducible.
+    """
+    return UserFactory()
+
+
+# =========================================================
+# Clock and retry policy
+# =========================================================
+
+class FakeClock:
+    """
+    Manual clock for limiter, cache and breaker tests: set `now` to move time.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def no_wait():
+    """
+    Retry policy for local fault-injection tests: 4 attempts, no backoff, no budget.
+    """
+    return RetryPolicy(max_attempts=4, base_delay=0, max_delay=0, budget=None)
 
 
 # =========================================================
 # Cleanup Registry (safe for sync + async)
 # =========================================================
 
+@pytest.fixture(scope="session")
+def cleanup_journal(request):
+    """
+    On-disk journal shared by all xdist workers, so users created by crashed tests
+    or killed workers are still swept at the end of the session (remote target only:
+    the local stand-in server's data dies with it).
+    """
+    if USE_LOCAL_SERVER:
+        return None
+    return CleanupJournal(_journal_path(request.config), worker=os.getenv("PYTEST_XDIST_WORKER", "main"))
+
+
 @pytest.fixture(scope="function")
 def cleanup_registry():
     """
@@ -58,17 +166,21 @@ def cleanup_registry():
 # =========================================================
 
 @pytest.fixture
-def register_sync_user(cleanup_registry):
+def register_sync_user(request, cleanup_registry, cleanup_journal, users_base_url):
     def _register(user_id: str):
         cleanup_registry["sync"].add(user_id)
+        if cleanup_journal is not None:
+            cleanup_journal.record(user_id, users_base_url.rstrip("/"), request.node.nodeid)
 
     return _register
 
 
 @pytest_asyncio.fixture
-async def register_async_user(cleanup_registry):
+async def register_async_user(request, cleanup_registry, cleanup_journal, users_base_url):
     async def _register(user_id: str):
         cleanup_registry["async"].add(user_id)
+        if cleanup_journal is not None:
+            cleanup_journal.record(user_id, users_base_url.rstrip("/"), request.node.nodeid)
 
     return _register
 
@@ -77,61 +189,84 @@ async def register_async_user(cleanup_registry):
 # The One True Janitor™
 # =========================================================
 
+JANITOR_KEY = pytest.StashKey[Janitor]()
+SWEEP_KEY = pytest.StashKey[list]()
+
+
+@pytest.fixture(scope="session")
+def janitor(request, users_base_url, rate_limiter, cleanup_journal):
+    """
+    One pooled, thread-safe client for all cleanup in the session.
+    """
+    with UsersApiClient(
+            base_url=users_base_url,
+            thread_safe=True,
+            max_workers=BULK_CONCURRENCY,
+            rate_limiter=rate_limiter,
+    ) as client:
+        janitor = Janitor(client, concurrency=BULK_CONCURRENCY, journal=cleanup_journal)
+        request.config.stash[JANITOR_KEY] = janitor
+        yield janitor
+        janitor.close()
+
+
 @pytest.fixture(scope="function", autouse=True)
-def final_cleanup(cleanup_registry):
+def final_cleanup(request, cleanup_registry, janitor):
     """
     Runs exactly once.
     Safe.
     Deterministic.
+
+    Sync and async registrations are cleaned together: concurrent deletes,
+    each pipelined with its own deletion check.
     """
     yield
 
-    # -------------------
-    # Sync cleanup
-    # -------------------
-
-    if cleanup_registry["sync"]:
-        logger.info(
-            f"--- Sync Cleanup: {len(cleanup_registry['sync'])} users ---"
-        )
-        with UsersApiClient() as client:
-            for user_id in cleanup_registry["sync"]:
-                try:
-                    client.delete_user(user_id)
-                    logger.debug(f"Successfully deleted user with id: {user_id}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete {user_id}: {e}")
-
-    # -------------------
-    # Async cleanup
-    # -------------------
-
-    if cleanup_registry["async"]:
-        logger.info(
-            f"--- Async Cleanup: {len(cleanup_registry['async'])} users ---"
-        )
-
-        async def _async_cleanup():
-            async with AsyncUsersApiClient(base_url=BASE_URL, headers={}) as client:
-                for user_id in cleanup_registry["async"]:
-                    logger.debug(f"Deleting async user: {user_id}")
-                    try:
-                        await client.delete_user(user_id)
-                        # Wait until deletion is confirmed
-                        success = await client.wait_until_deleted(user_id)
-                        logger.debug(f"Deletion confirmed: {success}")
-                        if success:
-                            logger.debug(f"Deleted async user {user_id}")
-                        else:
-                            logger.error(f"User {user_id} still exists after deletion")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete async user {user_id}: {e}")
+    user_ids = [*cleanup_registry["sync"], *cleanup_registry["async"]]
+    if user_ids:
+        janitor.cleanup(user_ids, label=request.node.name)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Controller-only sweep, after every xdist worker has finished: delete whatever
+    the journal still lists, then (with --sweep-orphans) any leftover factory users.
+    """
+    config = session.config
+    if hasattr(config, "workerinput") or USE_LOCAL_SERVER:
+        return
 
+    journal = CleanupJournal(_journal_path(config))
+    with UsersApiClient(base_url=BASE_URL, thread_safe=True, max_workers=BULK_CONCURRENCY) as client:
+        sweeper = Janitor(client, concurrency=BULK_CONCURRENCY, verify=False, journal=journal)
         try:
-            loop = asyncio.get_running_loop()
-            loop.run_until_complete(_async_cleanup())
-        except RuntimeError:
-            asyncio.run(_async_cleanup())
+            sweeper.sweep_journal()
+            if config.getoption("sweep_orphans"):
+                sweeper.sweep_orphans(UserFactory.NAME_PREFIX, UserFactory.NAME_PATTERN)
+        finally:
+            sweeper.close()
+    journal.compact(journal.pending())
+    config.stash[SWEEP_KEY] = sweeper.summary_lines()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    janitor = config.stash.get(JANITOR_KEY, None)
+    lines = janitor.summary_lines() if janitor is not None else []
+    lines += config.stash.get(SWEEP_KEY, [])
+    if lines:
+        terminalreporter.section("cleanup")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuit_breakers():
+    """
+    Every test starts with closed shared breakers: failures injected by one test
+    must not fail-fast the next one.
+    """
+    reset_circuit_breakers()
+    yield
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,135 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Pattern
+
+from mockapi_client.bulk import as_completed_threads
+from mockapi_client.client import UsersApiClient
+from mockapi_client.logger import get_logger
+
+from .journal import CleanupJournal
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CleanupReport:
+    label: str
+    requested: int
+    deleted: int = 0
+    confirmed: int = 0
+    failed: List[str] = field(default_factory=list)
+    unconfirmed: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+class Janitor:
+    """
+    Deletes the users registered by tests through one session-scoped, pooled
+    client (which must be thread_safe=True).
+
+    Each ID runs delete -> verify as a single pipelined unit on the janitor's
+    thread pool (at most `concurrency` at a time), so one user's verification
+    overlaps the next users' deletes instead of waiting for the whole batch.
+    Verification polls with a jittered backoff and gives up after `verify_timeout`.
+
+    With a `journal`, every successful delete is also marked in the on-disk
+    cleanup journal so the session sweeper does not retry it.
+    """
+
+    def __init__(
+            self,
+            client: UsersApiClient,
+            concurrency: int,
+            verify: bool = True,
+            verify_timeout: float = 5.0,
+            journal: Optional[CleanupJournal] = None,
+    ):
+        self.client = client
+        self.concurrency = concurrency
+        self.verify = verify
+        self.verify_timeout = verify_timeout
+        self.journal = journal
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="janitor")
+        self.reports: List[CleanupReport] = []
+
+    def _delete_and_verify(self, user_id: str) -> Optional[bool]:
+        self.client.delete_user(user_id)
+        if not self.verify:
+            return None
+        return self.client.wait_until_deleted(user_id, timeout=self.verify_timeout)
+
+    def cleanup(self, user_ids: Iterable[str], label: str = "") -> CleanupReport:
+        user_ids = list(dict.fromkeys(user_ids))
+        report = CleanupReport(label=label, requested=len(user_ids))
+        if not user_ids:
+            return report
+
+        started = time.perf_counter()
+        results = as_completed_threads(self._executor, self._delete_and_verify, user_ids, self.concurrency)
+        for result in results:
+            if not result.ok:
+                report.failed.append(result.item)
+                logger.warning(f"Failed to delete {result.item}: {result.error}")
+                continue
+            report.deleted += 1
+            if result.value:
+                report.confirmed += 1
+            elif result.value is False:
+                report.unconfirmed.append(result.item)
+                logger.error(f"User {result.item} still exists after deletion")
+        report.elapsed = time.perf_counter() - started
+        if self.journal is not None:
+            failed = set(report.failed)
+            self.journal.record_deleted((i for i in user_ids if i not in failed), self.client.base_url)
+
+        logger.info(
+            f"--- Cleanup {label}: {report.deleted}/{report.requested} deleted, "
+            f"{report.confirmed} confirmed in {report.elapsed:.2f}s ---"
+        )
+        self.reports.append(report)
+        return report
+
+    def find_orphans(self, name_prefix: str, name_pattern: Pattern) -> List[str]:
+        """
+        IDs of leftover factory-made users: filtered listing by name prefix,
+        then an exact match on the factory's name pattern.
+        """
+        return [
+            user["id"]
+            for user in self.client.iter_users(name=name_prefix)
+            if name_pattern.fullmatch(str(user.get("name", "")))
+        ]
+
+    def sweep_journal(self) -> CleanupReport:
+        """
+        Deletes every journaled ID for this client's base URL that was never cleaned up
+        (tests that crashed, workers that were killed, earlier aborted runs).
+        """
+        pending = self.journal.pending().get(self.client.base_url, []) if self.journal else []
+        return self.cleanup(pending, label="journal sweep")
+
+    def sweep_orphans(self, name_prefix: str, name_pattern: Pattern) -> CleanupReport:
+        return self.cleanup(self.find_orphans(name_prefix, name_pattern), label="orphan sweep")
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def summary_lines(self) -> List[str]:
+        if not self.reports:
+            return []
+        users = sum(r.requested for r in self.reports)
+        total = sum(r.elapsed for r in self.reports)
+        slowest = max(self.reports, key=lambda r: r.elapsed)
+        lines = [
+            f"{len(self.reports)} cleanups, {users} users, {total:.2f}s total "
+            f"({total / users * 1000:.1f} ms/user, concurrency {self.concurrency})",
+            f"slowest: {slowest.label} ({slowest.requested} users, {slowest.elapsed:.2f}s)",
+        ]
+        failed = [user_id for r in self.reports for user_id in r.failed]
+        unconfirmed = [user_id for r in self.reports for user_id in r.unconfirmed]
+        if failed:
+            lines.append(f"failed deletes: {', '.join(failed)}")
+        if unconfirmed:
+            lines.append(f"unconfirmed deletes: {', '.join(unconfirmed)}")
+        return lines
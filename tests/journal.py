@@ -0,0 +1,81 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from mockapi_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CleanupJournal:
+    """
+    Append-only JSONL record of every user a test created, shared by all
+    pytest-xdist workers (and by later runs, until it is swept).
+
+    - {"id": ..., "base_url": ..., "test": ..., "worker": ..., "ts": ...} -> created
+    - {"deleted": ..., "base_url": ...}                                   -> cleaned up
+
+    Each line is written with a single O_APPEND write, so concurrent writers never
+    interleave and a crashed or killed process loses at most its own last line.
+    Only the session controller rewrites the file (`compact`), after workers finish.
+    """
+
+    def __init__(self, path: Path, worker: str = "main"):
+        self.path = Path(path)
+        self.worker = worker
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _append(self, entries: Iterable[dict]) -> None:
+        data = "".join(json.dumps(entry) + "\n" for entry in entries).encode()
+        if not data:
+            return
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def record(self, user_id: str, base_url: str, test: Optional[str] = None) -> None:
+        self._append([{
+            "id": user_id,
+            "base_url": base_url,
+            "test": test,
+            "worker": self.worker,
+            "ts": time.time(),
+        }])
+
+    def record_deleted(self, user_ids: Iterable[str], base_url: str) -> None:
+        self._append({"deleted": user_id, "base_url": base_url} for user_id in user_ids)
+
+    def pending(self) -> Dict[str, List[str]]:
+        """
+        IDs recorded but never marked deleted, grouped by base URL (in creation order).
+        """
+        pending: Dict[str, Dict[str, None]] = {}
+        if not self.path.exists():
+            return {}
+        with self.path.open() as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn last line of a killed writer
+                ids = pending.setdefault(entry.get("base_url") or "", {})
+                if "deleted" in entry:
+                    ids.pop(entry["deleted"], None)
+                elif "id" in entry:
+                    ids[entry["id"]] = None
+        return {base_url: list(ids) for base_url, ids in pending.items() if ids}
+
+    def compact(self, remaining: Dict[str, List[str]]) -> None:
+        """
+        Atomically rewrites the journal so it only holds `remaining` IDs.
+        """
+        tmp_path = self.path.with_suffix(".tmp")
+        with tmp_path.open("w") as fh:
+            for base_url, ids in remaining.items():
+                for user_id in ids:
+                    fh.write(json.dumps({"id": user_id, "base_url": base_url, "worker": "sweeper"}) + "\n")
+        os.replace(tmp_path, self.path)
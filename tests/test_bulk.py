@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mockapi_client.bulk import as_completed_bounded, gather_bounded, map_threads, split_results
+from mockapi_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.asyncio
+@pytest.mark.concurrency
+@pytest.mark.parametrize("concurrency", [1, 4, 16])
+async def test_gather_bounded_respects_limit_and_order(concurrency):
+    """
+    Bulk runner contract (no network):
+    - Never more than `concurrency` calls in flight
+    - Results come back in input order
+    - Failures are returned as structured results, not raised
+    """
+    in_flight = 0
+    peak = 0
+
+    async def work(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Reverse-ordered delays so completion order differs from input order
+        await asyncio.sleep(0.001 * (50 - item))
+        in_flight -= 1
+        if item % 7 == 0:
+            raise ValueError(f"bad item {item}")
+        return item * 2
+
+    results = await gather_bounded(work, (i for i in range(50)), concurrency)
+
+    logger.info(f"Peak in-flight calls: {peak} (limit {concurrency})")
+    assert peak <= concurrency
+    assert [r.index for r in results] == list(range(50))
+
+    successes, failures = split_results(results)
+    assert all(r.value == r.item * 2 for r in successes)
+    assert [r.item for r in failures] == [i for i in range(50) if i % 7 == 0]
+    assert all(isinstance(r.error, ValueError) for r in failures)
+
+
+@pytest.mark.asyncio
+@pytest.mark.concurrency
+async def test_as_completed_bounded_streams_and_cancels():
+    """
+    Streaming mode yields results as they finish and cancels in-flight work
+    when the consumer stops early.
+    """
+    started = []
+
+    async def work(item):
+        started.append(item)
+        await asyncio.sleep(0.01)
+        return item
+
+    received = []
+    async for result in as_completed_bounded(work, range(1000), concurrency=5):
+        received.append(result.value)
+        if len(received) == 10:
+            break
+
+    assert len(received) == 10
+    # Only a bounded window of items was ever pulled from the input
+    assert len(started) < 20
+
+
+@pytest.mark.concurrency
+def test_map_threads_bounded_window_and_order():
+    """
+    Thread-pool bulk runner: bounded number of pending futures, input order preserved.
+    """
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def work(item):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.001 * (item % 5))
+        with lock:
+            in_flight -= 1
+        if item == 13:
+            raise RuntimeError("unlucky")
+        return -item
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = map_threads(executor, work, range(100), concurrency=4)
+
+    assert peak <= 4
+    assert [r.index for r in results] == list(range(100))
+    successes, failures = split_results(results)
+    assert [r.item for r in failures] == [13]
+    assert all(r.value == -r.item for r in successes)
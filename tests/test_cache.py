@@ -0,0 +1,183 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.cache import MISSING, TTLCache
+from mockapi_client.client import UsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+from mockapi_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def test_ttl_cache_lru_ttl_and_negative_entries(fake_clock):
+    """
+    LRU eviction beyond maxsize, per-entry TTL, short-lived negative entries.
+    """
+    cache = TTLCache(maxsize=2, ttl=10, negative_ttl=1, clock=fake_clock)
+
+    cache.set("1", {"id": "1"})
+    cache.set("2", {"id": "2"})
+    assert cache.get("1") == {"id": "1"}  # "1" becomes most recently used
+    cache.set("3", {"id": "3"})           # evicts "2"
+    assert cache.get("2") is MISSING
+
+    cache.set("404", None)
+    assert cache.get("404") is None       # negative hit
+    fake_clock.now = 1.5
+    assert cache.get("404") is MISSING    # negative TTL elapsed
+    fake_clock.now = 10.5
+    assert cache.get("3") is MISSING      # positive TTL elapsed
+
+    # Callers get copies, so they cannot corrupt cached entries
+    cache.set("4", {"id": "4"})
+    cache.get("4")["id"] = "mutated"
+    assert cache.get("4") == {"id": "4"}
+
+    stats = cache.stats()
+    logger.info(f"Cache stats: {stats}")
+    assert stats["evictions"] == 2
+    assert stats["negative_hits"] == 1
+    assert stats["expirations"] == 2
+
+
+def test_ttl_cache_thread_safety():
+    cache = TTLCache(maxsize=64)
+
+    def hammer(offset):
+        for i in range(2000):
+            key = (i + offset) % 100
+            if cache.get(key) is MISSING:
+                cache.set(key, {"id": key})
+
+    threads = [threading.Thread(target=hammer, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats["size"] <= 64
+    assert stats["hits"] + stats["misses"] == 8 * 2000
+
+
+@pytest.mark.contract
+def test_sync_client_read_through_cache():
+    """
+    Repeated get_user calls are served from cache; patch writes through, delete evicts.
+    """
+    backend = UsersBackend()
+    cache = TTLCache()
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session(), cache=cache) as api:
+        user = api.create_user({"name": "cached", "email": "cached@example.com"})
+        for _ in range(5):
+            assert api.get_user(user["id"])["name"] == "cached"
+
+        api.patch_user(user["id"], {"name": "patched"})
+        assert api.get_user(user["id"])["name"] == "patched"
+
+        api.delete_user(user["id"])
+        assert api.get_user(user["id"]) is None
+        assert api.get_user(user["id"]) is None  # negative hit, no request
+
+    # create + 1 get + patch + delete + 1 get (404)
+    assert backend.stats()["requests"] == 5
+    assert cache.stats()["hits"] == 5
+    assert cache.stats()["negative_hits"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_async_client_read_through_cache():
+    backend = UsersBackend()
+    cache = TTLCache()
+    async with AsyncUsersApiClient(LOCAL_BASE_URL, {}, transport=backend.async_transport(), cache=cache) as api:
+        user = await api.create_user({"name": "cached", "email": "cached@example.com"})
+        results = await api.get_users([user["id"]] * 10, concurrency=1)
+        assert all(r.ok and r.value["name"] == "cached" for r in results)
+
+        await api.delete_user(user["id"])
+        assert await api.get_user(user["id"]) is None
+        assert await api.get_user(user["id"]) is None  # negative hit, no request
+
+    assert cache.stats()["hits"] == 9
+    assert cache.stats()["negative_hits"] == 1
+    # create + 1 get + delete + 1 live 404 (4xx is never retried)
+    assert backend.stats()["requests"] == 4
+
+
+def test_writes_that_raced_an_invalidation_are_dropped():
+    cache = TTLCache()
+    since = cache.version()
+    cache.invalidate("1")
+    cache.set("1", {"id": "1"}, since=since)   # read began before the invalidation
+    assert cache.get("1") is MISSING
+    cache.set("1", {"id": "1"}, since=cache.version())
+    assert cache.get("1") == {"id": "1"}
+
+    since = cache.version()
+    cache.clear()
+    cache.set("2", {"id": "2"}, since=since)
+    assert cache.get("2") is MISSING
+
+
+def test_forgotten_invalidation_stamps_still_drop_stale_writes():
+    cache = TTLCache(maxsize=2)
+    since = cache.version()
+    for key in ("1", "2", "3"):  # maxsize + 1: the stamp for "1" is no longer kept
+        cache.invalidate(key)
+    cache.set("1", {"id": "1"}, since=since)
+    assert cache.get("1") is MISSING
+    # Reads that start afterwards are cached as usual
+    cache.set("1", {"id": "1"}, since=cache.version())
+    assert cache.get("1") == {"id": "1"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_slow_get_does_not_resurrect_a_deleted_user():
+    """
+    A get_user in flight while the user is deleted must not write it back into the
+    cache, whether the read started before the delete or between its eviction and
+    the server applying it.
+    """
+    users = {"1": b'{"id": "1", "name": "alive"}'}
+    release_get = asyncio.Event()
+    release_delete = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        user_id = request.url.path.rsplit("/", 1)[-1]
+        if request.method == "DELETE":
+            await release_delete.wait()
+            users.pop(user_id, None)
+            return httpx.Response(200, content=b"{}")
+        body = users.get(user_id)
+        await release_get.wait()
+        return httpx.Response(200, content=body) if body else httpx.Response(404, content=b"Not found")
+
+    cache = TTLCache()
+    async with AsyncUsersApiClient(
+            LOCAL_BASE_URL, {}, transport=httpx.MockTransport(handler), cache=cache, metrics=None,
+    ) as api:
+        # 1. The read starts first and returns after the whole delete
+        slow_get = asyncio.create_task(api.get_user("1"))
+        await asyncio.sleep(0.01)
+        release_delete.set()
+        await api.delete_user("1")
+        release_get.set()
+        assert (await slow_get)["name"] == "alive"
+        assert cache.get("1") is MISSING
+
+        # 2. The read starts after the delete evicted, and is answered before the server deletes
+        users["1"] = b'{"id": "1", "name": "alive"}'
+        release_delete.clear()
+        delete = asyncio.create_task(api.delete_user("1"))
+        await asyncio.sleep(0.01)
+        assert (await api.get_user("1"))["name"] == "alive"
+        release_delete.set()
+        await delete
+        assert cache.get("1") is MISSING
+        assert await api.get_user("1") is None
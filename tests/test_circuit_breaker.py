@@ -0,0 +1,142 @@
+import httpx
+import pytest
+import requests
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState, get_circuit_breaker
+from mockapi_client.client import UsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+from mockapi_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def test_breaker_state_machine(fake_clock):
+    events = []
+    breaker = CircuitBreaker(
+        "users", failure_rate_threshold=0.5, window_size=4, minimum_calls=4,
+        open_duration=5, half_open_max_calls=2, clock=fake_clock,
+    )
+    breaker.add_listener(lambda b, old, new: events.append((old, new)))
+
+    for failed in (False, True, False, True):
+        breaker.before_call()
+        breaker.record_failure() if failed else breaker.record_success()
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    fake_clock.now = 5
+    breaker.before_call()           # first trial call
+    breaker.before_call()           # second trial call
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()       # no more trial permits
+    breaker.record_success()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+    assert events == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_breaker_slow_calls_and_failed_trial(fake_clock):
+    breaker = CircuitBreaker(
+        "users", slow_call_duration=1.0, slow_call_rate_threshold=0.5,
+        window_size=2, minimum_calls=2, open_duration=1, clock=fake_clock,
+    )
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_success(duration=2.0)
+    assert breaker.state is CircuitState.OPEN
+
+    fake_clock.now = 1
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+
+@pytest.mark.edge
+def test_sync_client_fails_fast_when_open(no_wait):
+    backend = UsersBackend(error_rate=1.0, error_statuses=(503,))
+    breaker = CircuitBreaker("local", window_size=4, minimum_calls=4, open_duration=60)
+    with UsersApiClient(
+            base_url=LOCAL_BASE_URL, session=backend.requests_session(),
+            retry_policy=no_wait, circuit_breaker=breaker,
+    ) as api:
+        for _ in range(2):
+            with pytest.raises((requests.exceptions.HTTPError, CircuitOpenError)):
+                api.get_user("1")
+        sent = backend.stats()["requests"]
+        assert breaker.state is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            api.create_user({"name": "blocked"})
+    assert backend.stats()["requests"] == sent == 4
+    logger.info(f"Breaker stats: {breaker.stats()}")
+
+
+@pytest.mark.asyncio
+@pytest.mark.edge
+async def test_async_client_fails_fast_and_ignores_4xx(no_wait):
+    backend = UsersBackend()
+    breaker = CircuitBreaker("local-async", window_size=4, minimum_calls=4)
+    async with AsyncUsersApiClient(
+            LOCAL_BASE_URL, {}, transport=backend.async_transport(),
+            retry_policy=no_wait, circuit_breaker=breaker,
+    ) as api:
+        # 404s mean the endpoint is healthy: they never trip the breaker
+        for _ in range(4):
+            assert await api.get_user("missing") is None
+        assert breaker.state is CircuitState.CLOSED
+
+    backend = UsersBackend(timeout_rate=1.0, timeout_delay=0.01)
+    async with AsyncUsersApiClient(
+            LOCAL_BASE_URL, {}, transport=backend.async_transport(),
+            retry_policy=no_wait, circuit_breaker=breaker,
+    ) as api:
+        # Two timeouts push the window to 50% failures; the third attempt fails fast
+        with pytest.raises(CircuitOpenError):
+            await api.get_user("1")
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            await api.create_user({"name": "blocked"})
+    assert backend.stats()["requests"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.edge
+async def test_shared_breakers_are_per_backend_and_can_be_disabled(no_wait):
+    """
+    Failures injected on one in-process backend never open the shared breaker of
+    another, and circuit_breaker=False opts a single client out entirely.
+    """
+    failing = UsersBackend(error_rate=1.0, error_statuses=(503,))
+    async with AsyncUsersApiClient(
+            failing.base_url, {}, transport=failing.async_transport(), retry_policy=no_wait,
+    ) as api:
+        for _ in range(4):
+            with pytest.raises((httpx.HTTPStatusError, CircuitOpenError)):
+                await api.get_user("1")
+    assert get_circuit_breaker(failing.base_url).state is CircuitState.OPEN
+
+    healthy = UsersBackend()
+    async with AsyncUsersApiClient(healthy.base_url, {}, transport=healthy.async_transport()) as api:
+        assert await api.get_user("1") is None
+    assert api.circuit_breaker is get_circuit_breaker(healthy.base_url)
+
+    # Opted out: every request reaches the (still failing) backend, nothing fails fast
+    with UsersApiClient(
+            base_url=failing.base_url, session=failing.requests_session(), retry_policy=no_wait,
+            circuit_breaker=False,
+    ) as api:
+        assert api.circuit_breaker is None
+        sent = failing.stats()["requests"]
+        for _ in range(3):
+            with pytest.raises(requests.exceptions.HTTPError):
+                api.get_user("1")
+    assert failing.stats()["requests"] == sent + 3 * no_wait.max_attempts
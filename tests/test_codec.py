@@ -0,0 +1,117 @@
+import json
+
+import httpx
+import pytest
+
+from core.normalizers import normalize_users, normalize_users_json
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.client import UsersApiClient
+from mockapi_client.codec import JsonCodec, get_codec
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+
+
+def _installed(name: str):
+    try:
+        return get_codec(name)
+    except ImportError:
+        return pytest.param(None, marks=pytest.mark.skip(reason=f"{name} not installed"), id=name)
+
+
+CODECS = [_installed(name) for name in ("json", "orjson", "msgspec")]
+
+DOCUMENTS = [
+    {"id": "1", "name": "Zoë Ångström", "email": "zoe@example.com", "tags": ["a", "ß", "日本"]},
+    [{"id": str(i), "score": i / 3, "active": i % 2 == 0, "meta": None} for i in range(50)],
+    {"nested": {"deep": [1, 2.5, -3, True, False, None, "x"]}, "empty": {}, "list": []},
+    {"big": 2 ** 70},
+    [],
+    "plain string",
+]
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_every_backend_round_trips_like_the_stdlib(codec):
+    for document in DOCUMENTS:
+        encoded = codec.dumps(document)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == document
+        assert codec.loads(encoded) == codec.loads(encoded.decode()) == document
+        assert codec.loads(json.dumps(document).encode()) == document
+    # Non-str keys are not valid for every fast backend; they fall back to the stdlib
+    assert json.loads(codec.dumps({1: "one"})) == {"1": "one"}
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_malformed_input_raises_value_error(codec):
+    for body in (b"{", b"[1, 2", b"not json", b'{"a": }'):
+        with pytest.raises(ValueError):
+            codec.loads(body)
+
+
+def test_codec_selection():
+    auto = get_codec("auto")
+    assert auto.name in ("orjson", "msgspec", "json")
+    assert get_codec("json").name == "json"
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("yaml")
+
+
+def _counting(codec: JsonCodec, counts: dict) -> JsonCodec:
+    def dumps(obj):
+        counts["dumps"] += 1
+        return codec.dumps(obj)
+
+    def loads(data):
+        counts["loads"] += 1
+        return codec.loads(data)
+
+    return JsonCodec("counting", dumps, loads)
+
+
+@pytest.mark.contract
+def test_sync_client_encodes_and_decodes_through_its_codec():
+    counts = {"dumps": 0, "loads": 0}
+    backend = UsersBackend()
+    with UsersApiClient(
+            base_url=LOCAL_BASE_URL, session=backend.requests_session(), metrics=None,
+            codec=_counting(get_codec("auto"), counts),
+    ) as api:
+        created = api.create_user({"name": "Zoë", "email": "zoe@example.com"})
+        assert api.get_user(created["id"])["name"] == "Zoë"
+        assert api.list_users_page(1, 10) == [created]
+        assert api.get_user("999999") is None
+
+    assert counts == {"dumps": 1, "loads": 3}
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_async_client_sends_encoded_bytes_as_json():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.headers.get("Content-Type"), request.content))
+        return httpx.Response(201, content=request.content)
+
+    counts = {"dumps": 0, "loads": 0}
+    async with AsyncUsersApiClient(
+            LOCAL_BASE_URL, {}, transport=httpx.MockTransport(handler), metrics=None,
+            codec=_counting(get_codec("auto"), counts),
+    ) as api:
+        echoed = await api.create_user({"name": "Zoë"})
+
+    assert echoed == {"name": "Zoë"}
+    assert seen == [("application/json", get_codec("auto").dumps({"name": "Zoë"}))]
+    assert counts == {"dumps": 1, "loads": 1}
+
+
+def test_normalize_users_json_matches_normalize_users():
+    raw = [
+        {"id": "1", "name": "name 1", "first_name": "Ann", "last_name": "last_name 1", "email": "A@X.COM"},
+        {"id": 2, "name": "Bob", "email": None},
+        "junk",
+    ]
+    body = json.dumps(raw).encode()
+    assert normalize_users_json(body) == normalize_users(raw)
+    assert normalize_users_json(body, codec=get_codec("json")) == normalize_users(raw)
+    assert normalize_users_json(b"") == normalize_users_json(b'{"id": "1"}') == []
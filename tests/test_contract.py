@@ -1,6 +1,6 @@
 from mockapi_client.logger import get_logger
 import pytest
-from core.normalizers import normalize_users
+from core.normalizers import iter_normalize_users, normalize_users
 from core.validators import validate_users, ValidationError
 
 logger = get_logger(__name__)
@@ -55,3 +55,16 @@ def test_validation_edge_cases(invalid_input):
     """Specific edge cases for the validator using parametrization."""
     with pytest.raises(ValidationError):
         validate_users(invalid_input)
+
+
+def test_iter_normalize_users_matches_batch():
+    """The streaming normalizer yields the same records as normalize_users, from any iterable."""
+    raw_users = [
+        {"id": 1, "email": "A@B.com", "name": "name 1", "first_name": "Ann"},
+        "not_a_dict",
+        {"id": 2, "email": None, "first_name": "first_name 2", "last_name": "Lee"},
+    ]
+
+    streamed = iter_normalize_users(user for user in raw_users)
+
+    assert list(streamed) == normalize_users(raw_users)
@@ -0,0 +1,125 @@
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mockapi_client import factory as factory_module
+from mockapi_client.factory import UserFactory
+
+
+def test_names_are_unique_and_match_the_sweep_pattern():
+    factories = [UserFactory(), UserFactory()]
+    names = [f.create_user_payload()["name"] for f in factories for _ in range(1_000)]
+    names += [p["name"] for f in factories for p in f.create_user_payloads(1_000)]
+
+    assert len(set(names)) == len(names)
+    # Unseeded factories in one process share the run prefix and counter
+    assert {name.rsplit("_", 1)[0] for name in names} == {f"user_{factories[0].prefix}"}
+    assert all(UserFactory.NAME_PATTERN.fullmatch(name) for name in names)
+    assert UserFactory.NAME_PATTERN.fullmatch("user_0a1b2c3d")  # pre-counter names are still swept
+    assert not UserFactory.NAME_PATTERN.fullmatch("user_0a1b2c3d_x")
+
+
+def test_payload_shape_and_overrides():
+    factory = UserFactory(prefix="0000beef")
+    assert factory.create_user_payload() == {"name": "user_0000beef_0", "email": "user_0000beef_0@example.com"}
+    assert list(factory.create_user_payloads(2, email="fixed@example.com")) == [
+        {"name": "user_0000beef_1", "email": "fixed@example.com"},
+        {"name": "user_0000beef_2", "email": "fixed@example.com"},
+    ]
+    # Taking n payloads consumes exactly n names
+    assert factory.create_user_payload(name="x")["name"] == "x"
+    assert factory.create_user_payload()["name"] == "user_0000beef_4"
+    with pytest.raises(ValueError):
+        UserFactory(prefix="not-hex!")
+
+
+def _names_in_subprocess(seed, worker: str) -> str:
+    script = f"from mockapi_client.factory import UserFactory; print([p['name'] for p in UserFactory(seed={seed!r}).create_user_payloads(5)])"
+    return subprocess.check_output([sys.executable, "-c", script], text=True, env={**os.environ, "PYTEST_XDIST_WORKER": worker})
+
+
+def test_seeded_factories_are_deterministic_per_worker():
+    first = _names_in_subprocess(7, "gw0")
+    assert first == _names_in_subprocess(7, "gw0")
+    assert first != _names_in_subprocess(8, "gw0")
+    assert first != _names_in_subprocess(7, "gw1")
+
+
+def test_factories_with_the_same_seed_never_repeat_a_name(monkeypatch):
+    names = [p["name"] for p in UserFactory(seed=7).create_user_payloads(5)]
+    names += [UserFactory(seed=7).create_user_payload()["name"] for _ in range(5)]
+
+    # FACTORY_SEED gives every default factory the same seed: they must still not collide
+    monkeypatch.setattr(factory_module, "FACTORY_SEED", "ci")
+    names += [UserFactory().create_user_payload()["name"] for _ in range(5)]
+    names += [p["name"] for p in UserFactory().create_user_payloads(5)]
+
+    assert len(set(names)) == len(names) == 20
+    assert len({name.rsplit("_", 1)[0] for name in names}) == 2
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+@pytest.mark.parametrize("seed", [None, "fork"])
+def test_factory_created_before_fork_gets_fresh_names_in_the_child(seed):
+    factory = UserFactory(seed=seed)
+    parent = [p["name"] for p in factory.create_user_payloads(3)]
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child: report its names and leave without running pytest's teardown
+        try:
+            child = [factory.create_user_payload()["name"] for _ in range(3)]
+            os.write(write_end, json.dumps(child).encode())
+        finally:
+            os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end) as fh:
+        child = json.loads(fh.read())
+    os.waitpid(pid, 0)
+    parent += [factory.create_user_payload()["name"] for _ in range(3)]
+
+    assert len(child) == 3 and not set(child) & set(parent)
+    assert child[0].rsplit("_", 1)[0] != parent[0].rsplit("_", 1)[0]
+
+
+def test_unseeded_prefixes_differ_between_processes():
+    script = "from mockapi_client.factory import UserFactory; print(UserFactory().prefix)"
+    prefixes = {subprocess.check_output([sys.executable, "-c", script], text=True).strip() for _ in range(3)}
+    assert len(prefixes) == 3
+
+
+def test_shared_factory_across_threads():
+    factory = UserFactory(seed="threads")
+
+    def make(_):
+        return [p["name"] for p in factory.create_user_payloads(5_000)] + [
+            factory.create_user_payload()["name"] for _ in range(500)
+        ]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        names = [name for chunk in pool.map(make, range(8)) for name in chunk]
+
+    assert len(set(names)) == len(names) == 8 * 5_500
+
+
+def test_memory_does_not_grow_with_volume():
+    factory = UserFactory()
+
+    def peak(n):
+        tracemalloc.start()
+        try:
+            deque(factory.create_user_payloads(n), maxlen=0)
+            for _ in range(n // 10):
+                factory.create_user_payload()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak(10_000), peak(200_000)
+    assert large < small * 2 + 10_000
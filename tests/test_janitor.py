@@ -0,0 +1,59 @@
+import pytest
+
+from mockapi_client.client import UsersApiClient
+from mockapi_client.factory import UserFactory
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+from mockapi_client.logger import get_logger
+
+from .janitor import Janitor
+from .journal import CleanupJournal
+
+logger = get_logger(__name__)
+
+
+def test_journal_tracks_pending_ids(tmp_path):
+    journal = CleanupJournal(tmp_path / "journal.jsonl", worker="gw0")
+    journal.record("1", "http://a/users", "test_one")
+    journal.record("2", "http://a/users", "test_two")
+    journal.record("9", "http://b/users")
+    journal.record_deleted(["1"], "http://a/users")
+    with (tmp_path / "journal.jsonl").open("a") as fh:
+        fh.write('{"id": "torn')  # killed writer
+
+    assert journal.pending() == {"http://a/users": ["2"], "http://b/users": ["9"]}
+
+    journal.compact({"http://b/users": ["9"]})
+    assert journal.pending() == {"http://b/users": ["9"]}
+
+
+@pytest.mark.contract
+def test_journal_and_orphan_sweeps(tmp_path, user_factory):
+    """
+    IDs journaled by a "crashed" test are swept; orphan mode removes leftover
+    factory users only, never other records.
+    """
+    backend = UsersBackend()
+    journal = CleanupJournal(tmp_path / "journal.jsonl")
+    with UsersApiClient(
+            base_url=LOCAL_BASE_URL, session=backend.requests_session(), thread_safe=True
+    ) as api:
+        crashed = [api.create_user(user_factory.create_user_payload())["id"] for _ in range(3)]
+        orphan = api.create_user(user_factory.create_user_payload())["id"]
+        keeper = api.create_user({"name": "user_keeper", "email": "keeper@example.com"})["id"]
+        for user_id in crashed:
+            journal.record(user_id, api.base_url, "test_that_crashed")
+
+        janitor = Janitor(api, concurrency=4, verify=False, journal=journal)
+        try:
+            assert janitor.sweep_journal().deleted == 3
+            assert journal.pending() == {}
+
+            report = janitor.sweep_orphans(UserFactory.NAME_PREFIX, UserFactory.NAME_PATTERN)
+            assert report.deleted == 1
+        finally:
+            janitor.close()
+
+        remaining = [user["id"] for user in api.iter_users()]
+    assert remaining == [keeper]
+    assert orphan not in remaining
+    logger.info("\n".join(janitor.summary_lines()))
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from mockapi_client.load import LoadGenerator, main, parse_mix, run_load
+from mockapi_client.local_server import LOCAL_BASE_URL, Fixed, UsersBackend
+
+
+def test_parse_mix():
+    assert parse_mix("create=2, get=5,list") == {"create": 2.0, "get": 5.0, "list": 1.0}
+    for bad in ("create=1,fetch=2", "get=-1", "get=0,create=0", ""):
+        with pytest.raises(ValueError):
+            parse_mix(bad)
+
+
+class SingleServerApi:
+    """Fake client served by one slow worker: requests queue behind each other."""
+
+    def __init__(self, service_time: float):
+        self.service_time = service_time
+        self._server = asyncio.Lock()
+        self._next_id = 0
+
+    async def _serve(self):
+        async with self._server:
+            await asyncio.sleep(self.service_time)
+
+    async def create_user(self, payload):
+        await self._serve()
+        self._next_id += 1
+        return {"id": str(self._next_id), **payload}
+
+    async def get_user(self, user_id):
+        await self._serve()
+
+
+@pytest.mark.asyncio
+async def test_open_loop_exposes_queueing_that_closed_loop_hides():
+    mix = {"create": 1, "get": 3}
+    # Capacity is 50 req/s; the open loop offers 100 req/s, the closed loop waits for each reply
+    closed = await LoadGenerator(SingleServerApi(0.02), mix, duration=0.5, concurrency=1, interval=10).run()
+    opened = await LoadGenerator(SingleServerApi(0.02), mix, duration=0.5, rate=100, interval=10).run()
+
+    assert closed["mode"] == "closed" and opened["mode"] == "open"
+    assert closed["latency"]["p99_ms"] < 40
+    # Requests scheduled late in the run waited for the whole backlog ahead of them
+    assert opened["latency"]["max_ms"] > 200
+    assert opened["scheduled"] == opened["completed"] == 50
+    assert set(opened["per_op"]) == {"create", "get"}
+
+
+@pytest.mark.asyncio
+async def test_arrivals_beyond_max_in_flight_are_dropped():
+    report = await LoadGenerator(
+        SingleServerApi(0.05), {"create": 1}, duration=0.5, rate=200, max_in_flight=5, interval=10,
+    ).run()
+    assert report["dropped"] > 0
+    assert report["scheduled"] == report["completed"] + report["dropped"]
+
+
+class StallingApi:
+    """
+    Fake client whose first call blocks the event loop, so the open-loop scheduler falls behind.
+    """
+
+    def __init__(self, service_time: float = 0.05):
+        self.service_time = service_time
+        self.active = self.peak = 0
+        self.stalled = False
+
+    async def create_user(self, payload):
+        if not self.stalled:
+            self.stalled = True
+            time.sleep(0.3)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.service_time)
+        finally:
+            self.active -= 1
+        return None  # as the client does for a response without a user
+
+
+@pytest.mark.asyncio
+async def test_overdue_arrivals_after_a_stall_respect_max_in_flight():
+    api = StallingApi()
+    report = await LoadGenerator(api, {"create": 1}, duration=0.5, rate=200, max_in_flight=5, interval=10).run()
+
+    assert api.peak <= 5
+    assert report["dropped"] > 0
+    # A create that returns no user is an error, not a crash, and leaves nothing to clean up
+    assert report["errors"] == report["completed"] > 0
+
+
+@pytest.mark.asyncio
+async def test_overdue_arrivals_run_while_the_scheduler_catches_up():
+    # Requests finish after one yield, so catching up after the stall must not drop them for lack of slots
+    report = await LoadGenerator(
+        StallingApi(service_time=0), {"create": 1}, duration=0.5, rate=200, max_in_flight=5, interval=10,
+    ).run()
+
+    assert report["dropped"] == 0
+    assert report["scheduled"] == report["completed"] == 100
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_run_load_against_local_backend_cleans_up():
+    backend = UsersBackend(latency=Fixed(0.002), seed=3)
+    report = await run_load(
+        LOCAL_BASE_URL, parse_mix("create=3,get=4,patch=2,delete=1,list=1"), duration=1.0,
+        rate=150, interval=0.25, seed=3, transport=backend.async_transport(),
+    )
+
+    assert report["errors"] == 0 and report["dropped"] == 0
+    assert 140 <= report["scheduled"] <= 151
+    assert set(report["per_op"]) == {"create", "get", "patch", "delete", "list"}
+    assert report["per_op"]["create"]["latency"]["p50_ms"] >= 2
+    assert len(report["intervals"]) >= 3
+    assert report["client"]["operations"]
+    assert report["cleanup"]["failed"] == 0
+    assert backend.stats()["records"] == 0
+
+
+@pytest.mark.contract
+def test_cli_writes_json_report(tmp_path):
+    output = tmp_path / "load.json"
+    main(["--local", "--concurrency", "4", "--duration", "1", "--interval", "0.5", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    assert report["mode"] == "closed" and report["completed"] > 0
+    assert report["server"]["records"] == 0
+    assert report["config"]["concurrency"] == 4
@@ -0,0 +1,151 @@
+import gc
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import requests
+
+from core.normalizers import normalize_users
+from core.validators import validate_users
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.client import UsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, Fixed, LocalUsersServer, UsersBackend
+from mockapi_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.contract
+def test_in_process_sync_crud_and_filtering(user_factory):
+    """
+    UsersApiClient against the in-process backend (no sockets):
+    CRUD, MockAPI-style autofill junk, filtering and pagination.
+    """
+    backend = UsersBackend()
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session()) as api:
+        created = [api.create_user(user_factory.create_user_payload()) for _ in range(5)]
+        anonymous = api.create_user({"email": "Anon@Example.com", "first_name": "Ann", "last_name": "Lee"})
+
+        # MockAPI fills missing schema fields with "<field> <id>" junk; normalization removes it
+        assert anonymous["name"] == f"name {anonymous['id']}"
+        normalized = normalize_users([anonymous])
+        validate_users(normalized)
+        assert normalized[0]["name"] == "Ann Lee"
+
+        assert api.get_user(created[0]["id"])["name"] == created[0]["name"]
+        assert api.patch_user(created[0]["id"], {"name": "renamed"})["name"] == "renamed"
+        assert [u["id"] for u in api.iter_users(page_size=2)] == [u["id"] for u in created + [anonymous]]
+        assert [u["id"] for u in api.list_users_page(1, 10, name="renamed")] == [created[0]["id"]]
+
+        assert api.delete_user(created[1]["id"]) is True
+        assert api.get_user(created[1]["id"]) is None
+        assert backend.stats()["records"] == 5
+
+
+@pytest.mark.contract
+def test_eventual_consistency_on_delete():
+    """
+    Deleted records stay visible for `delete_delay` seconds, like the real backend.
+    """
+    backend = UsersBackend(delete_delay=0.3)
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session()) as api:
+        user = api.create_user({"name": "ghost", "email": "ghost@example.com"})
+        api.delete_user(user["id"])
+
+        assert api.get_user(user["id"]) is not None, "Deleted user should still be visible"
+        assert api.wait_until_deleted(user["id"], timeout=2)
+
+
+@pytest.mark.edge
+def test_bad_paging_reason_phrases_and_purged_deletes():
+    backend = UsersBackend(delete_delay=0.05)
+    for query in ("limit=ten", "limit=5&page=x", "limit=0"):
+        response = backend.handle("GET", f"{LOCAL_BASE_URL}?{query}")
+        assert response.status == 400, query
+
+    ids = [json.loads(backend.handle("POST", LOCAL_BASE_URL, b'{"name": "x"}').body)["id"] for _ in range(50)]
+    for user_id in ids:
+        backend.handle("DELETE", f"{LOCAL_BASE_URL}/{user_id}")
+    time.sleep(0.06)
+    # Expired soft-deletes are dropped by the next write, even if nobody reads them again
+    backend.handle("POST", LOCAL_BASE_URL, b'{"name": "y"}')
+    assert backend.stats()["records"] == 1
+
+    for status, phrase in ((429, "Too Many Requests"), (503, "Service Unavailable")):
+        response = UsersBackend(error_rate=1.0, error_statuses=(status,)).handle("GET", LOCAL_BASE_URL)
+        assert (response.status, json.loads(response.body)) == (status, phrase)
+
+
+@pytest.mark.contract
+def test_process_server_under_spawn():
+    """
+    The backend (and its state) is pickled to the child, which needs no fork().
+    """
+    backend = UsersBackend(latency=Fixed(0.001), seed=1)
+    backend.handle("POST", LOCAL_BASE_URL, b'{"name": "before-start"}')
+    with LocalUsersServer(backend, process=True, mp_context="spawn") as server:
+        users = requests.get(server.base_url, timeout=5).json()
+        assert [user["name"] for user in users] == ["before-start"]
+        assert server.stats()["records"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.edge
+async def test_async_fault_injection():
+    """
+    Injected 5xx and timeouts reach the async client as real httpx errors.
+    """
+    backend = UsersBackend(error_rate=1.0, error_statuses=(503,), latency=Fixed(0.001), seed=7)
+    async with AsyncUsersApiClient(backend.base_url, {}, transport=backend.async_transport()) as api:
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            await api.get_user("1")
+    assert excinfo.value.response.status_code == 503
+    assert backend.stats()["errors_injected"] == backend.stats()["requests"] > 1
+
+    backend = UsersBackend(timeout_rate=1.0, timeout_delay=0.05)
+    async with AsyncUsersApiClient(backend.base_url, {}, transport=backend.async_transport()) as api:
+        with pytest.raises(httpx.ReadTimeout):
+            await api.get_user("1")
+    logger.info(f"Timeout injection stats: {backend.stats()}")
+
+
+def _run_in_threads(func, count: int) -> None:
+    threads = [threading.Thread(target=func) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    del threads
+    gc.collect()
+
+
+@pytest.mark.contract
+def test_thread_sessions_are_released_when_their_threads_exit():
+    """
+    A long-lived thread_safe client used from short-lived threads does not keep
+    one session (and its sockets) per thread that ever touched it.
+    """
+    with LocalUsersServer() as server:
+        with UsersApiClient(base_url=server.base_url, thread_safe=True) as api:
+            closed = []
+            user_id = api.create_user({"name": "threads"})["id"]
+
+            def fetch():
+                session = api.session
+                session.close = lambda close=session.close: (closed.append(session), close())
+                assert api.get_user(user_id)["name"] == "threads"
+
+            _run_in_threads(fetch, 20)
+            # Only the (still running) main thread keeps its session
+            assert list(api._thread_sessions.values()) == [api.session]
+            assert len(closed) == 20
+
+    # With a caller-provided session, the shared adapters survive each thread's exit
+    backend = UsersBackend()
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session(), thread_safe=True) as api:
+        user_id = api.create_user({"name": "shared"})["id"]
+        _run_in_threads(lambda: api.get_user(user_id), 5)
+        assert list(api._thread_sessions.values()) == [api.session]
+        assert api.get_user(user_id)["name"] == "shared"
@@ -0,0 +1,104 @@
+import io
+import json
+import logging
+import threading
+
+import pytest
+
+from mockapi_client.logger import RepeatFilter, configure_logging, get_logger, shutdown_logging
+
+logger = get_logger(__name__)
+
+
+@pytest.fixture
+def log_output():
+    """
+    Routes every get_logger logger into a buffer for the test, then restores the defaults.
+    """
+    buffer = io.StringIO()
+    yield buffer
+    configure_logging()
+
+
+def _lines(buffer: io.StringIO):
+    shutdown_logging()  # flushes the queue listener
+    return [json.loads(line) for line in buffer.getvalue().splitlines()]
+
+
+class _Probe:
+    """Records which thread rendered it."""
+
+    def __init__(self):
+        self.rendered_in = []
+
+    def __str__(self):
+        self.rendered_in.append(threading.current_thread().name)
+        return "probe"
+
+
+def test_json_records_carry_extra_fields_and_exceptions(log_output):
+    configure_logging(fmt="json", use_queue=True, stream=log_output)
+
+    logger.error("HTTP error", extra={"method": "GET", "status": 503})
+    try:
+        raise ZeroDivisionError("boom")
+    except ZeroDivisionError:
+        logger.exception("Call %s failed", "get_user")
+
+    first, second = _lines(log_output)
+    assert first["level"] == "ERROR" and first["logger"] == __name__
+    assert (first["message"], first["method"], first["status"]) == ("HTTP error", "GET", 503)
+    assert second["message"] == "Call get_user failed"
+    assert "ZeroDivisionError: boom" in second["exc_info"]
+
+
+def test_queue_mode_formats_in_the_listener_thread(log_output):
+    configure_logging(fmt="json", use_queue=True, stream=log_output)
+    # A fresh logger, so pytest's own capture handlers are not attached to it
+    lazy = get_logger(f"{__name__}.lazy")
+    probe = _Probe()
+
+    lazy.info("payload: %s", probe)
+
+    assert [line["message"] for line in _lines(log_output)] == ["payload: probe"]
+    assert probe.rendered_in and threading.current_thread().name not in probe.rendered_in
+
+
+def test_disabled_levels_do_no_formatting(log_output):
+    configure_logging(fmt="text", stream=log_output)
+    quiet = get_logger(f"{__name__}.quiet", level=logging.INFO)
+    probe = _Probe()
+
+    quiet.debug("payload: %s", probe)
+
+    assert probe.rendered_in == []
+    assert log_output.getvalue() == ""
+
+
+def test_repeat_filter_throttles_identical_warnings():
+    now = [0.0]
+    repeat = RepeatFilter(limit=2, interval=10.0, clock=lambda: now[0])
+
+    def record(msg, level=logging.WARNING, *args):
+        return logging.LogRecord("retry", level, "", 0, msg, args, None)
+
+    template = "[Attempt %d/%d] Caught %s. Retrying in %.2fs..."
+    passed = [repeat.filter(record(template, logging.WARNING, i, 4, "Timeout", 0.5)) for i in range(6)]
+    assert passed == [True, True, False, False, False, False]
+    assert repeat.filter(record("Other warning"))
+    assert repeat.filter(record(template, logging.ERROR, 1, 4, "Timeout", 0.5)), "errors are never dropped"
+
+    now[0] = 10.0
+    resumed = record(template, logging.WARNING, 1, 4, "Timeout", 0.5)
+    assert repeat.filter(resumed)
+    assert resumed.getMessage().endswith("[4 similar messages suppressed]")
+
+
+def test_configured_repeat_limit_applies_to_all_loggers(log_output):
+    configure_logging(fmt="json", use_queue=True, repeat_limit=3, stream=log_output)
+    retry_logger = get_logger("mockapi_client.retry")
+
+    for attempt in range(50):
+        retry_logger.warning("[Attempt %d/%d] Caught %s: %s. Retrying in %.2fs...", attempt, 4, "X", "y", 0.1)
+
+    assert len(_lines(log_output)) == 3
@@ -0,0 +1,150 @@
+import json
+
+import httpx
+import pytest
+import requests
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.client import UsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, Fixed, LocalUsersServer, UsersBackend
+from mockapi_client.metrics import ClientMetrics, Histogram, endpoint_label
+from mockapi_client.retry import RetryPolicy
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram(buckets=(0.1, 0.2, 0.5))
+    for value in [0.05] * 90 + [0.15] * 9 + [3.0]:
+        histogram.observe(value)
+
+    assert histogram.counts == [90, 9, 0, 1]
+    assert histogram.quantile(0.5) <= 0.1
+    assert 0.1 < histogram.quantile(0.95) <= 0.2
+    assert histogram.quantile(1.0) == 3.0
+    assert Histogram().quantile(0.99) == 0.0
+
+
+def test_endpoint_labels_keep_cardinality_low():
+    base = "https://example.mockapi.io/api/v1/users"
+    assert endpoint_label(base, base) == "/users"
+    assert endpoint_label(base, f"{base}?page=2&limit=10") == "/users"
+    assert endpoint_label(base, f"{base}/123") == "/users/{id}"
+
+
+@pytest.mark.contract
+def test_sync_client_records_statuses_retries_and_bytes(no_wait):
+    """
+    Every attempt is a request sample; the operation records the retry amplification.
+    """
+    backend = UsersBackend(error_rate=0.5, error_statuses=(503,), seed=7)
+    metrics = ClientMetrics()
+    with UsersApiClient(
+            base_url=LOCAL_BASE_URL, session=backend.requests_session(), retry_policy=no_wait,
+            circuit_breaker=False, metrics=metrics,
+    ) as api:
+        created = 0
+        for _ in range(20):
+            try:
+                api.create_user({"name": "metered", "email": "metered@example.com"})
+                created += 1
+            except requests.exceptions.HTTPError:
+                pass
+        backend.error_rate = 0.0
+        assert api.get_user("999999") is None
+
+    snapshot = metrics.snapshot()
+    posts = snapshot["requests"]["POST /users"]
+    assert posts["status"]["201"] == created
+    assert posts["latency"]["count"] == posts["status"]["201"] + posts["status"]["503"]
+    assert posts["bytes_sent"] > 0 and posts["bytes_received"] > 0
+    assert snapshot["requests"]["GET /users/{id}"]["status"] == {"404": 1}
+
+    operation = snapshot["operations"]["create_user"]
+    assert operation["calls"] == 20
+    assert operation["attempts"] == posts["latency"]["count"] == backend.stats()["requests"] - 1
+    assert operation["retries"] == {"503": operation["attempts"] - 20}
+    assert operation["failures"] == 20 - created
+    assert operation["amplification"] > 1
+    json.dumps(snapshot)
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_async_client_records_timeouts():
+    backend = UsersBackend(timeout_rate=1.0, timeout_delay=0.05)
+    metrics = ClientMetrics()
+    policy = RetryPolicy(max_attempts=2, base_delay=0, max_delay=0, budget=None)
+    async with AsyncUsersApiClient(
+            LOCAL_BASE_URL, {}, timeout=0.02, transport=backend.async_transport(), retry_policy=policy,
+            circuit_breaker=False, metrics=metrics,
+    ) as api:
+        with pytest.raises(httpx.TimeoutException):
+            await api.get_user("1")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["requests"]["GET /users/{id}"]["errors"] == {"timeout": 2}
+    assert snapshot["operations"]["get_user"]["retries"] == {"timeout": 1}
+
+
+@pytest.mark.asyncio
+async def test_async_pool_waits_over_real_connections():
+    """
+    With one pooled connection, concurrent requests queue for it and the wait shows up.
+    """
+    metrics = ClientMetrics()
+    with LocalUsersServer(UsersBackend(latency=Fixed(0.02))) as server:
+        async with AsyncUsersApiClient(
+                server.base_url, {}, max_connections=1, circuit_breaker=False,
+                metrics=metrics,
+        ) as api:
+            await api.get_users([str(i) for i in range(5)], concurrency=5)
+
+    pool_wait = metrics.snapshot()["pool_wait"]
+    assert pool_wait["count"] == 5
+    assert pool_wait["max_ms"] >= 20
+
+
+@pytest.mark.asyncio
+async def test_async_pool_stats_from_trace_events():
+    """
+    pool_stats counts queued/active requests and new connections from httpx trace
+    events, and leaves limits it does not own (custom transport) as None.
+    """
+    with LocalUsersServer(UsersBackend(latency=Fixed(0.02))) as server:
+        async with AsyncUsersApiClient(
+                server.base_url, {}, max_connections=2, circuit_breaker=False, metrics=None,
+        ) as api:
+            await api.get_users([str(i) for i in range(6)], concurrency=6)
+            stats = api.pool_stats()
+
+    assert stats["max_connections"] == 2
+    assert stats["connections_opened"] == 2
+    assert stats["peak_active"] == 2
+    assert stats["peak_queued"] >= 4
+    assert stats["queued"] == stats["active"] == stats["in_flight"] == 0
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(404))
+    async with AsyncUsersApiClient(LOCAL_BASE_URL, {}, transport=transport, metrics=None) as api:
+        await api.get_user("1")
+        stats = api.pool_stats()
+    assert stats["max_connections"] is None and stats["http2"] is None
+    assert stats["queued"] == stats["connections_opened"] == 0
+
+
+def test_prometheus_text_format():
+    metrics = ClientMetrics(buckets=(0.1, 1.0))
+    metrics.observe_response("GET", '/users/{id}', 200, 0.05, received=120)
+    metrics.observe_response("GET", '/users/{id}', 200, 0.5)
+    metrics.observe_operation("get_user", attempts=2)
+    metrics.observe_retry("get_user", httpx.ReadTimeout("slow"), 0.25)
+
+    text = metrics.prometheus_text()
+
+    assert "# TYPE mockapi_client_request_duration_seconds histogram" in text
+    assert 'mockapi_client_request_duration_seconds_bucket{method="GET",endpoint="/users/{id}",le="0.1"} 1' in text
+    assert 'mockapi_client_request_duration_seconds_bucket{method="GET",endpoint="/users/{id}",le="+Inf"} 2' in text
+    assert 'mockapi_client_request_duration_seconds_count{method="GET",endpoint="/users/{id}"} 2' in text
+    assert 'mockapi_client_responses_total{method="GET",endpoint="/users/{id}",status="200"} 2' in text
+    assert 'mockapi_client_bytes_received_total{method="GET",endpoint="/users/{id}"} 120' in text
+    assert 'mockapi_client_retries_total{operation="get_user",reason="timeout"} 1' in text
+    assert 'mockapi_client_operation_attempts_total{operation="get_user"} 2' in text
+    assert text.endswith("\n")
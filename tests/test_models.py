@@ -0,0 +1,107 @@
+import json
+import pickle
+import random
+import sys
+import tracemalloc
+
+import pytest
+
+from core.models import User, decode_users, iter_users, validate_users
+from core.normalizers import normalize_users, normalize_users_batch
+from core.validators import ValidationError, default_validator, validate_user
+from core.validators import validate_users as validate_user_dicts
+from mockapi_client.client import UsersApiClient
+from mockapi_client.codec import get_codec
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+from .test_normalizers import EDGE_CASES, _random_user
+
+
+def test_from_raw_matches_normalize_user():
+    rng = random.Random(4321)
+    raw_users = EDGE_CASES + [_random_user(rng, i) for i in range(20_000)]
+
+    expected = normalize_users(raw_users)
+    assert [user.to_dict() for user in iter_users(raw_users)] == expected
+
+    # Same result when decoding the response body directly (ids that JSON cannot keep as-is aside)
+    serializable = [raw for raw in raw_users if not isinstance(raw, dict) or not isinstance(raw.get("id"), float)]
+    body = json.dumps(serializable).encode()
+    for codec in (get_codec("json"), get_codec("auto")):
+        assert [user.to_dict() for user in decode_users(body, codec)] == normalize_users_batch(serializable)
+    assert decode_users(b"") == decode_users(b'{"id": "1"}') == []
+
+
+def test_validate_matches_validate_user():
+    rng = random.Random(8)
+    raw_users = EDGE_CASES + [_random_user(rng, i) for i in range(5_000)]
+    for user in iter_users(raw_users):
+        try:
+            validate_user(user.to_dict())
+            expected = None
+        except ValidationError as e:
+            expected = str(e)
+        try:
+            assert user.validate() is user
+            actual = None
+        except ValidationError as e:
+            actual = str(e)
+        assert actual == expected, user
+
+    users = list(iter_users(raw_users))
+    with pytest.raises(ValidationError) as dict_error:
+        validate_user_dicts([user.to_dict() for user in users])
+    with pytest.raises(ValidationError) as model_error:
+        validate_users(users)
+    assert str(model_error.value) == str(dict_error.value)
+    valid = [user for user in users if default_validator().first_error(user) is None]
+    assert valid
+    validate_users(valid)
+
+
+def test_users_are_immutable_hashable_and_picklable():
+    user = User.from_raw({"id": 5, "name": "name 5", "first_name": "Ann", "last_name": "Lee", "email": "A@B.CO"})
+    assert user == User("5", "a@b.co", "Ann Lee")
+    assert len({user, User("5", "a@b.co", "Ann Lee")}) == 1
+    assert pickle.loads(pickle.dumps(user)) == user
+    assert repr(user) == "User(id='5', email='a@b.co', name='Ann Lee')"
+
+    with pytest.raises(AttributeError):
+        user.name = "other"
+    with pytest.raises(AttributeError):
+        del user.email
+    with pytest.raises(AttributeError):
+        user.extra = 1
+    assert not hasattr(user, "__dict__")
+
+
+def test_users_take_a_fraction_of_dict_memory():
+    raw_users = [{"id": str(i), "name": f"user_{i}", "email": f"User{i}@Example.com"} for i in range(10_000)]
+
+    def allocated(build):
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            kept = build()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        stats = after.compare_to(before, "filename")
+        return kept, sum(stat.size_diff for stat in stats)
+
+    # Normalized dicts vs Users sharing the same (lowercased) strings
+    _, dict_bytes = allocated(lambda: normalize_users_batch(raw_users))
+    _, user_bytes = allocated(lambda: list(iter_users(raw_users)))
+    assert user_bytes < dict_bytes * 0.7
+    assert sys.getsizeof(User("1", "a@b.co", "x")) < sys.getsizeof({"id": "1", "email": "a@b.co", "name": "x"})
+
+
+@pytest.mark.contract
+def test_streamed_users_decode_into_models():
+    backend = UsersBackend()
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session(), metrics=None) as api:
+        for i in range(25):
+            api.create_user({"name": f"model_{i}", "email": f"Model{i}@Example.com"})
+        users = [user.validate() for user in iter_users(api.stream_users())]
+
+    assert [user.name for user in users] == [f"model_{i}" for i in range(25)]
+    assert all(user.email == user.email.lower() for user in users)
@@ -0,0 +1,79 @@
+import random
+
+from core.normalizers import normalize_users, normalize_users_batch, normalize_users_parallel
+from mockapi_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+EDGE_CASES = [
+    {"id": 1, "email": "Test@Email.com", "first_name": "John", "last_name": "Doe"},
+    {"id": "14", "name": "name 14", "first_name": "first_name 14", "last_name": "last_name 14"},
+    {"id": "14", "name": "name 140", "email": 5},
+    {"id": 7, "name": "name 7", "first_name": "Ann", "last_name": "last_name 7"},
+    {"id": None, "name": "name None", "first_name": "first_name None", "last_name": "Lee"},
+    {"id": True, "name": "name True"},
+    {"id": 2.5, "name": "name 2.5", "first_name": 3, "last_name": 4},
+    {"id": "x", "name": "", "first_name": "", "last_name": "Solo"},
+    {"id": "y", "name": 0, "first_name": None},
+    {"id": "z", "name": "name  z"},
+    {"name": "name None"},
+    {},
+    "not a dict",
+    None,
+]
+
+# Hand-checked outputs for EDGE_CASES (the two non-dict entries are skipped)
+EDGE_CASES_EXPECTED = [
+    {"id": "1", "email": "test@email.com", "name": "John Doe"},
+    {"id": "14", "email": None, "name": None},
+    {"id": "14", "email": None, "name": "name 140"},
+    {"id": "7", "email": None, "name": "Ann"},
+    {"id": None, "email": None, "name": "Lee"},
+    {"id": "True", "email": None, "name": None},
+    {"id": "2.5", "email": None, "name": "3 4"},
+    {"id": "x", "email": None, "name": "Solo"},
+    {"id": "y", "email": None, "name": None},
+    {"id": "z", "email": None, "name": "name  z"},
+    {"id": None, "email": None, "name": None},
+    {"id": None, "email": None, "name": None},
+]
+
+
+def _random_user(rng: random.Random, index: int) -> dict:
+    user_id = rng.choice([index, str(index), None, f"{index}x"])
+    user = {"id": user_id}
+    for field in ("name", "first_name", "last_name"):
+        roll = rng.random()
+        if roll < 0.3:
+            user[field] = f"{field} {user_id}"          # autofill junk
+        elif roll < 0.5:
+            user[field] = f"{field} {index + 1}"        # junk-looking, wrong id
+        elif roll < 0.8:
+            user[field] = rng.choice(["Ann", "Bob", "", None, 0])
+    if rng.random() < 0.8:
+        user["email"] = rng.choice([f"User{index}@Example.COM", None, 42])
+    return user
+
+
+def test_normalizers_handle_edge_cases():
+    assert normalize_users(EDGE_CASES) == EDGE_CASES_EXPECTED
+    assert normalize_users_batch(EDGE_CASES) == EDGE_CASES_EXPECTED
+
+
+def test_batch_normalizer_matches_reference():
+    rng = random.Random(1234)
+    raw_users = EDGE_CASES + [_random_user(rng, i) for i in range(20_000)]
+
+    expected = normalize_users(raw_users)
+    assert normalize_users_batch(raw_users) == expected
+    assert normalize_users_batch("not a list") == normalize_users("not a list") == []
+
+
+def test_parallel_normalizer_matches_reference():
+    rng = random.Random(99)
+    raw_users = [_random_user(rng, i) for i in range(5_000)] + EDGE_CASES
+
+    expected = normalize_users(raw_users)
+    assert normalize_users_parallel(raw_users, chunk_size=1_000, max_workers=2) == expected
+    # Small payloads never pay for a process pool
+    assert normalize_users_parallel(EDGE_CASES) == normalize_users(EDGE_CASES)
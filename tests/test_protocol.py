@@ -0,0 +1,94 @@
+import json
+
+import httpx
+import pytest
+import requests
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.cache import MISSING, TTLCache
+from mockapi_client.client import UsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+from mockapi_client.protocol import UsersProtocol
+
+protocol = UsersProtocol("https://example.mockapi.io/api/v1/users/")
+
+
+class _Raised(Exception):
+    pass
+
+
+def _raise():
+    raise _Raised()
+
+
+def test_calls_are_built_without_any_http_stack():
+    assert protocol.base_url == "https://example.mockapi.io/api/v1/users"
+
+    get = protocol.get_user("7")
+    assert (get.method, get.url, get.user_id, get.collection) == ("GET", f"{protocol.base_url}/7", "7", False)
+
+    page = protocol.list_users_page(2, 10, name="user_")
+    assert (page.method, page.url, page.params) == ("GET", protocol.base_url, {"page": 2, "limit": 10, "name": "user_"})
+    assert page.collection
+
+    patch = protocol.patch_user("7", {"name": "x"})
+    assert (patch.method, patch.json) == ("PATCH", {"name": "x"})
+    assert protocol.stream_users().params is None
+
+
+def test_one_contract_for_every_status():
+    get, page = protocol.get_user("7"), protocol.list_users_page(1, 10)
+
+    assert protocol.interpret(get, 200, b'{"id": "7"}', _raise) == {"id": "7"}
+    assert protocol.interpret(get, 200, b"", _raise) is None
+    assert protocol.interpret(get, 404, b"Not found", _raise) is None
+    assert protocol.interpret(page, 404, b"Not found", _raise) == []
+    assert protocol.interpret(page, 200, b"", _raise) == []
+    for status in (400, 409, 429, 500, 503):
+        with pytest.raises(_Raised):
+            protocol.interpret(get, status, b"boom", _raise)
+
+
+def test_cache_hooks():
+    cache = TTLCache()
+    get, patch, delete = protocol.get_user("7"), protocol.patch_user("7", {}), protocol.delete_user("7")
+
+    assert protocol.cache_lookup(get, cache) is MISSING
+    protocol.cache_store(get, cache, None)
+    assert protocol.cache_lookup(get, cache) is None  # negative entry
+    protocol.cache_store(patch, cache, {"id": "7"})
+    assert protocol.cache_lookup(get, cache) == {"id": "7"}
+    assert protocol.cache_lookup(delete, cache) is MISSING
+    assert protocol.cache_lookup(get, cache) is MISSING  # evicted by the delete
+    assert protocol.cache_lookup(get, None) is MISSING
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_sync_and_async_drivers_agree():
+    """
+    Same backend state, same calls: both clients return the same values and raise
+    their own stack's error for the same statuses.
+    """
+    backend = UsersBackend()
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session(), metrics=None) as sync_api:
+        async with AsyncUsersApiClient(
+                LOCAL_BASE_URL, {}, transport=backend.async_transport(), metrics=None,
+        ) as async_api:
+            created = sync_api.create_user({"name": "same", "email": "same@example.com"})
+            user_id = created["id"]
+
+            assert await async_api.get_user(user_id) == sync_api.get_user(user_id) == created
+            assert await async_api.list_users_page(1, 10) == sync_api.list_users_page(1, 10)
+            assert await async_api.list_users_page(99, 10) == sync_api.list_users_page(99, 10) == []
+
+            await async_api.delete_user(user_id)
+            assert await async_api.get_user(user_id) is None
+            assert sync_api.get_user(user_id) is None
+            assert await async_api.patch_user(user_id, {"name": "gone"}) is None
+            assert sync_api.patch_user(user_id, {"name": "gone"}) is None
+
+            with pytest.raises(requests.exceptions.HTTPError):
+                sync_api.create_user(json.dumps("not a user"))
+            with pytest.raises(httpx.HTTPStatusError):
+                await async_api.create_user(json.dumps("not a user"))
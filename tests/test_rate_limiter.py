@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+from mockapi_client.logger import get_logger
+from mockapi_client.rate_limiter import RateLimiter
+
+logger = get_logger(__name__)
+
+
+def test_burst_then_paced_reservations(fake_clock):
+    limiter = RateLimiter(rate=10, burst=3, clock=fake_clock)
+
+    waits = [limiter.reserve() for _ in range(5)]
+    assert waits == pytest.approx([0, 0, 0, 0.1, 0.2])
+
+    fake_clock.now = 10  # idle long enough to refill, but never beyond the burst
+    assert [limiter.reserve() for _ in range(4)] == pytest.approx([0, 0, 0, 0.1])
+
+    stats = limiter.stats()
+    assert stats["acquired"] == 9
+    assert stats["delayed"] == 3
+    assert stats["max_wait_ms"] == pytest.approx(200)
+
+
+def test_per_method_buckets(fake_clock):
+    limiter = RateLimiter(rate=100, burst=100, per_method={"POST": (1, 1)}, clock=fake_clock)
+
+    assert limiter.reserve("GET") == 0
+    assert limiter.reserve("POST") == 0
+    assert limiter.reserve("post") == pytest.approx(1.0)
+    assert limiter.reserve("GET") == 0
+    assert set(limiter.stats()["per_method"]) == {"GET", "POST"}
+
+
+@pytest.mark.concurrency
+def test_limiter_shared_across_threads():
+    limiter = RateLimiter(rate=200, burst=1)
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    # 40 requests, 1 free, the rest paced at 200/s
+    assert elapsed >= 39 / 200 * 0.95
+    assert limiter.stats()["acquired"] == 40
+
+
+@pytest.mark.asyncio
+@pytest.mark.concurrency
+async def test_async_client_is_paced():
+    backend = UsersBackend()
+    limiter = RateLimiter(rate=100, burst=5)
+    async with AsyncUsersApiClient(
+            LOCAL_BASE_URL, {}, transport=backend.async_transport(), rate_limiter=limiter
+    ) as api:
+        started = time.perf_counter()
+        payloads = [{"name": f"paced_{i}"} for i in range(25)]
+        results = await api.create_users(payloads, concurrency=25)
+        elapsed = time.perf_counter() - started
+
+    assert all(r.ok for r in results)
+    assert elapsed >= 20 / 100 * 0.95
+    stats = limiter.stats()
+    logger.info(f"Rate limiter stats: {stats}")
+    assert stats["per_method"]["POST"]["delayed"] == 20
@@ -0,0 +1,92 @@
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+import requests
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.client import UsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+from mockapi_client.logger import get_logger
+from mockapi_client.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+logger = get_logger(__name__)
+
+
+def _http_error(status: int, headers=None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "http://example.test/users/1")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"{status}", request=request, response=response)
+
+
+def test_retryable_classification():
+    policy = RetryPolicy(budget=None)
+    for status in (429, 500, 502, 503, 504):
+        assert policy.is_retryable(_http_error(status))
+    for status in (400, 401, 404, 409, 422, 501):
+        assert not policy.is_retryable(_http_error(status))
+
+    assert policy.is_retryable(httpx.ReadTimeout("timeout"))
+    assert policy.is_retryable(httpx.ConnectError("refused"))
+    assert policy.is_retryable(requests.exceptions.ConnectionError())
+    assert not policy.is_retryable(ValueError("bad json"))
+
+
+def test_retry_after_and_decorrelated_jitter():
+    assert parse_retry_after("3") == 3.0
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert parse_retry_after(format_datetime(now + timedelta(seconds=7), usegmt=True), now=now) == 7.0
+    assert parse_retry_after("garbage") is None
+
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0, budget=None, rng=random.Random(1))
+    assert policy.next_delay(0.0, _http_error(503, {"Retry-After": "2"})) == 2.0
+
+    delay = 0.0
+    for _ in range(50):
+        upper = max(0.5, delay * 3)
+        delay = policy.next_delay(delay)
+        assert 0.5 <= delay <= min(4.0, upper)
+
+
+def test_retry_budget_caps_retries():
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, capacity=2, clock=lambda: 0.0)
+    policy = RetryPolicy(max_attempts=5, base_delay=0, max_delay=0, budget=budget)
+    calls = 0
+
+    def always_503():
+        nonlocal calls
+        calls += 1
+        raise _http_error(503)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        policy.call(always_503)
+    # first attempt + the two retries the budget allows
+    assert calls == 3
+    assert budget.stats()["rejected"] == 1
+
+
+@pytest.mark.contract
+def test_sync_client_retries_throttled_requests():
+    backend = UsersBackend(error_rate=1.0, error_statuses=(429,), retry_after=0)
+    policy = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0, budget=None)
+    with UsersApiClient(base_url=backend.base_url, session=backend.requests_session(), retry_policy=policy) as api:
+        with pytest.raises(requests.exceptions.HTTPError):
+            api.create_user({"name": "throttled"})
+    assert backend.stats()["requests"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_async_client_does_not_retry_4xx():
+    backend = UsersBackend()
+    policy = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0, budget=None)
+    async with AsyncUsersApiClient(
+            LOCAL_BASE_URL, {}, transport=backend.async_transport(), retry_policy=policy
+    ) as api:
+        assert await api.get_user("404404") is None
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            await api.create_user("not a user")
+    assert excinfo.value.response.status_code == 400
+    assert backend.stats()["requests"] == 2
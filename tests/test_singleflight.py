@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, Fixed, UsersBackend
+from mockapi_client.logger import get_logger
+from mockapi_client.singleflight import SingleFlight
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.asyncio
+async def test_singleflight_shares_result_and_releases_key():
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(flight.do("key", fetch) for _ in range(10)))
+    assert results == [1] * 10
+    assert flight.in_flight() == 0
+
+    # The key is released once the call finishes: no caching between flights
+    assert await flight.do("key", fetch) == 2
+    assert flight.stats() == {"executions": 2, "coalesced": 9, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_singleflight_cancelled_waiter_does_not_cancel_others():
+    flight = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", slow))
+    second = asyncio.ensure_future(flight.do("key", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
+
+
+@pytest.mark.asyncio
+@pytest.mark.concurrency
+async def test_concurrent_identical_gets_issue_one_request():
+    """
+    N concurrent get_user calls for the same ID hit the server once; each caller
+    gets an independent copy of the user.
+    """
+    backend = UsersBackend(latency=Fixed(0.05))
+    async with AsyncUsersApiClient(LOCAL_BASE_URL, {}, transport=backend.async_transport()) as api:
+        user = await api.create_user({"name": "hot", "email": "hot@example.com"})
+        results = await asyncio.gather(*(api.get_user(user["id"]) for _ in range(20)))
+
+        assert all(r == results[0] for r in results)
+        results[0]["name"] = "mutated"
+        assert results[1]["name"] == "hot"
+        logger.info(f"Single-flight stats: {api.singleflight.stats()}")
+
+    # create + one shared GET
+    assert backend.stats()["requests"] == 2
+
+    backend = UsersBackend(latency=Fixed(0.05))
+    async with AsyncUsersApiClient(
+            LOCAL_BASE_URL, {}, transport=backend.async_transport(), coalesce_reads=False
+    ) as api:
+        user = await api.create_user({"name": "hot", "email": "hot@example.com"})
+        await asyncio.gather(*(api.get_user(user["id"]) for _ in range(20)))
+
+    assert backend.stats()["requests"] == 21
@@ -0,0 +1,146 @@
+import json
+import logging
+import tracemalloc
+
+import pytest
+
+from core.normalizers import iter_normalize_users, normalize_users
+from core.validators import ValidationError, iter_validate_users
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.client import UsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, LocalUsersServer, UsersBackend
+from mockapi_client.streaming import JsonArrayStream, aiter_json_array, iter_json_array
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _seed(backend: UsersBackend, count: int) -> None:
+    for index in range(count):
+        body = {"email": f"User{index}@Example.com", "first_name": "Ann", "last_name": "Lee"}
+        if index % 2:
+            body["name"] = f"user_{index:08x}"
+        backend.handle("POST", LOCAL_BASE_URL, json.dumps(body).encode())
+
+
+# -------------------------------------------------
+# Parser
+# -------------------------------------------------
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 100_000])
+def test_items_survive_any_chunk_boundary(chunk_size):
+    """
+    Items, multi-byte UTF-8 characters and numbers split across chunks decode exactly like json.loads.
+    """
+    payload = [{"id": "1", "name": "Zoë — ünïcode ☃"}, 12.5, "a,]b", [1, [2]], None, True, -3e2, {}]
+    data = json.dumps(payload, ensure_ascii=False).encode()
+
+    assert list(iter_json_array(_chunks(data, chunk_size))) == payload
+
+
+def test_items_are_yielded_as_soon_as_complete():
+    parser = JsonArrayStream()
+
+    assert parser.feed(b' [ {"id": "1"}, {"id"') == [{"id": "1"}]
+    assert parser.feed(b': "2"} ') == [{"id": "2"}]
+    assert parser.feed(b', 4') == []  # could still become 42
+    assert parser.feed(b'2]\n') == [42]
+    parser.close()
+    assert parser.items == 3
+
+
+@pytest.mark.parametrize("data, message", [
+    (b'[{"id": "1"}, {"id"', "Truncated"),
+    (b'{"id": "1"}', "Expected a JSON array"),
+    (b'[1 2]', "Expected ','"),
+    (b'[1]x', "Unexpected data"),
+])
+def test_malformed_streams_raise(data, message):
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array(_chunks(data, 3)))
+
+
+def test_malformed_item_mid_chunk_raises_immediately():
+    """
+    A broken element with more data after it is an error now, not a wait for the rest of the stream.
+    """
+    parser = JsonArrayStream()
+
+    assert parser.feed(b'[{"id": "1"}, {"id": tru') == [{"id": "1"}]  # "tru" may still become "true"
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed(b'x}, {"id": "3"}, ')
+
+
+@pytest.mark.asyncio
+async def test_async_parser():
+    async def chunks():
+        for chunk in _chunks(b'[{"id": "1"}, {"id": "2"}]', 4):
+            yield chunk
+
+    assert [user async for user in aiter_json_array(chunks())] == [{"id": "1"}, {"id": "2"}]
+
+
+# -------------------------------------------------
+# Clients
+# -------------------------------------------------
+
+@pytest.mark.contract
+def test_sync_stream_users_pipeline():
+    """
+    stream_users -> iter_normalize_users -> iter_validate_users matches the list-based pipeline.
+    """
+    backend = UsersBackend()
+    _seed(backend, 50)
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session()) as api:
+        streamed = list(iter_validate_users(iter_normalize_users(api.stream_users(chunk_size=97))))
+
+        assert streamed == normalize_users(api.list_users())
+        assert len(streamed) == 50
+        assert [u["id"] for u in api.stream_users(page=2, limit=20)] == [str(i) for i in range(21, 41)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_async_stream_users_pipeline():
+    backend = UsersBackend()
+    _seed(backend, 50)
+    async with AsyncUsersApiClient(LOCAL_BASE_URL, {}, transport=backend.async_transport()) as api:
+        streamed = [user async for user in api.stream_users(chunk_size=97)]
+
+        assert list(iter_validate_users(iter_normalize_users(streamed))) == normalize_users(await api.list_users_page(1, 100))
+        assert [u["id"] async for u in api.stream_users(name="user_00000001")] == ["2"]
+
+
+def test_iter_validate_users_stops_at_first_invalid_user():
+    users = iter_validate_users([{"id": "1", "email": "a@b.io"}, {"id": "2", "email": "broken"}])
+
+    assert next(users)["id"] == "1"
+    with pytest.raises(ValidationError, match="Invalid email format"):
+        next(users)
+
+
+def test_stream_users_memory_stays_flat(caplog):
+    """
+    Over real sockets (server in a child process), streaming 20k users through the
+    pipeline peaks at a small fraction of the memory list_users needs.
+    """
+    # Per-user debug logging would dominate the measurement
+    for name in ("core.normalizers", "core.validators"):
+        caplog.set_level(logging.INFO, logger=name)
+    backend = UsersBackend()
+    _seed(backend, 20_000)
+    with LocalUsersServer(backend, process=True) as server:
+        with UsersApiClient(base_url=server.base_url) as api:
+            tracemalloc.start()
+            try:
+                count = sum(1 for _ in iter_validate_users(iter_normalize_users(api.stream_users())))
+                _, streamed_peak = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                listed = len(normalize_users(api.list_users()))
+                _, listed_peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+    assert count == listed == 20_000
+    assert streamed_peak < listed_peak / 5, (streamed_peak, listed_peak)
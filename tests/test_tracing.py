@@ -0,0 +1,128 @@
+import json
+
+import pytest
+import requests
+
+from mockapi_client import tracing
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.client import UsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+from mockapi_client.tracing import InMemoryExporter, configure_tracing, shutdown_tracing, span
+
+
+@pytest.fixture
+def exporter():
+    memory = InMemoryExporter()
+    configure_tracing(exporter=memory)
+    yield memory
+    shutdown_tracing()
+
+
+def _children(spans, parent):
+    return [s for s in spans if s.parent_id == parent.span_id]
+
+
+def test_disabled_tracing_is_a_shared_noop():
+    assert not tracing.tracing_enabled()
+    with span("anything", key="value") as current:
+        current.set(status=200)
+    assert current is tracing.NOOP_SPAN
+    assert tracing.current_span() is None
+
+
+@pytest.mark.contract
+def test_client_call_nests_attempts_backoffs_and_requests(exporter, no_wait):
+    """
+    client.create_user -> attempt (one per try) -> http, with a backoff span between tries.
+    """
+    backend = UsersBackend(error_rate=0.6, error_statuses=(503,), seed=3)
+    with UsersApiClient(
+            base_url=LOCAL_BASE_URL, session=backend.requests_session(), retry_policy=no_wait,
+            circuit_breaker=False, metrics=None,
+    ) as api:
+        with span("scenario") as root:
+            for _ in range(5):
+                try:
+                    api.create_user({"name": "traced", "email": "traced@example.com"})
+                except requests.exceptions.HTTPError:
+                    pass
+
+    spans = exporter.spans
+    assert {s.trace_id for s in spans} == {root.trace_id}
+    calls = _children(spans, root)
+    assert [s.name for s in calls] == ["client.create_user"] * 5
+
+    attempts = [a for call in calls for a in _children(spans, call) if a.name == "attempt"]
+    requests_sent = [h for a in attempts for h in _children(spans, a)]
+    assert len(attempts) == len(requests_sent) == backend.stats()["requests"] > 5
+    assert all(h.name == "http" and h.attributes["method"] == "POST" for h in requests_sent)
+    assert sorted(h.attributes["status"] for h in requests_sent) == sorted(
+        [201] * sum(a.error is None for a in attempts) + [503] * sum(a.error is not None for a in attempts)
+    )
+    for call in calls:
+        tries = [a.attributes["attempt"] for a in _children(spans, call) if a.name == "attempt"]
+        backoffs = [b for b in _children(spans, call) if b.name == "backoff"]
+        assert tries == list(range(1, len(tries) + 1))
+        assert len(backoffs) == len(tries) - 1
+        assert all(child.start >= call.start and child.end <= call.end + 1e-6 for child in _children(spans, call))
+
+
+@pytest.mark.contract
+def test_thread_pool_requests_keep_their_parent(exporter):
+    backend = UsersBackend()
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session(), metrics=None) as api:
+        ids = [api.create_user({"name": f"t{i}", "email": f"t{i}@example.com"})["id"] for i in range(4)]
+        for user_id in ids:
+            api.delete_user(user_id)
+        exporter.spans.clear()
+        api.wait_until_all_deleted(ids, timeout=5)
+
+    polls = [s for s in exporter.spans if s.name == "wait.poll"]
+    fetches = [s for s in exporter.spans if s.name == "http"]
+    assert len(polls) == 1 and len(fetches) == 4
+    assert {s.parent_id for s in fetches} <= {s.span_id for s in exporter.spans}
+    assert all(s.trace_id == polls[0].trace_id for s in fetches)
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_async_tasks_get_their_own_track_under_the_caller(exporter):
+    backend = UsersBackend()
+    async with AsyncUsersApiClient(
+            LOCAL_BASE_URL, {}, transport=backend.async_transport(), metrics=None,
+    ) as api:
+        with span("fan-out") as root:
+            await api.get_users([str(i) for i in range(5)], concurrency=5)
+
+    calls = [s for s in exporter.spans if s.name == "client.get_user"]
+    assert len(calls) == 5
+    assert {s.trace_id for s in exporter.spans} == {root.trace_id}
+    assert len({s.task for s in calls}) == 5
+    # Each request hangs off its own call, not off a sibling task's span
+    for call in calls:
+        (attempt,) = _children(exporter.spans, call)
+        (request,) = _children(exporter.spans, attempt)
+        assert request.task == call.task and request.attributes["status"] == 404
+
+
+def test_jsonl_and_chrome_exporters(tmp_path):
+    for fmt, name in (("jsonl", "spans.jsonl"), ("chrome", "trace.json")):
+        configure_tracing(tmp_path / name, fmt)
+        try:
+            with span("outer", step=1):
+                with pytest.raises(KeyError):
+                    with span("inner"):
+                        raise KeyError("boom")
+        finally:
+            shutdown_tracing()
+
+    lines = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["inner", "outer"]
+    assert lines[0]["parent_id"] == lines[1]["span_id"]
+    assert lines[0]["error"] == "KeyError: 'boom'"
+    assert lines[1]["attributes"] == {"step": 1}
+
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert [(e["name"], e["ph"]) for e in events] == [("inner", "X"), ("outer", "X")]
+    assert events[1]["ts"] <= events[0]["ts"] and events[0]["dur"] <= events[1]["dur"]
+    assert events[0]["args"]["error"] == "KeyError: 'boom'"
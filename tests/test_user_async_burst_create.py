@@ -1,5 +1,4 @@
 import pytest
-import asyncio
 import random
 import string
 from mockapi_client.logger import get_logger
@@ -32,7 +31,7 @@ async def test_user_burst_unique_ids(async_api_client, register_async_user):
 
     Steps:
     1. Generate 20 random user payloads with unique emails.
-    2. Send all creation requests concurrently.
+    2. Send all creation requests through the bounded-concurrency bulk API.
     3. Register each successfully created user with `register_async_user`.
     4. Print all successfully created users and failures.
     5. Fail the test if no users were created.
@@ -41,20 +40,15 @@ async def test_user_burst_unique_ids(async_api_client, register_async_user):
     num_users = 20
     payloads = [generate_user_payload() for _ in range(num_users)]
 
-    async def create_and_register_user(payload):
-        try:
-            user = await async_api_client.create_user(payload)
-            # Register the created user in test context
-            await register_async_user(user["id"])
-            return user
-        except Exception as e:
-            return e
+    # Fire all requests with bounded concurrency; results come back in input order
+    results = await async_api_client.create_users(payloads)
 
-    # Fire all requests concurrently
-    results = await asyncio.gather(*(create_and_register_user(p) for p in payloads))
+    successes = [r.value for r in results if r.ok]
+    failures = [r.error for r in results if not r.ok]
 
-    successes = [r for r in results if not isinstance(r, Exception)]
-    failures = [r for r in results if isinstance(r, Exception)]
+    # Register each created user in test context
+    for user in successes:
+        await register_async_user(user["id"])
 
     logger.info(f"\nCreated users ({len(successes)}):")
     for u in successes:
@@ -74,7 +68,7 @@ async def test_user_burst_unique_ids(async_api_client, register_async_user):
         assert "email" in user
 
     # Check all users have unique IDs
-    ids = [u["id"] for u in results]
+    ids = [u["id"] for u in successes]
     duplicates = set([id for id in ids if ids.count(id) > 1])
     if duplicates:
         logger.error(f"Duplicate user IDs detected: {duplicates}")
@@ -83,4 +77,4 @@ async def test_user_burst_unique_ids(async_api_client, register_async_user):
         logger.info("✓ All user IDs are unique")
 
     # Sanity check that all have 'id' key
-    assert all("id" in u for u in results)
+    assert all("id" in u for u in successes)
@@ -27,7 +27,7 @@ async def test_sequential_user_dependencies(
 
     Validation:
     - Create user and immediately patch.
-    - Delete user and confirm fetching raises 404.
+    - Delete user and confirm fetching returns None (404 contract, same as the sync client).
     - Contract validation on successful responses.
 
     Design notes:
@@ -53,7 +53,7 @@ async def test_sequential_user_dependencies(
     await async_api_client.delete_user(user["id"])
     logger.info(f"Deleted user {user['id']}")
 
-    # Step 4: Fetch deleted user (expect error)
-    with pytest.raises(Exception) as e:
-        await async_api_client.get_user(user["id"])
-    logger.info(f"Expected error when fetching deleted user: {e.value}")
+    # Step 4: Fetch deleted user (expect the 404 contract: None, not an exception)
+    fetched = await async_api_client.get_user(user["id"])
+    assert fetched is None, f"Deleted user {user['id']} should not be found, got {fetched}"
+    logger.info("Deleted user is no longer found")
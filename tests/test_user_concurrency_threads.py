@@ -5,9 +5,10 @@ import pytest
 logger = get_logger(__name__)
 
 @pytest.mark.contract
-def test_concurrent_user_creation(api_client, user_factory, register_sync_user):
+def test_concurrent_user_creation(threaded_api_client, user_factory, register_sync_user):
     """
     Creates 10 users in parallel using threads and checks for unique IDs.
+    Uses the thread-safe client: every worker thread gets its own session.
     """
     logger.info("-" * 60)
     logger.info("Starting thread-based concurrent user creation test")
@@ -15,7 +16,7 @@ def test_concurrent_user_creation(api_client, user_factory, register_sync_user):
     def create_user_task(index):
         payload = user_factory.create_user_payload()
         logger.info(f"[Thread {index}] Payload: {payload}")
-        created = api_client.create_user(payload)
+        created = threaded_api_client.create_user(payload)
         register_sync_user(created["id"])
         return created
 
@@ -43,3 +44,30 @@ def test_concurrent_user_creation(api_client, user_factory, register_sync_user):
 
     # Optional: sanity check that all have 'id' key
     assert all("id" in u for u in results)
+
+
+@pytest.mark.contract
+@pytest.mark.concurrency
+def test_map_create_and_delete(threaded_api_client, user_factory, register_sync_user):
+    """
+    Executor-backed bulk API: map_create -> map_get -> map_delete on the managed thread pool.
+    Results come back in input order as structured BulkResult objects.
+    """
+    payloads = [user_factory.create_user_payload() for _ in range(10)]
+
+    created = threaded_api_client.map_create(payloads)
+    failures = [r.error for r in created if not r.ok]
+    assert not failures, f"Thread-pool creation failed: {failures}"
+
+    ids = [r.value["id"] for r in created]
+    for user_id in ids:
+        register_sync_user(user_id)
+    assert len(set(ids)) == len(ids), "Duplicate user IDs detected"
+    assert [r.value["name"] for r in created] == [p["name"] for p in payloads]
+
+    fetched = threaded_api_client.map_get(ids)
+    assert [r.value["id"] for r in fetched] == ids
+
+    deleted = threaded_api_client.map_delete(ids)
+    assert all(r.ok and r.value is True for r in deleted)
+    logger.info(f"map_create/map_get/map_delete completed for {len(ids)} users")
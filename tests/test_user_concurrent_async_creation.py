@@ -1,4 +1,3 @@
-import asyncio
 import pytest
 
 from mockapi_client.logger import get_logger
@@ -31,7 +30,7 @@ async def test_concurrent_user_creation(
       without race conditions, partial failures, or corrupted responses.
 
     What this test validates:
-    - Parallel execution of multiple `create_user` calls using asyncio
+    - Parallel execution of multiple `create_user` calls via `create_users`
     - Each request completes successfully
     - Each created user has a unique ID
     - All created users are registered for cleanup
@@ -50,9 +49,11 @@ async def test_concurrent_user_creation(
     payloads = [user_factory.create_user_payload() for _ in range(concurrent_users)]
     logger.info(f"Prepared {concurrent_users} user payloads")
 
-    # Create users concurrently
-    tasks = [async_api_client.create_user(payload) for payload in payloads]
-    results = await asyncio.gather(*tasks)
+    # Create users concurrently (bounded fan-out, input order preserved)
+    bulk_results = await async_api_client.create_users(payloads, concurrency=concurrent_users)
+    failures = [r.error for r in bulk_results if not r.ok]
+    assert not failures, f"Concurrent creation failed: {failures}"
+    results = [r.value for r in bulk_results]
 
     logger.info("All concurrent create requests completed")
 
@@ -0,0 +1,58 @@
+import pytest
+from uuid import uuid4
+
+from core.normalizers import iter_normalize_users, normalize_user
+from core.validators import validate_users
+from mockapi_client.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _tagged_payloads(user_factory, count: int):
+    """
+    Payloads sharing a unique name prefix, so a filtered listing returns only them.
+    """
+    tag = f"page_{uuid4().hex[:8]}"
+    payloads = [
+        user_factory.create_user_payload(name=f"{tag}_{index}")
+        for index in range(count)
+    ]
+    return tag, payloads
+
+
+@pytest.mark.contract
+def test_iter_users_paginates(api_client, user_factory, register_sync_user):
+    """
+    Creates 5 users and streams them back 2 per page:
+    - every created user is yielded exactly once
+    - results feed straight into the streaming normalizer
+    """
+    tag, payloads = _tagged_payloads(user_factory, 5)
+    for payload in payloads:
+        created = api_client.create_user(payload)
+        register_sync_user(created["id"])
+
+    normalized = list(iter_normalize_users(api_client.iter_users(page_size=2, name=tag)))
+    logger.info(f"Paginated users for tag {tag}: {normalized}")
+
+    validate_users(normalized)
+    assert sorted(u["name"] for u in normalized) == sorted(p["name"] for p in payloads)
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_async_iter_users_prefetches(async_api_client, user_factory, register_async_user):
+    """
+    Async variant: pages are prefetched while the current one is consumed.
+    """
+    tag, payloads = _tagged_payloads(user_factory, 5)
+    results = await async_api_client.create_users(payloads)
+    for result in results:
+        assert result.ok, f"Creation failed: {result.error}"
+        await register_async_user(result.value["id"])
+
+    normalized = [normalize_user(u) async for u in async_api_client.iter_users(page_size=2, name=tag)]
+    logger.info(f"Paginated async users for tag {tag}: {normalized}")
+
+    validate_users(normalized)
+    assert sorted(u["name"] for u in normalized) == sorted(p["name"] for p in payloads)
@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from core.validators import (
+    FieldSpec,
+    UserValidator,
+    ValidationError,
+    validate_user_email,
+    validate_user_id,
+    validate_user_name,
+    validate_users,
+    validate_users_report,
+)
+
+VALUES = [None, "", " ", "\t\n", "1", " 7 ", 0, 1, 2.5, True, [], {}]
+EMAILS = [
+    "a@b.c", "User@Example.COM", "no_at_sign.com", "a@b", "a.b@c", "a@b.c@d", "a@@b.c", "@.", "a@b.c\n",
+    "x@y.z ", "ünï@cödé.de", None, "", "  ", 42,
+]
+
+
+def _legacy_error(user) -> str:
+    """
+    The pre-compilation validate_users order: id, email, name (first failure wins).
+    """
+    try:
+        validate_user_id(user)
+        validate_user_email(user)
+        validate_user_name(user)
+    except ValidationError as e:
+        return str(e)
+    return ""
+
+
+def _random_user(rng: random.Random) -> dict:
+    user = {}
+    for name, choices in (("id", VALUES), ("email", EMAILS), ("name", VALUES + ["Ann"])):
+        if rng.random() < 0.9:
+            user[name] = rng.choice(choices)
+    return user
+
+
+def test_compiled_validator_matches_legacy_checks():
+    """
+    Same accept/reject decision and the identical message for every record.
+    """
+    rng = random.Random(17)
+    validator = UserValidator()
+    for _ in range(5_000):
+        user = _random_user(rng)
+        try:
+            validator.validate(user)
+            compiled = ""
+        except ValidationError as e:
+            compiled = str(e)
+        assert compiled == _legacy_error(user), user
+
+
+def test_validate_users_keeps_fail_fast_contract():
+    with pytest.raises(ValidationError, match="Users payload must be a list"):
+        validate_users("not_a_list")
+    with pytest.raises(ValidationError, match="Each user must be a dict"):
+        validate_users([{"id": "1", "email": "a@b.io"}, "oops"])
+    with pytest.raises(ValidationError, match=r"User \[2\]: Invalid email format 'nope'\."):
+        validate_users([{"id": "2", "email": "nope", "name": ""}])
+    validate_users([{"id": "1", "email": "a@b.io"}, {"id": "2", "email": "c@d.io", "name": "Bob"}])
+
+
+def test_report_collects_every_failing_record_and_field():
+    report = validate_users_report([
+        {"id": "1", "email": "a@b.io"},
+        {"id": " ", "email": "broken", "name": 5},
+        "not a dict",
+        {"id": "4"},
+    ])
+
+    assert not report.ok
+    assert report.checked == 4
+    assert report.invalid == 3
+    assert [(e.index, e.field) for e in report.errors] == [
+        (1, "id"), (1, "email"), (1, "name"), (2, None), (3, "email"),
+    ]
+    assert report.errors[4].message == "User [4]: Email is missing or not a string."
+    assert report.by_field() == {"id": 1, "email": 2, "name": 1, None: 1}
+    assert validate_users_report([]).ok
+
+
+def test_custom_schema():
+    validator = UserValidator({
+        "id": FieldSpec("id required"),
+        "phone": FieldSpec("bad phone", required=False, pattern=r"\A\+?[0-9 ]+\Z", invalid_message="{value} is no phone"),
+    })
+
+    validator.validate({"id": "1"})
+    validator.validate({"id": "1", "phone": "+49 30 1234"})
+    with pytest.raises(ValidationError, match="x1 is no phone"):
+        validator.validate({"id": "1", "phone": "x1"})
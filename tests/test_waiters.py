@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from mockapi_client.async_client import AsyncUsersApiClient
+from mockapi_client.client import UsersApiClient
+from mockapi_client.local_server import LOCAL_BASE_URL, UsersBackend
+from mockapi_client.logger import get_logger
+from mockapi_client.waiters import Waiter, deleted, fields_match, visible
+
+logger = get_logger(__name__)
+
+
+def test_waiter_rounds_outcomes_and_deadline():
+    """
+    Per-ID outcomes: satisfied after a few polls, errors recorded, deadline respected.
+    """
+    polls = {"a": 0, "b": 0, "c": 0}
+
+    def fetch(user_id):
+        polls[user_id] += 1
+        if user_id == "a":
+            return {"id": "a"} if polls["a"] >= 3 else None
+        if user_id == "b":
+            if polls["b"] == 1:
+                raise ConnectionError("flaky")
+            return {"id": "b"}
+        return None  # "c" never appears
+
+    waiter = Waiter(visible, timeout=0.3, initial_delay=0.01, max_delay=0.05)
+    started = time.monotonic()
+    outcomes = waiter.run(fetch, ["a", "b", "c"])
+    elapsed = time.monotonic() - started
+
+    assert list(outcomes) == ["a", "b", "c"]
+    assert outcomes["a"].satisfied and outcomes["a"].attempts == 3
+    assert outcomes["b"].satisfied and outcomes["b"].error is None
+    assert not outcomes["c"].satisfied and outcomes["c"].attempts > 3
+    assert 0.3 <= elapsed < 0.6
+
+
+def test_fields_match_condition():
+    condition = fields_match(name="renamed", email="x@example.com")
+    assert condition({"name": "renamed", "email": "x@example.com", "id": "1"})
+    assert not condition({"name": "renamed"})
+    assert not condition(None)
+
+
+@pytest.mark.concurrency
+def test_sync_batch_deletion_is_confirmed_in_parallel():
+    backend = UsersBackend(delete_delay=0.3)
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session()) as api:
+        ids = [r.value["id"] for r in api.map_create([{"name": f"w{i}"} for i in range(30)])]
+        api.map_delete(ids)
+
+        started = time.monotonic()
+        outcomes = api.wait_until_all_deleted(ids, timeout=5)
+        elapsed = time.monotonic() - started
+
+    assert all(outcome.satisfied for outcome in outcomes.values())
+    assert elapsed < 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.concurrency
+async def test_async_batch_deletion_and_give_up():
+    backend = UsersBackend(delete_delay=0.3)
+    async with AsyncUsersApiClient(LOCAL_BASE_URL, {}, transport=backend.async_transport()) as api:
+        ids = [r.value["id"] for r in await api.create_users([{"name": f"w{i}"} for i in range(100)])]
+        await api.delete_users(ids)
+
+        started = time.monotonic()
+        outcomes = await api.wait_until_all_deleted(ids, timeout=5, concurrency=50)
+        elapsed = time.monotonic() - started
+        logger.info(f"Confirmed {len(outcomes)} deletions in {elapsed:.2f}s")
+        assert all(outcome.satisfied for outcome in outcomes.values())
+        assert elapsed < 3
+
+        # A user that is never deleted: the waiter gives up and says so
+        survivor = await api.create_user({"name": "survivor"})
+        assert await api.wait_until_deleted(survivor["id"], timeout=0.2) is False
+        outcome = (await api.wait_for([survivor["id"]], deleted, timeout=0.1))[survivor["id"]]
+        assert outcome.last_seen["name"] == "survivor"
+
+
+def test_deprecated_retry_keywords_map_to_a_timeout():
+    backend = UsersBackend()
+    with UsersApiClient(base_url=LOCAL_BASE_URL, session=backend.requests_session()) as api:
+        survivor = api.create_user({"name": "survivor"})
+        started = time.monotonic()
+        with pytest.warns(DeprecationWarning, match="timeout="):
+            assert api.wait_until_deleted(survivor["id"], retries=3, delay=0.05) is False
+        assert time.monotonic() - started < 0.5
+
+        api.delete_user(survivor["id"])
+        with pytest.warns(DeprecationWarning):
+            assert api.wait_until_deleted(survivor["id"], retries=2)